@@ -6,3 +6,4 @@
 
 APPLICATION_NAME = "Submit Results"
 ERROR_LOG = "ErrorLog"
+TIMING_LOG = "TimingLog"
@@ -0,0 +1,14 @@
+# __init__.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Benchmark creation and reading of ECF submission files.
+
+Run as 'python -m chesssubmit.benchmark'.
+
+Synthetic leagues and tournaments are generated as game rows, in the form
+given by the results validation, and the time and peak memory used by each
+stage of creating and reading the submission file are written as JSON so
+runs can be compared over time.
+
+"""
@@ -0,0 +1,231 @@
+# __main__.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Run the submission file benchmark and write the results as JSON.
+
+Run as 'python -m chesssubmit.benchmark'.
+
+A league, a tournament, or both, is generated at each size requested and
+the convert, write, and open, stages are timed.  A table is printed and
+the results are written to a JSON file so runs can be compared over time.
+
+"""
+import sys
+import json
+import argparse
+import datetime
+import platform
+
+from . import synthetic
+from . import stages
+
+# Default sizes, in games, of the generated events.
+SIZES = (1000, 10000, 50000, 200000)
+
+LEAGUE = "league"
+TOURNAMENT = "tournament"
+KINDS = (LEAGUE, TOURNAMENT)
+
+
+def _sizes(text):
+    """Return tuple of positive integers from comma separated text."""
+    try:
+        sizes = tuple(int(size) for size in text.split(","))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def _make_parser():
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chesssubmit.benchmark",
+        description=" ".join(
+            (
+                "Time creating and reading ECF submission files for",
+                "synthetic leagues and tournaments.",
+            )
+        ),
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=_sizes,
+        default=SIZES,
+        help="comma separated event sizes in games (default %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        choices=KINDS + ("both",),
+        default="both",
+        help="kind of event generated (default %(default)s)",
+    )
+    parser.add_argument(
+        "--teams",
+        type=int,
+        default=10,
+        help="teams in each league division (default %(default)s)",
+    )
+    parser.add_argument(
+        "--boards",
+        type=int,
+        default=6,
+        help="boards in each league match (default %(default)s)",
+    )
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        default=2,
+        help="times league teams play each other (default %(default)s)",
+    )
+    parser.add_argument(
+        "--players",
+        type=int,
+        default=60,
+        help="players in each tournament section (default %(default)s)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=7,
+        help="rounds in each tournament section (default %(default)s)",
+    )
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.05,
+        help="fraction of names reported misspelt (default %(default)s)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="random number seed (default %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="timed runs of each stage, best is kept (default %(default)s)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="do not measure peak memory with tracemalloc",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="JSON results file (default chesssubmit-benchmark-<time>.json)",
+    )
+    return parser
+
+
+def _generate(kind, games, args):
+    """Return game rows for an event of kind with about games games."""
+    if kind == LEAGUE:
+        return synthetic.league_for_games(
+            games,
+            teams=args.teams,
+            boards=args.boards,
+            rounds=args.cycles,
+            noise=args.noise,
+            seed=args.seed,
+        )
+    return synthetic.tournament_for_games(
+        games,
+        players=args.players,
+        rounds=args.rounds,
+        noise=args.noise,
+        seed=args.seed,
+    )
+
+
+def _format_result(result):
+    """Return table line for result."""
+    peak = result["peak_memory_bytes"]
+    return "".join(
+        (
+            result["kind"].ljust(11),
+            format(result["games"], "9d"),
+            "  ",
+            result["stage"].ljust(8),
+            format(result["seconds"], "9.3f"),
+            format(result["games_per_second"] or 0, "12.0f"),
+            format(peak / 1048576, "10.1f") if peak is not None else "",
+        )
+    )
+
+
+def main(argv=None):
+    """Run benchmark described by argv and return exit status."""
+    args = _make_parser().parse_args(argv)
+    if args.repeat < 1:
+        sys.stderr.write("--repeat must be at least 1\n")
+        return 1
+    started = datetime.datetime.now()
+    kinds = KINDS if args.kind == "both" else (args.kind,)
+    results = []
+    sys.stdout.write(
+        "Kind           Games  Stage      Seconds   Games/sec  Peak MiB\n"
+    )
+    for kind in kinds:
+        for size in args.sizes:
+            rows = _generate(kind, size, args)
+            measurements, file_size = stages.measure_stages(
+                rows,
+                repeat=args.repeat,
+                measure_memory=not args.no_memory,
+            )
+            for result in measurements:
+                result.update(
+                    kind=kind,
+                    size=size,
+                    games=len(rows),
+                    file_bytes=file_size,
+                )
+                results.append(result)
+                sys.stdout.write(_format_result(result))
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+    report = {
+        "started": started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "parameters": {
+            "teams": args.teams,
+            "boards": args.boards,
+            "cycles": args.cycles,
+            "players": args.players,
+            "rounds": args.rounds,
+            "noise": args.noise,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        output = "".join(
+            (
+                "chesssubmit-benchmark-",
+                started.strftime("%Y%m%dT%H%M%S"),
+                ".json",
+            )
+        )
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+    sys.stdout.write("".join(("Results written to ", output, "\n")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# stages.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Time the stages of creating and reading a submission file.
+
+The stages are:
+
+convert: Submission.convert_rows_to_submission_style, the part of
+convert_document_to_submission_style done after the game rows are taken
+from the results data.
+
+write: Submission.write_entries_to_submission_file.
+
+open: Submission.open_documents on the file written by the write stage.
+
+Each stage is timed without tracemalloc running, and then, if memory is
+measured, run again with tracemalloc tracing only that stage's allocations
+to give the stage's peak memory.
+
+"""
+import gc
+import os
+import time
+import shutil
+import tempfile
+import tracemalloc
+
+from ..core import constants
+from ..core.submission import Submission
+from ..core.canonical import clear_caches
+
+STAGES = ("convert", "write", "open")
+
+
+def _run_stages(rows, folder, measure_memory):
+    """Return ({stage: (seconds, peak bytes)}, file size) for rows in folder.
+
+    The peak bytes are None if measure_memory is False.
+
+    """
+    clear_caches()
+    submission = Submission(folder)
+    reader = Submission(folder)
+    actions = {
+        "convert": lambda: submission.convert_rows_to_submission_style(rows),
+        "write": submission.write_entries_to_submission_file,
+        "open": lambda: reader.open_documents(None),
+    }
+    measurements = {}
+    for stage in STAGES:
+        gc.collect()
+        if measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            actions[stage]()
+            seconds = time.perf_counter() - start
+            if measure_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                peak = None
+        finally:
+            if measure_memory:
+                tracemalloc.stop()
+        measurements[stage] = (seconds, peak)
+    size = os.path.getsize(os.path.join(folder, constants.SUBMISSION))
+    submission.close()
+    reader.close()
+    return measurements, size
+
+
+def measure_stages(rows, repeat=1, measure_memory=True):
+    """Return (list of result dicts, one per stage, file size) for rows.
+
+    Each dict has the stage name, the best time in seconds of repeat runs,
+    games per second for that time, and peak memory in bytes, or None if
+    memory is not measured.
+
+    The file size is the size in bytes of the submission file for rows.
+
+    Each run is done in a new temporary folder.
+
+    """
+    best = {stage: None for stage in STAGES}
+    peaks = {stage: None for stage in STAGES}
+    for count in range(repeat + (1 if measure_memory else 0)):
+        traced = measure_memory and count == repeat
+        folder = tempfile.mkdtemp(prefix="chesssubmit-benchmark-")
+        try:
+            measurements, size = _run_stages(rows, folder, traced)
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+        for stage, (seconds, peak) in measurements.items():
+            if traced:
+                peaks[stage] = peak
+            elif best[stage] is None or seconds < best[stage]:
+                best[stage] = seconds
+    games = len(rows)
+    results = [
+        {
+            "stage": stage,
+            "seconds": best[stage],
+            "games_per_second": (
+                games / best[stage] if best[stage] else None
+            ),
+            "peak_memory_bytes": peaks[stage],
+        }
+        for stage in STAGES
+    ]
+    return results, size
@@ -0,0 +1,362 @@
+# synthetic.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Generate game rows for synthetic leagues and tournaments.
+
+The rows are tuples in constants.TABULAR_REPORT_ROW_ORDER order, the form
+given to Submission.convert_rows_to_submission_style, so no source
+documents need be validated to get a large event.
+
+Player names are reported with some spelling noise: a fraction of games
+give a player's name with an initial for the forename, a transposed pair
+of letters, a different letter case, extra spaces, or the player's ECF
+code appended, as in real match cards.
+
+The generators take a seed so the same arguments always give the same
+rows.
+
+"""
+import math
+import random
+import datetime
+
+from chessvalidate.core.gameresults import resultmapecf
+
+from ..core import constants
+
+FORENAMES = (
+    "Alan",
+    "Brenda",
+    "Colin",
+    "Deborah",
+    "Edward",
+    "Fiona",
+    "Graham",
+    "Helen",
+    "Ian",
+    "Janet",
+    "Keith",
+    "Linda",
+    "Martin",
+    "Nicola",
+    "Oliver",
+    "Patricia",
+    "Richard",
+    "Susan",
+    "Trevor",
+    "Wendy",
+)
+
+SURNAMES = (
+    "Adams",
+    "Baker",
+    "Clarke",
+    "Davies",
+    "Evans",
+    "Fletcher",
+    "Green",
+    "Harris",
+    "Jackson",
+    "King",
+    "Lewis",
+    "Morgan",
+    "Nolan",
+    "Owen",
+    "Parker",
+    "Quinn",
+    "Roberts",
+    "Smith",
+    "Taylor",
+    "Walker",
+)
+
+TOWNS = (
+    "Ashford",
+    "Bedford",
+    "Chester",
+    "Dover",
+    "Ely",
+    "Frome",
+    "Hythe",
+    "Ipswich",
+    "Kendal",
+    "Lincoln",
+)
+
+# Section names used by tournaments, numbered if there are more sections.
+TOURNAMENT_SECTIONS = ("Open", "Major", "Intermediate", "Minor", "Novice")
+
+# Results which can be converted to ECF scores.
+RESULTS = tuple(result for result in resultmapecf if result)
+
+# Colours of the home player, or first named player, in a game.
+COLOURS = ("W", "B")
+
+# Reserves in each team squad in addition to one player per board.
+RESERVES = 3
+
+_ROW_INDEX = {
+    name: index
+    for index, name in enumerate(constants.TABULAR_REPORT_ROW_ORDER)
+}
+
+
+def player_name(number):
+    """Return a distinct 'forename surname' name for player number.
+
+    Surnames are double-barrelled, and so on, once the single surnames
+    have all been used with every forename.
+
+    """
+    forename = FORENAMES[number % len(FORENAMES)]
+    number //= len(FORENAMES)
+    surnames = []
+    while True:
+        surnames.append(SURNAMES[number % len(SURNAMES)])
+        number //= len(SURNAMES)
+        if not number:
+            break
+        number -= 1
+    return " ".join((forename, "-".join(surnames)))
+
+
+def ecf_code(number):
+    """Return an ECF code, six digits and a letter, for player number."""
+    return "".join(
+        (format(100000 + number % 900000, "06d"), "ABCDEFGHJKL"[number % 11])
+    )
+
+
+def noisy_name(name, code, noise, rng):
+    """Return name, possibly misspelt, as reported on a match card.
+
+    The name is returned unchanged except in a fraction noise of calls.
+
+    """
+    if rng.random() >= noise:
+        return name
+    forename, surname = name.split(" ", 1)
+    choice = rng.randrange(5)
+    if choice == 0:
+        return " ".join((forename[0], surname))
+    if choice == 1 and len(surname) > 2:
+        index = rng.randrange(len(surname) - 1)
+        return " ".join(
+            (
+                forename,
+                "".join(
+                    (
+                        surname[:index],
+                        surname[index + 1],
+                        surname[index],
+                        surname[index + 2 :],
+                    )
+                ),
+            )
+        )
+    if choice == 2:
+        return " ".join((forename, surname.upper()))
+    if choice == 3:
+        return "  ".join((forename, surname))
+    return " ".join((name, code))
+
+
+def make_row(**values):
+    """Return game row with values, keyed by report name, other items None."""
+    row = [None] * len(_ROW_INDEX)
+    for name, value in values.items():
+        row[_ROW_INDEX[name]] = value
+    return tuple(row)
+
+
+def _round_robin(teams):
+    """Return list of rounds of (home, away) pairs for teams.
+
+    Every team plays every other team once.  A bye is not included in the
+    pairings when there are an odd number of teams.
+
+    """
+    teams = list(teams)
+    if len(teams) % 2:
+        teams.append(None)
+    rounds = []
+    for count in range(len(teams) - 1):
+        pairs = []
+        for index in range(len(teams) // 2):
+            home = teams[index]
+            away = teams[-1 - index]
+            if home is None or away is None:
+                continue
+            pairs.append((away, home) if count % 2 else (home, away))
+        rounds.append(pairs)
+        teams.insert(1, teams.pop())
+    return rounds
+
+
+def generate_league(
+    divisions=1,
+    teams=10,
+    boards=6,
+    rounds=2,
+    noise=0.05,
+    seed=0,
+    event="Synthetic League",
+    start=datetime.date(2025, 9, 1),
+):
+    """Return list of game rows for a league.
+
+    Each of divisions divisions has teams teams which play each other
+    rounds times, home and away alternately, in matches over boards
+    boards.  Each team has a squad of boards + RESERVES players.
+
+    Match rounds are played weekly from start.
+
+    """
+    rng = random.Random(seed)
+    rows = []
+    player_number = 0
+    for division in range(divisions):
+        section = " ".join(("Division", str(division + 1)))
+        squads = {}
+        for team in range(teams):
+            name = " ".join(
+                (
+                    TOWNS[team % len(TOWNS)],
+                    str(division * teams + team + 1),
+                )
+            )
+            squad = []
+            for count in range(boards + RESERVES):
+                del count
+                squad.append(
+                    (player_name(player_number), ecf_code(player_number))
+                )
+                player_number += 1
+            squads[name] = squad
+        week = 0
+        for cycle in range(rounds):
+            for pairs in _round_robin(sorted(squads)):
+                date = (start + datetime.timedelta(weeks=week)).isoformat()
+                week += 1
+                for home, away in pairs:
+                    if cycle % 2:
+                        home, away = away, home
+                    home_players = rng.sample(squads[home], boards)
+                    away_players = rng.sample(squads[away], boards)
+                    for board in range(boards):
+                        rows.append(
+                            make_row(
+                                **{
+                                    constants.REPORT_EVENT: event,
+                                    constants.REPORT_SECTION: section,
+                                    constants.REPORT_HOME_TEAM: home,
+                                    constants.REPORT_AWAY_TEAM: away,
+                                    constants.REPORT_BOARD: str(board + 1),
+                                    constants.REPORT_HOME_PLAYER: noisy_name(
+                                        *home_players[board], noise, rng
+                                    ),
+                                    constants.REPORT_AWAY_PLAYER: noisy_name(
+                                        *away_players[board], noise, rng
+                                    ),
+                                    constants.REPORT_DATE: date,
+                                    constants.REPORT_HOME_PLAYER_COLOUR: (
+                                        COLOURS[board % 2]
+                                    ),
+                                    constants.REPORT_RESULT: rng.choice(
+                                        RESULTS
+                                    ),
+                                }
+                            )
+                        )
+    return rows
+
+
+def generate_tournament(
+    sections=1,
+    players=60,
+    rounds=7,
+    noise=0.05,
+    seed=0,
+    event="Synthetic Congress",
+    start=datetime.date(2025, 9, 1),
+):
+    """Return list of game rows for a tournament.
+
+    Each of sections sections has players players who are paired at
+    random in each of rounds rounds.  One round is played each day from
+    start.
+
+    """
+    rng = random.Random(seed)
+    rows = []
+    player_number = 0
+    for count in range(sections):
+        section = TOURNAMENT_SECTIONS[count % len(TOURNAMENT_SECTIONS)]
+        if sections > len(TOURNAMENT_SECTIONS):
+            section = " ".join((section, str(count + 1)))
+        entrants = []
+        for entrant in range(players):
+            del entrant
+            entrants.append(
+                (player_name(player_number), ecf_code(player_number))
+            )
+            player_number += 1
+        for round_ in range(rounds):
+            date = (start + datetime.timedelta(days=round_)).isoformat()
+            rng.shuffle(entrants)
+            for index in range(0, len(entrants) - 1, 2):
+                rows.append(
+                    make_row(
+                        **{
+                            constants.REPORT_EVENT: event,
+                            constants.REPORT_SECTION: section,
+                            constants.REPORT_HOME_TEAM: "",
+                            constants.REPORT_AWAY_TEAM: "",
+                            constants.REPORT_ROUND: str(round_ + 1),
+                            constants.REPORT_HOME_PLAYER: noisy_name(
+                                *entrants[index], noise, rng
+                            ),
+                            constants.REPORT_AWAY_PLAYER: noisy_name(
+                                *entrants[index + 1], noise, rng
+                            ),
+                            constants.REPORT_DATE: date,
+                            constants.REPORT_HOME_PLAYER_COLOUR: rng.choice(
+                                COLOURS
+                            ),
+                            constants.REPORT_RESULT: rng.choice(RESULTS),
+                        }
+                    )
+                )
+    return rows
+
+
+def league_for_games(games, teams=10, boards=6, rounds=2, **kwargs):
+    """Return rows for a league with enough divisions to have games games.
+
+    The other arguments are passed to generate_league.
+
+    """
+    per_division = (teams * (teams - 1) // 2) * rounds * boards
+    return generate_league(
+        divisions=max(1, math.ceil(games / per_division)),
+        teams=teams,
+        boards=boards,
+        rounds=rounds,
+        **kwargs
+    )
+
+
+def tournament_for_games(games, players=60, rounds=7, **kwargs):
+    """Return rows for a tournament with enough sections for games games.
+
+    The other arguments are passed to generate_tournament.
+
+    """
+    per_section = (players // 2) * rounds
+    return generate_tournament(
+        sections=max(1, math.ceil(games / per_section)),
+        players=players,
+        rounds=rounds,
+        **kwargs
+    )
@@ -0,0 +1,125 @@
+# cli.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Create ECF submission files from the command line.
+
+Run as 'python -m chesssubmit.cli <event folder> ...'.
+
+Several folders, or glob patterns matching folders, may be given: these are
+processed in parallel by worker processes and a table of the outcome for
+each folder is printed.
+
+The steps done by the Submit button of the Submit Results application are
+done without importing tkinter, so this can be used in scheduled jobs and
+scripts on computers without a display.
+
+"""
+import sys
+import argparse
+
+from . import APPLICATION_NAME
+
+
+def _make_parser():
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chesssubmit.cli",
+        description=" ".join(
+            (
+                "Create the ECF submission file for the event in each",
+                "folder without the",
+                APPLICATION_NAME,
+                "user interface.",
+            )
+        ),
+    )
+    parser.add_argument(
+        "folders",
+        nargs="+",
+        metavar="folder",
+        help="folder, or glob pattern of folders, of event source documents",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default one per processor)",
+    )
+    parser.add_argument(
+        "-r",
+        "--resolve-players",
+        action="store_true",
+        help=" ".join(
+            (
+                "merge players linked by PersonECFCode, PersonAlias, or",
+                "PersonNumber, values given in the submission file",
+            )
+        ),
+    )
+    parser.add_argument(
+        "-a",
+        "--propose-aliases",
+        action="store_true",
+        help=" ".join(
+            (
+                "list PersonAlias groupings of similar names in each team,",
+                "with ECF names from the rating list, for review",
+            )
+        ),
+    )
+    return parser
+
+
+def _write_proposals(status):
+    """Write the PersonAlias groupings proposed for folder in status."""
+    if not status.proposals:
+        return
+    sys.stdout.write("".join((status.folder, ": proposed aliases\n")))
+    for proposal in status.proposals:
+        sys.stdout.write("".join(("  ", proposal, "\n")))
+
+
+def main(argv=None):
+    """Create submission file for folder named in argv and return status."""
+    args = _make_parser().parse_args(argv)
+
+    # Deferred so 'python -m chesssubmit.cli --help' is quick.
+    from .core import batch
+
+    folders = batch.expand_folders(args.folders)
+    if not folders:
+        sys.stderr.write("No event folders found\n")
+        return 1
+    if len(folders) == 1 and args.jobs is None:
+        status = batch.build_folder(
+            folders[0],
+            resolve_players=args.resolve_players,
+            propose_aliases=args.propose_aliases,
+        )
+        if status.status != batch.STATUS_OK:
+            sys.stderr.write("".join((folders[0], ": ", status.message, "\n")))
+            return 1
+        sys.stdout.write("".join((folders[0], ": ", status.message, "\n")))
+        for problem in status.problems:
+            sys.stdout.write("".join((problem, "\n")))
+        _write_proposals(status)
+        return 0
+    statuses = batch.build_submissions(
+        folders,
+        max_workers=args.jobs,
+        resolve_players=args.resolve_players,
+        propose_aliases=args.propose_aliases,
+    )
+    sys.stdout.write(batch.format_status_table(statuses))
+    sys.stdout.write("\n")
+    for status in statuses:
+        _write_proposals(status)
+    if any(status.status != batch.STATUS_OK for status in statuses):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
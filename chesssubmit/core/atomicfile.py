@@ -0,0 +1,119 @@
+# atomicfile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Replace a file so readers see either the old or the new content.
+
+The new content is written to a temporary file in the same folder, flushed
+to disk, and renamed to the target name.  The folder is flushed to disk
+after the rename so the new name survives a crash.  If an exception occurs
+before the rename the temporary file is removed and the target file is not
+changed.
+
+"""
+import os
+import stat
+import tempfile
+import contextlib
+
+# Permissions given to a new file: the process umask is not read because
+# os.umask() changes it for all threads while it is read.
+NEW_FILE_MODE = 0o644
+
+# Size, in characters, of the blocks written by write_blocks.
+BLOCK_SIZE = 1048576
+
+
+@contextlib.contextmanager
+def open_atomically(path, mode="w", newline="", encoding=None, replace=None):
+    """Yield file object for temporary file which replaces path on exit.
+
+    mode is "w" or "wb".  newline and encoding are ignored for "wb".
+
+    replace, if not None, is called with no arguments when the body of the
+    with statement has finished: path is replaced only if it returns True,
+    otherwise the temporary file is removed.
+
+    """
+    folder, name = os.path.split(path)
+    handle, temporary = tempfile.mkstemp(
+        prefix="".join((".", name, ".")), suffix=".tmp", dir=folder or None
+    )
+    try:
+        os.chmod(temporary, _get_file_mode(path))
+        if "b" in mode:
+            file = os.fdopen(handle, mode, buffering=BLOCK_SIZE)
+        else:
+            file = os.fdopen(
+                handle,
+                mode,
+                buffering=BLOCK_SIZE,
+                newline=newline,
+                encoding=encoding,
+            )
+        with file:
+            yield file
+            file.flush()
+            keep = replace is None or replace()
+            if keep:
+                os.fsync(file.fileno())
+        if keep:
+            os.replace(temporary, path)
+            _fsync_folder(folder)
+        else:
+            os.remove(temporary)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporary)
+        raise
+
+
+def _get_file_mode(path):
+    """Return permissions of path, or default permissions for new files.
+
+    tempfile.mkstemp() creates files readable only by the owner.
+
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+
+def _fsync_folder(folder):
+    """Flush the entries of folder to disk where the platform allows it.
+
+    Folders cannot be opened for fsync on some platforms, Microsoft Windows
+    for example, and the failure is ignored.
+
+    """
+    try:
+        handle = os.open(folder or os.curdir, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(handle)
+    except OSError:
+        pass
+    finally:
+        os.close(handle)
+
+
+def write_blocks(file, pieces, block_size=BLOCK_SIZE):
+    """Write the strings from iterable pieces to file in large blocks.
+
+    The pieces are collected and joined so there is one file.write() call
+    per block_size characters rather than one per piece.
+
+    """
+    block = []
+    size = 0
+    for piece in pieces:
+        block.append(piece)
+        size += len(piece)
+        if size >= block_size:
+            file.write("".join(block))
+            block.clear()
+            size = 0
+    if block:
+        file.write("".join(block))
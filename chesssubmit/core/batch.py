@@ -0,0 +1,198 @@
+# batch.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Create the submission files for many event folders in worker processes.
+
+Each folder is processed by pipeline.build_submission in a separate worker
+of a ProcessPoolExecutor.  A failure in one folder is reported in that
+folder's status and does not stop the others.
+
+"""
+import os
+import glob
+import time
+import concurrent.futures
+
+from . import pipeline
+from . import integrity
+from .namematch import format_proposal
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+
+class FolderStatus:
+    """Outcome of creating the submission file for one event folder.
+
+    problems is a list of the text of the problems found in the submission
+    file by integrity.check_submission_file, including the warnings.
+    proposals is a list of the
+    text of the PersonAlias groupings proposed, if asked for.
+
+    """
+
+    def __init__(
+        self, folder, status, seconds, message="", problems=(), proposals=()
+    ):
+        """Note outcome for folder and time taken in seconds."""
+        self.folder = folder
+        self.status = status
+        self.seconds = seconds
+        self.message = message
+        self.problems = list(problems)
+        self.proposals = list(proposals)
+
+
+def expand_folders(patterns):
+    """Return sorted list of folders named, or matched by glob, in patterns.
+
+    Names which are not directories are ignored.
+
+    """
+    folders = set()
+    for pattern in patterns:
+        matches = glob.glob(os.path.expanduser(pattern))
+        if not matches and not _is_glob(pattern):
+            matches = [pattern]
+        folders.update(
+            os.path.normpath(name) for name in matches if os.path.isdir(name)
+        )
+    return sorted(folders)
+
+
+def _is_glob(pattern):
+    """Return True if pattern contains glob special characters."""
+    return any(character in pattern for character in "*?[")
+
+
+def build_folder(folder, resolve_players=False, propose_aliases=False):
+    """Return FolderStatus after creating submission file for folder.
+
+    This is the function run in the worker processes so any exception is
+    caught and reported in the status.
+
+    Players linked by the PersonList entries are merged if resolve_players
+    is True, and PersonAlias groupings are proposed if propose_aliases is
+    True.
+
+    """
+    start = time.perf_counter()
+    try:
+        results = pipeline.build_submission(
+            folder,
+            resolve_players=resolve_players,
+            propose_aliases=propose_aliases,
+        )
+        problems = integrity.check_submission_file(folder)
+    except Exception as exc:  # pylint: disable=broad-except
+        return FolderStatus(
+            folder,
+            STATUS_FAILED,
+            time.perf_counter() - start,
+            message=": ".join((exc.__class__.__name__, str(exc))),
+        )
+    details = [
+        str(len(results.players)),
+        "players",
+        str(len(results.teams)),
+        "teams",
+    ]
+    if results.rating_list_problems:
+        details.extend(
+            (str(len(results.rating_list_problems)), "rating list problems")
+        )
+    warning_count = sum(
+        isinstance(problem, integrity.SubmissionFileWarning)
+        for problem in problems
+    )
+    if len(problems) > warning_count:
+        details.extend(
+            (str(len(problems) - warning_count), "submission file problems")
+        )
+    if warning_count:
+        details.extend((str(warning_count), "submission file warnings"))
+    if results.alias_proposals:
+        details.extend(
+            (str(len(results.alias_proposals)), "alias proposals")
+        )
+    return FolderStatus(
+        folder,
+        STATUS_OK,
+        time.perf_counter() - start,
+        message=" ".join(details),
+        problems=[str(problem) for problem in problems],
+        proposals=[
+            format_proposal(proposal) for proposal in results.alias_proposals
+        ],
+    )
+
+
+def build_submissions(
+    folders, max_workers=None, resolve_players=False, propose_aliases=False
+):
+    """Return list of FolderStatus, in folders order, after building all.
+
+    max_workers is passed to ProcessPoolExecutor: None means one worker per
+    processor.  resolve_players and propose_aliases are passed to
+    build_folder.
+
+    """
+    statuses = {}
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers
+    ) as executor:
+        futures = {
+            executor.submit(
+                build_folder, folder, resolve_players, propose_aliases
+            ): folder
+            for folder in folders
+        }
+        for future in concurrent.futures.as_completed(futures):
+            folder = futures[future]
+            try:
+                statuses[folder] = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                # Usually the worker process died: BrokenProcessPool.
+                statuses[folder] = FolderStatus(
+                    folder,
+                    STATUS_FAILED,
+                    0.0,
+                    message=": ".join((exc.__class__.__name__, str(exc))),
+                )
+    return [statuses[folder] for folder in folders]
+
+
+def format_status_table(statuses):
+    """Return text table of folder, status, seconds, and message."""
+    width = max((len(status.folder) for status in statuses), default=6)
+    width = max(width, len("Folder"))
+    lines = [
+        "  ".join(
+            ("Folder".ljust(width), "Status", "Seconds".rjust(9), "Details")
+        )
+    ]
+    for status in statuses:
+        lines.append(
+            "  ".join(
+                (
+                    status.folder.ljust(width),
+                    status.status.ljust(6),
+                    format(status.seconds, "9.2f"),
+                    status.message,
+                )
+            )
+        )
+    lines.append(
+        "".join(
+            (
+                str(sum(s.status == STATUS_OK for s in statuses)),
+                " of ",
+                str(len(statuses)),
+                " folders ok in ",
+                format(sum(s.seconds for s in statuses), ".2f"),
+                " worker seconds",
+            )
+        )
+    )
+    return "\n".join(lines)
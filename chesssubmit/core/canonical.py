@@ -0,0 +1,55 @@
+# canonical.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Canonical forms of player, team, and section, names from game reports.
+
+A league repeats a few hundred player names and a few dozen team names over
+thousands of game rows.  The functions here do the Unicode normalisation,
+whitespace normalisation, and splitting of codes from names, once per
+distinct string and return interned strings so equal names share storage.
+
+The caches are bounded so a very large event cannot grow them without
+limit.
+
+"""
+import sys
+import unicodedata
+import functools
+
+from chessvalidate.core.gameobjects import split_codes_from_name
+
+# Maximum number of distinct strings remembered by each cache.
+CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def canonical_string(text):
+    """Return interned NFKC normalised text with single space separators.
+
+    None is returned unchanged.
+
+    """
+    if text is None:
+        return None
+    return sys.intern(" ".join(unicodedata.normalize("NFKC", text).split()))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def split_name_and_codes(text):
+    """Return (name, codes) from split_codes_from_name of canonical text.
+
+    name is interned and codes is a tuple of interned strings, so the
+    cached value cannot be modified by callers.
+
+    """
+    name, codes = split_codes_from_name(canonical_string(text))
+    if name:
+        name = canonical_string(name)
+    return name, tuple(sys.intern(code) for code in codes)
+
+
+def clear_caches():
+    """Discard the cached canonical strings and names."""
+    canonical_string.cache_clear()
+    split_name_and_codes.cache_clear()
@@ -0,0 +1,210 @@
+# codestore.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Keep ECF codes and club codes found in earlier events for reuse.
+
+Each event is managed without reference to any other, so the ECF codes of
+players and the club codes of teams would otherwise be collected again for
+every event.  The optional code store is an SQLite database, by default the
+file named by constants.CODE_STORE_FILE in the user's home directory.
+
+The store is filled from the PersonList and TeamList entries of submission
+files which have been given codes: the person name, alias, and team, map to
+the PersonECFCode and PersonECFName values; and the team name maps to the
+TeamClubName and TeamClubCode values.
+
+When a submission is generated the entries without codes are filled from
+the store.  A person's code is taken from the entries for the same name and
+team, then an alias equal to the name in the same team, but only if the
+entries found agree on one code.  The same name in another team is not
+used because different players can have the same name.  The team is "" in
+events which are not matches.
+
+Only codes given by the user are saved: codes filled in from the store or
+the rating list are not saved again, so a wrong guess does not spread to
+later events.
+
+The store is used if the CHESSSUBMIT_CODE_STORE environment variable names
+the database file, or is '1' or 'true' for the default file, or if the
+constants.CODE_STORE item in the user's configuration file is
+constants.CODE_STORE_TRUE.
+
+"""
+import os
+import sqlite3
+
+from . import constants
+
+# Environment variable naming the code store file.  The default file is
+# used if the value is '1' or 'true', and no store if empty, '0', or
+# 'false'.
+CODE_STORE_ENVIRONMENT_VARIABLE = "CHESSSUBMIT_CODE_STORE"
+
+_SCHEMA = (
+    "".join(
+        (
+            "CREATE TABLE IF NOT EXISTS person (",
+            "name TEXT NOT NULL, ",
+            "team TEXT NOT NULL, ",
+            "alias TEXT NOT NULL, ",
+            "ecf_name TEXT NOT NULL, ",
+            "ecf_code TEXT NOT NULL, ",
+            "PRIMARY KEY (name, team, alias)",
+            ") WITHOUT ROWID",
+        )
+    ),
+    "DROP INDEX IF EXISTS person_alias",
+    "CREATE INDEX IF NOT EXISTS person_alias_team ON person (alias, team)",
+    "".join(
+        (
+            "CREATE TABLE IF NOT EXISTS team (",
+            "team TEXT NOT NULL PRIMARY KEY, ",
+            "club_name TEXT NOT NULL, ",
+            "club_code TEXT NOT NULL",
+            ") WITHOUT ROWID",
+        )
+    ),
+)
+
+# Queries, each answered from an index, for a person's ECF code in the
+# order tried.  Two rows mean the entries do not agree on a code.
+_PERSON_QUERIES = (
+    "".join(
+        (
+            "SELECT ecf_code, MAX(ecf_name) FROM person ",
+            "WHERE name = ? AND team = ? GROUP BY ecf_code LIMIT 2",
+        )
+    ),
+    "".join(
+        (
+            "SELECT ecf_code, MAX(ecf_name) FROM person ",
+            "WHERE alias = ? AND team = ? GROUP BY ecf_code LIMIT 2",
+        )
+    ),
+)
+
+
+def code_store_path(configuration_value=None):
+    """Return path of code store file, or None if no store is used.
+
+    configuration_value is the value of constants.CODE_STORE in the user's
+    configuration file, or None if not known.  The environment variable
+    takes precedence if it is set.
+
+    """
+    default = os.path.join(os.path.expanduser("~"), constants.CODE_STORE_FILE)
+    value = os.environ.get(CODE_STORE_ENVIRONMENT_VARIABLE)
+    if value is not None:
+        value = value.strip()
+        if value.lower() in ("", "0", "false"):
+            return None
+        if value.lower() in ("1", "true"):
+            return default
+        return os.path.expanduser(value)
+    if configuration_value == constants.CODE_STORE_TRUE:
+        return default
+    return None
+
+
+def open_code_store(configuration_value=None):
+    """Return CodeStore for code_store_path(), or None if no store used."""
+    path = code_store_path(configuration_value)
+    if path is None:
+        return None
+    return CodeStore(path)
+
+
+class CodeStore:
+    """ECF codes and club codes from earlier events in an SQLite database.
+
+    The connection may be used only in the thread which created it.
+
+    """
+
+    def __init__(self, path):
+        """Open, creating if necessary, the code store database at path."""
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        try:
+            with self.connection:
+                for statement in _SCHEMA:
+                    self.connection.execute(statement)
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+    def record_persons(self, persons):
+        """Save ECF codes in persons, a dict of Person keyed by name.
+
+        The key is the (name, section, team) tuple of a PersonList entry.
+        Persons without an ECF code are ignored.
+
+        """
+        with self.connection:
+            self.connection.executemany(
+                "".join(
+                    (
+                        "INSERT OR REPLACE INTO person ",
+                        "(name, team, alias, ecf_name, ecf_code) ",
+                        "VALUES (?, ?, ?, ?, ?)",
+                    )
+                ),
+                (
+                    (
+                        key[0],
+                        key[2],
+                        person.alias,
+                        person.ecf_name,
+                        person.ecf_code.strip(),
+                    )
+                    for key, person in persons.items()
+                    if person.ecf_code.strip()
+                ),
+            )
+
+    def record_teams(self, teams):
+        """Save club codes in teams, a dict of Team keyed by section and team.
+
+        Teams without a club code or without a team name are ignored.
+
+        """
+        with self.connection:
+            self.connection.executemany(
+                "".join(
+                    (
+                        "INSERT OR REPLACE INTO team ",
+                        "(team, club_name, club_code) VALUES (?, ?, ?)",
+                    )
+                ),
+                (
+                    (key[1], team.club_name, team.club_code.strip())
+                    for key, team in teams.items()
+                    if key[1] and team.club_code.strip()
+                ),
+            )
+
+    def get_person_code(self, name, team):
+        """Return (ECF code, ECF name) for name in team or None if unknown.
+
+        None is also returned if the stored entries give more than one code.
+
+        """
+        execute = self.connection.execute
+        for query in _PERSON_QUERIES:
+            rows = execute(query, (name, team)).fetchall()
+            if len(rows) == 1:
+                return rows[0]
+            if rows:
+                return None
+        return None
+
+    def get_team_code(self, team):
+        """Return (club name, club code) for team or None if unknown."""
+        return self.connection.execute(
+            "SELECT club_name, club_code FROM team WHERE team = ?", (team,)
+        ).fetchone()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
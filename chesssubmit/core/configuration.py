@@ -7,12 +7,218 @@
 The initial values are taken from file named in self._CONFIGURATION in the
 user's home directory if the file exists.
 
+The values are held in the solentware_misc cache shared by all
+Configuration instances in the process.  The file is read again only when
+its modification time has changed, and the modification time is looked at
+no more than once every STAT_INTERVAL seconds.
+
+Changed values are written FLUSH_DELAY seconds after the first change not
+yet written, or when the process exits, so several changes close together
+cause one write.  The file is read again just before writing and only the
+changed items are replaced, so changes saved by other running instances of
+the application are not lost.  A lock file is held while the file is read
+and written so two instances do not save at the same time.  The file is
+replaced atomically so other instances never read a partly written file.
+
+The file is read and written in the locale's encoding, as solentware_misc
+does.
+
 """
+
+import os
+import time
+import atexit
+import locale
+import threading
+import contextlib
+
 from solentware_misc.core import configuration
 
 import ecfformat.core.constants
 
 from . import constants
+from .atomicfile import open_atomically
+
+# Minimum seconds between checks of the configuration file's modification
+# time.
+STAT_INTERVAL = 2.0
+
+# Seconds between the first unsaved change and writing the file.
+FLUSH_DELAY = 2.0
+
+# Seconds to wait for another process to release the configuration file's
+# lock, seconds between attempts to take the lock, and the age in seconds
+# of a lock file assumed left by a process which died holding it.
+LOCK_TIMEOUT = 5.0
+LOCK_RETRY_INTERVAL = 0.05
+STALE_LOCK_AGE = 30.0
+
+# State shared by all Configuration instances in the process.  The cached
+# values are held by the superclass: _saved has the values last read from,
+# or written to, the file and _pending the cached values which differ.
+# The reader is the first instance created, used to read the file again
+# when it is modified by another process.
+_lock = threading.RLock()
+_saved = {}
+_pending = {}
+_file_state = {
+    "path": None,
+    "mtime": None,
+    "checked": None,
+    "timer": None,
+    "reader": None,
+}
+
+
+def _get_mtime(path):
+    """Return modification time of file at path or None if no file."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_encoding():
+    """Return encoding used by solentware_misc for configuration files."""
+    return locale.getpreferredencoding(False)
+
+
+def _parse_items(text):
+    """Return dict of items in configuration text."""
+    items = {}
+    for line in text.splitlines():
+        item = line.strip().split(maxsplit=1)
+        if len(item) == 2:
+            items[item[0]] = item[1]
+    return items
+
+
+def _read_items(path):
+    """Return dict of items in configuration file at path."""
+    try:
+        with open(path, encoding=_get_encoding()) as config_file:
+            return _parse_items(config_file.read())
+    except OSError:
+        return {}
+
+
+@contextlib.contextmanager
+def _locked_file(path):
+    """Hold lock file for path while body of with statement runs.
+
+    The lock is a file created beside path which other processes cannot
+    create while it exists.  TimeoutError is raised if the lock is not
+    taken within LOCK_TIMEOUT seconds.
+
+    """
+    lock_path = "".join((path, ".lock"))
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            handle = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                age = time.time() - os.stat(lock_path).st_mtime
+            except FileNotFoundError:
+                continue
+            if age > STALE_LOCK_AGE:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(lock_path)
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    " ".join(("Configuration file locked by", lock_path))
+                ) from None
+            time.sleep(LOCK_RETRY_INTERVAL)
+    try:
+        os.close(handle)
+        yield
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(lock_path)
+
+
+def flush_configuration():
+    """Write changed configuration values to the configuration file.
+
+    The file is read, while holding its lock, and only the changed items
+    are replaced.
+
+    """
+    with _lock:
+        timer = _file_state["timer"]
+        if timer is not None:
+            timer.cancel()
+            _file_state["timer"] = None
+        if not _pending:
+            return
+        path = _file_state["path"]
+        try:
+            with _locked_file(path):
+                items = _read_items(path)
+                items.update(_pending)
+                with open_atomically(
+                    path, encoding=_get_encoding()
+                ) as config_file:
+                    config_file.write(
+                        "\n".join(
+                            " ".join((key, items[key]))
+                            for key in sorted(items)
+                        )
+                    )
+        except OSError as error:
+            raise configuration.ConfigurationError(
+                "Unable to save configuration file"
+            ) from error
+        _saved.update(_pending)
+        _pending.clear()
+        _file_state["mtime"] = _get_mtime(path)
+        _file_state["checked"] = time.monotonic()
+
+
+def _flush_configuration_quietly():
+    """Flush configuration ignoring errors: used by timer and at exit."""
+    try:
+        flush_configuration()
+    except configuration.ConfigurationError:
+        pass
+
+
+atexit.register(_flush_configuration_quietly)
+
+
+def _reload_if_changed():
+    """Read configuration file again if modified by another process.
+
+    _saved is rebuilt from the file, so items removed from the file are
+    given their default values.  Values set but not yet written are kept.
+
+    """
+    now = time.monotonic()
+    if now - _file_state["checked"] < STAT_INTERVAL:
+        return
+    _file_state["checked"] = now
+    mtime = _get_mtime(_file_state["path"])
+    if mtime == _file_state["mtime"]:
+        return
+    _file_state["mtime"] = mtime
+    reader = _file_state["reader"]
+    pending = dict(_pending)
+    defaults = reader.get_default_items()
+    items = _parse_items(
+        reader.get_configuration_text_and_values_for_items_from_file(defaults)
+    )
+    _saved.clear()
+    _saved.update(items)
+    for item, value in defaults.items():
+        if item not in items:
+            pending.setdefault(item, value)
+    for item, value in pending.items():
+        configuration.Configuration.set_configuration_value(
+            reader, item, value
+        )
+    reader.note_changes()
 
 
 class Configuration(configuration.Configuration):
@@ -29,4 +235,88 @@ class Configuration(configuration.Configuration):
             ecfformat.core.constants.SHOW_VALUE_BOUNDARY,
             ecfformat.core.constants.SHOW_VALUE_BOUNDARY_TRUE,
         ),
+        (constants.RECORD_TIMINGS, constants.RECORD_TIMINGS_FALSE),
+        (constants.MEMORY_BUDGET, ""),
+        (constants.CODE_STORE, constants.CODE_STORE_FALSE),
     )
+
+    def __init__(self):
+        """Read configuration file when first instance is created.
+
+        The file is read once: the values are cached for the superclass,
+        which then does not read the file, and noted as the saved values.
+
+        """
+        with _lock:
+            if _file_state["path"] is None:
+                path = self.get_configuration_file_path()
+                _file_state["path"] = path
+                _file_state["mtime"] = _get_mtime(path)
+                _file_state["checked"] = time.monotonic()
+                _file_state["reader"] = self
+                text = (
+                    self.get_configuration_text_and_values_for_items_from_file(
+                        self.get_default_items()
+                    )
+                )
+                _saved.update(_parse_items(text))
+                self.set_configuration_values_from_text(text)
+            super().__init__()
+
+    def get_default_items(self):
+        """Return dict of default values of configuration items."""
+        return {
+            default[0]: default[1] for default in self._DEFAULT_ITEM_VAULES
+        }
+
+    @staticmethod
+    def get_configuration_value(item, default=None):
+        """Return value of configuration item or default if item not found.
+
+        The configuration file is read again if it has been modified since
+        it was last read.
+
+        """
+        with _lock:
+            if _file_state["reader"] is not None:
+                _reload_if_changed()
+            return configuration.Configuration.get_configuration_value(
+                item, default=default
+            )
+
+    def set_configuration_value(self, item, value):
+        """Set value of configuration item if item exists.
+
+        The configuration file is written FLUSH_DELAY seconds later, or
+        when the process exits, with all changes made meanwhile.
+
+        """
+        with _lock:
+            _reload_if_changed()
+            super().set_configuration_value(item, value)
+
+    def note_changes(self):
+        """Note the cached values which differ from values on file."""
+        for item in self.get_default_items():
+            value = configuration.Configuration.get_configuration_value(item)
+            if value is None or value == _saved.get(item):
+                _pending.pop(item, None)
+            else:
+                _pending[item] = value
+
+    def _save_configuration(self):
+        """Schedule write of changed configuration values to file."""
+        with _lock:
+            self.note_changes()
+            if _pending:
+                self._schedule_flush()
+
+    @staticmethod
+    def _schedule_flush():
+        """Start timer to flush configuration unless already started."""
+        if _file_state["timer"] is not None:
+            return
+        timer = threading.Timer(FLUSH_DELAY, _flush_configuration_quietly)
+        timer.daemon = True
+        _file_state["timer"] = timer
+        timer.start()
@@ -103,3 +103,57 @@ TABULAR_REPORT_DEFAULT_SOURCE_ORDER = (
 # Three additional sections, Team List, Person List, and Final, are present
 # to support data gathering.
 SUBMISSION = "submission"
+
+# Name of file containing a binary snapshot of the data in the submission
+# file, used to avoid parsing the text when the submission is reopened.
+SUBMISSION_SNAPSHOT = "submission.snapshot"
+
+# Name of file containing the byte range of each section of the submission
+# file, used to show a section without reading the whole file.
+SUBMISSION_INDEX = "submission.index"
+
+# Name of file containing the PIN allocated to each player, keyed by name,
+# section, and team, so PINs are stable when the submission is generated
+# again from a later edition of the reports.
+PIN_MAP = "pinmap"
+
+# Name of file containing the PersonECFCode values filled in from the code
+# store or rating list, rather than given by the user, keyed by name,
+# section, and team.
+PREFILLED_CODES = "prefilledcodes"
+
+# Name of file containing the event details, in ECF submission file style,
+# which are put before the submission data when a submission file is
+# created for upload to ECF.
+EVENT_DETAILS = "event.conf"
+
+# Names of the fields in the event details giving the event's date range.
+# Names are compared ignoring case and spacing.
+ECF_EVENT_DATE = "EVENT DATE"
+ECF_FINAL_RESULT_DATE = "FINAL RESULT DATE"
+
+# Configuration item which switches on recording of the time taken by each
+# stage of creating a submission file.
+RECORD_TIMINGS = "record_timings"
+RECORD_TIMINGS_TRUE = "true"
+RECORD_TIMINGS_FALSE = "false"
+
+# Configuration item giving the memory budget, in megabytes, for creating or
+# reading a submission file.  Empty means no budget.
+MEMORY_BUDGET = "memory_budget"
+
+# Name of file containing the collated game rows of an event, and the hash
+# of the source documents they were collated from.
+GAME_ROWS_CACHE = "gamerows.cache"
+
+# Configuration item which switches on use of the code store, the file
+# CODE_STORE_FILE in the user's home directory, which holds ECF codes and
+# club codes found in earlier events.
+CODE_STORE = "code_store"
+CODE_STORE_TRUE = "true"
+CODE_STORE_FALSE = "false"
+CODE_STORE_FILE = ".chesssubmit.codes"
+
+# Name of file, in the user's home directory, containing the index of an
+# imported ECF rating list used to check and fill in ECF codes and names.
+RATING_LIST_INDEX = ".chesssubmit.ratinglist"
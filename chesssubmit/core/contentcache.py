@@ -0,0 +1,144 @@
+# contentcache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Cache the collated game rows of an event keyed by a hash of its files.
+
+The key is a SHA-256 hash of the names and contents of the files in the
+event folder: the source documents and the extraction configuration.  The
+files written by Submit Results itself, and hidden files, are not part of
+the key.  The Submit button and the command line pipeline collate the rows
+the same way, including the unfinished games, so either may use rows the
+other cached.
+
+The rows are saved in the GAME_ROWS_CACHE file in the event folder as
+zlib compressed JSON.  When the key is unchanged the rows are taken from
+the cache and the source documents are not collated again.
+
+"""
+
+import os
+import json
+import zlib
+import hashlib
+
+from chessvalidate.core.gameobjects import get_game_rows_for_csv_format
+
+from .. import ERROR_LOG, TIMING_LOG
+from . import constants
+from .atomicfile import open_atomically
+from .unfinished import collate_unfinished_games
+
+# Version of the cache file layout: a cache with another version is ignored.
+# Version 1 caches were keyed by how the rows were collated.
+CACHE_VERSION = 2
+
+# Size of blocks read when hashing files.
+_READ_SIZE = 1048576
+
+# Files in the event folder which are not source documents.
+GENERATED_FILES = frozenset(
+    (
+        constants.SUBMISSION,
+        constants.SUBMISSION_SNAPSHOT,
+        constants.SUBMISSION_INDEX,
+        constants.PIN_MAP,
+        constants.PREFILLED_CODES,
+        constants.GAME_ROWS_CACHE,
+        ERROR_LOG,
+        TIMING_LOG,
+    )
+)
+
+
+def _update_digest_from_file(digest, path):
+    """Update digest with the content of file at path."""
+    with open(path, "rb") as file:
+        while True:
+            data = file.read(_READ_SIZE)
+            if not data:
+                break
+            digest.update(data)
+
+
+def file_digest(path):
+    """Return SHA-256 digest of the content of file at path."""
+    digest = hashlib.sha256()
+    _update_digest_from_file(digest, path)
+    return digest.digest()
+
+
+def source_documents_hash(folder):
+    """Return hex SHA-256 hash of names and contents of files in folder.
+
+    Files in GENERATED_FILES, and names starting with '.', are ignored in
+    folder and its subfolders.
+
+    """
+    digest = hashlib.sha256()
+    for root, dirnames, filenames in os.walk(folder):
+        dirnames[:] = sorted(name for name in dirnames if name[0] != ".")
+        for name in sorted(filenames):
+            if name[0] == "." or (root == folder and name in GENERATED_FILES):
+                continue
+            path = os.path.join(root, name)
+            digest.update(
+                os.path.relpath(path, folder).encode("utf-8", "replace")
+            )
+            digest.update(b"\0")
+            _update_digest_from_file(digest, path)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def make_cache_key(folder):
+    """Return cache key for rows collated from source documents in folder."""
+    return source_documents_hash(folder)
+
+
+def collate_game_rows(results_data):
+    """Return list of game rows for the collated games in results_data.
+
+    The rows are tuples in constants.TABULAR_REPORT_ROW_ORDER order.  The
+    reports of unfinished games whose results were reported later are not
+    included.
+
+    """
+    return collate_unfinished_games(
+        list(get_game_rows_for_csv_format(results_data.get_collated_games()))
+    )
+
+
+def read_cached_rows(folder, key):
+    """Return game rows cached in folder for key, or None if not cached."""
+    path = os.path.join(folder, constants.GAME_ROWS_CACHE)
+    try:
+        with open(path, "rb") as file:
+            cache = json.loads(zlib.decompress(file.read()).decode("utf-8"))
+    except (OSError, zlib.error, ValueError):
+        return None
+    if not isinstance(cache, dict):
+        return None
+    if cache.get("version") != CACHE_VERSION or cache.get("key") != key:
+        return None
+    return [tuple(row) for row in cache.get("rows", ())]
+
+
+def write_cached_rows(folder, key, rows):
+    """Save game rows in folder as the cached rows for key.
+
+    The cache is only a copy of the collated rows so callers may ignore
+    OSError, and TypeError or ValueError for rows which cannot be saved
+    as JSON.
+
+    """
+    data = zlib.compress(
+        json.dumps(
+            {"version": CACHE_VERSION, "key": key, "rows": rows},
+            separators=(",", ":"),
+        ).encode("utf-8")
+    )
+    with open_atomically(
+        os.path.join(folder, constants.GAME_ROWS_CACHE), mode="wb"
+    ) as file:
+        file.write(data)
@@ -0,0 +1,137 @@
+# gamedates.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Convert reported game dates to the ECF 'dd/mm/yyyy' format.
+
+A league has few distinct match dates so each distinct reported date is
+parsed and checked once.  Dates which are not real calendar dates, or are
+outside the event's date range given in the event details file, are noted
+and reported together after all games have been converted.
+
+"""
+import os
+import datetime
+
+from . import constants
+from .tokenizer import tokenize_file
+
+
+class GameDateError(Exception):
+    """Report the invalid game dates found in a submission."""
+
+
+class GameDateConverter:
+    """Convert 'yyyy-mm-dd' dates to 'dd/mm/yyyy' and note problems.
+
+    first and last are datetime.date instances giving the event's date
+    range, or None if not known.
+
+    """
+
+    def __init__(self, first=None, last=None):
+        """Set event date range and initialise cache and problem report."""
+        self.first = first
+        self.last = last
+        self._dates = {}
+        self.problems = {}
+
+    def convert(self, gamedate):
+        """Return gamedate in 'dd/mm/yyyy' format, or "" if None.
+
+        Problems with gamedate are noted with a count of the games having
+        the date.  The value returned for a date which is not valid is the
+        reported date with the 'yyyy-mm-dd' parts reversed.
+
+        """
+        if gamedate is None:
+            return ""
+        ecf_date = self._dates.get(gamedate)
+        if ecf_date is None:
+            ecf_date = self._dates[gamedate] = self._convert(gamedate)
+        if gamedate in self.problems:
+            self.problems[gamedate][1] += 1
+        return ecf_date
+
+    def _convert(self, gamedate):
+        """Return gamedate in 'dd/mm/yyyy' format and note any problem."""
+        try:
+            date = datetime.datetime.strptime(gamedate, "%Y-%m-%d").date()
+        except ValueError:
+            self.problems[gamedate] = ["is not a valid 'yyyy-mm-dd' date", 0]
+            return "/".join(reversed(gamedate.split("-")))
+        if self.first is not None and date < self.first:
+            self.problems[gamedate] = [
+                " ".join(("is before event date", _ecf_date(self.first))),
+                0,
+            ]
+        elif self.last is not None and date > self.last:
+            self.problems[gamedate] = [
+                " ".join(("is after final result date", _ecf_date(self.last))),
+                0,
+            ]
+        return _ecf_date(date)
+
+    def report(self):
+        """Return text describing the problem dates, or "" if none."""
+        return "\n".join(
+            "".join(
+                (
+                    gamedate,
+                    " ",
+                    problem,
+                    " (",
+                    str(count),
+                    " game" if count == 1 else " games",
+                    ")",
+                )
+            )
+            for gamedate, (problem, count) in sorted(self.problems.items())
+        )
+
+
+def _ecf_date(date):
+    """Return datetime.date date in 'dd/mm/yyyy' format."""
+    return date.strftime("%d/%m/%Y")
+
+
+def _parse_ecf_date(value):
+    """Return datetime.date for 'dd/mm/yyyy' value or None if invalid."""
+    try:
+        return datetime.datetime.strptime(value, "%d/%m/%Y").date()
+    except ValueError:
+        return None
+
+
+def _normalise_field_name(name):
+    """Return name in upper case with single space separators."""
+    return " ".join(name.upper().split())
+
+
+def read_event_date_range(folder):
+    """Return (event date, final result date) from event details file.
+
+    Either date is None if it is not given, or is not a valid 'dd/mm/yyyy'
+    date, in the event details file in folder.  Both are None if the file
+    does not exist.
+
+    """
+    path = os.path.join(folder, constants.EVENT_DETAILS)
+    if not os.path.isfile(path):
+        return None, None
+    wanted = {
+        _normalise_field_name(constants.ECF_EVENT_DATE): 0,
+        _normalise_field_name(constants.ECF_FINAL_RESULT_DATE): 1,
+    }
+    dates = [None, None]
+    for name, value, offset in tokenize_file(path):
+        del offset
+        index = wanted.get(_normalise_field_name(name))
+        if index is not None:
+            dates[index] = _parse_ecf_date(value)
+    return tuple(dates)
+
+
+def make_game_date_converter(folder):
+    """Return GameDateConverter for event date range of event in folder."""
+    return GameDateConverter(*read_event_date_range(folder))
@@ -0,0 +1,380 @@
+# integrity.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Check the values in a submission file before it is sent to the ECF.
+
+Submission.open_documents checks only the order of the field names.  The
+checks here are of the values:
+
+Player List PINs are positive integers and are not repeated.
+Games refer to PINs in the Player List, and not twice to the same PIN.
+A game with the same players, BOARD, ROUND, and date, is not repeated
+within a section.
+SCORE values are ECF scores, COLOUR values are W or B, BOARD and ROUND
+values are positive integers, and game dates are blank or 'dd/mm/yyyy'
+dates within the event's date range.
+TeamList and PersonList entries are not repeated and PersonList entries
+refer to PINs in the Player List.
+
+Some things are reported as warnings, SubmissionFileWarning, rather than
+errors because the ECF may accept them.  Values longer than the limits in
+FIELD_LENGTH_LIMITS are warnings because the limits are not published by
+the ECF.  Repeated section names are warnings because, for example, two
+divisions may have a match with the same name.  A repeated game with no
+BOARD and no ROUND is a warning because two players may meet twice on the
+same day in some sections.
+
+The file is read once as a stream of fields.  The PINs, sections, games,
+teams, and persons, seen so far are held in sets and dicts so each check
+takes constant time and the whole check takes time proportional to the
+size of the file.  The line numbers of all the problems are found in a
+second pass, over the file's bytes only, when the problems are reported.
+
+"""
+import os
+import datetime
+
+from ecfformat.core import constants as ecf_constants
+
+from chessvalidate.core.gameresults import resultmapecf
+
+from . import constants
+from .gamedates import read_event_date_range
+from .tokenizer import tokenize_file, line_numbers_at, SubmissionFileError
+
+# Lengths of field values beyond which the value is probably a mistake.  The
+# ECF does not publish maximum lengths for these fields, so longer values
+# get a warning, not an error.  An ECF code is seven characters, '123456A',
+# and a club code four.  PIN, BOARD, and ROUND values of more digits than
+# given here are unlikely in a league or congress.  The name limits are
+# generous lengths for a player's, club's, or section's name.
+FIELD_LENGTH_LIMITS = {
+    ecf_constants.PIN: 6,
+    ecf_constants.NAME_ECF_CODE: 7,
+    ecf_constants.NAME: 60,
+    ecf_constants.CLUB: 40,
+    ecf_constants.NAME_CLUB_CODE: 4,
+    ecf_constants.NAME_MATCH_RESULTS: 60,
+    ecf_constants.NAME_SECTION_RESULTS: 60,
+    ecf_constants.NAME_OTHER_RESULTS: 60,
+    ecf_constants.BOARD: 3,
+    ecf_constants.ROUND: 3,
+}
+
+SCORES = frozenset(score for score in resultmapecf.values() if score)
+COLOURS = frozenset(("W", "B", ""))
+
+_SECTION_STARTS = frozenset(
+    (
+        ecf_constants.NAME_MATCH_RESULTS,
+        ecf_constants.NAME_OTHER_RESULTS,
+        ecf_constants.NAME_SECTION_RESULTS,
+    )
+)
+_BLOCK_STARTS = frozenset(
+    (
+        ecf_constants.NAME_PLAYER_LIST,
+        ecf_constants.FINISH,
+        constants.TEAM_LIST,
+        constants.PERSON_LIST,
+        constants.FINAL,
+    )
+)
+_RECORD_STARTS = frozenset(
+    (
+        ecf_constants.PIN,
+        ecf_constants.NAME_PIN1,
+        constants.TEAM_SECTION,
+        constants.PERSON_NUMBER,
+    )
+)
+
+
+class SubmissionFileWarning(SubmissionFileError):
+    """Report a value in a submission file which is probably a mistake.
+
+    The ECF may accept the value: the user should look at it before the
+    file is sent.
+
+    """
+
+    def __str__(self):
+        """Return message with location of problem marked as a warning."""
+        return "".join(("Warning: ", super().__str__()))
+
+
+def _is_positive_integer(value):
+    """Return True if value is the text of a positive integer."""
+    return value.isdigit() and int(value) > 0
+
+
+class _IntegrityChecker:
+    """Check the fields of a submission file as they are read.
+
+    Each record is checked when the next record, section, or block, starts
+    and problems are noted as (offset, message, error class) in
+    self.problems.
+
+    """
+
+    def __init__(self, first=None, last=None):
+        """Initialise indexes.  first and last are the event date range."""
+        self.first = first
+        self.last = last
+        self.problems = []
+        self.record = {}
+        self.offsets = {}
+        self.section_name = None
+        self.pins = {}
+        self.sections = {}
+        self.games = set()
+        self.teams = set()
+        self.persons = set()
+        self.dates = {}
+
+    def note(self, offset, *message):
+        """Note problem at offset described by message parts."""
+        self.problems.append((offset, "".join(message), SubmissionFileError))
+
+    def warn(self, offset, *message):
+        """Note possible problem at offset described by message parts."""
+        self.problems.append(
+            (offset, "".join(message), SubmissionFileWarning)
+        )
+
+    def add_field(self, name, value, offset):
+        """Check value of field and add it to the current record."""
+        limit = FIELD_LENGTH_LIMITS.get(name)
+        if limit is not None and len(value) > limit:
+            self.warn(
+                offset,
+                "Field '",
+                name,
+                "' value is longer than ",
+                str(limit),
+                " characters",
+            )
+        if name in _RECORD_STARTS:
+            self.flush()
+        elif name in _SECTION_STARTS:
+            self.flush()
+            self.section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
+                (name, value)
+            )
+            earlier = self.sections.setdefault(self.section_name, offset)
+            if earlier != offset:
+                self.warn(
+                    offset,
+                    "Section '",
+                    self.section_name,
+                    "' is repeated",
+                )
+            return
+        elif name in _BLOCK_STARTS:
+            self.flush()
+            self.section_name = None
+            return
+        if name == constants.PERSON_CODE:
+            return
+        self.record[name] = value
+        self.offsets[name] = offset
+
+    def flush(self):
+        """Check the current record and start a new one."""
+        record = self.record
+        if not record:
+            return
+        if ecf_constants.PIN in record:
+            self._check_player()
+        elif ecf_constants.NAME_PIN1 in record:
+            self._check_game()
+        elif constants.TEAM_SECTION in record:
+            self._check_team()
+        elif constants.PERSON_NUMBER in record:
+            self._check_person()
+        self.record = {}
+        self.offsets = {}
+
+    def _check_player(self):
+        """Check Player List entry."""
+        pin = self.record[ecf_constants.PIN]
+        offset = self.offsets[ecf_constants.PIN]
+        if not _is_positive_integer(pin):
+            self.note(offset, "PIN '", pin, "' is not a positive integer")
+        earlier = self.pins.setdefault(pin, offset)
+        if earlier != offset:
+            self.note(offset, "PIN '", pin, "' is repeated in Player List")
+        if not self.record.get(ecf_constants.NAME):
+            self.note(offset, "Player with PIN '", pin, "' has no name")
+
+    def _check_pin_reference(self, name):
+        """Check field name of current record is a PIN in Player List."""
+        pin = self.record.get(name)
+        if pin is None:
+            return
+        if pin not in self.pins:
+            self.note(
+                self.offsets[name],
+                "Field '",
+                name,
+                "' PIN '",
+                pin,
+                "' is not in Player List",
+            )
+
+    def _check_game(self):
+        """Check Result Details entry."""
+        record = self.record
+        offsets = self.offsets
+        offset = offsets[ecf_constants.NAME_PIN1]
+        if self.section_name is None:
+            self.note(offset, "Game is not in a results section")
+        self._check_pin_reference(ecf_constants.NAME_PIN1)
+        self._check_pin_reference(ecf_constants.NAME_PIN2)
+        pin1 = record[ecf_constants.NAME_PIN1]
+        pin2 = record.get(ecf_constants.NAME_PIN2)
+        if pin1 == pin2:
+            self.note(offset, "Game is between PIN '", pin1, "' and itself")
+        score = record.get(ecf_constants.SCORE)
+        if score is not None and score not in SCORES:
+            self.note(
+                offsets[ecf_constants.SCORE],
+                "SCORE '",
+                score,
+                "' is not one of ",
+                ", ".join(sorted(SCORES)),
+            )
+        colour = record.get(ecf_constants.COLOUR)
+        if colour is not None and colour.upper() not in COLOURS:
+            self.note(
+                offsets[ecf_constants.COLOUR],
+                "COLOUR '",
+                colour,
+                "' is not W or B",
+            )
+        for name in (ecf_constants.BOARD, ecf_constants.ROUND):
+            value = record.get(name)
+            if value is not None and not _is_positive_integer(value):
+                self.note(
+                    offsets[name],
+                    "Field '",
+                    name,
+                    "' value '",
+                    value,
+                    "' is not a positive integer",
+                )
+        gamedate = record.get(ecf_constants.NAME_GAME_DATE)
+        if gamedate is not None:
+            problem = self._check_date(gamedate)
+            if problem:
+                self.note(
+                    offsets[ecf_constants.NAME_GAME_DATE],
+                    "Game date '",
+                    gamedate,
+                    "' ",
+                    problem,
+                )
+        board = record.get(ecf_constants.BOARD)
+        round_ = record.get(ecf_constants.ROUND)
+        key = (self.section_name, pin1, pin2, board, round_, gamedate)
+        if key not in self.games:
+            self.games.add(key)
+        elif board or round_:
+            self.note(offset, "Game is repeated in section")
+        else:
+            self.warn(offset, "Game is repeated in section")
+
+    def _check_date(self, gamedate):
+        """Return problem with 'dd/mm/yyyy' gamedate or "" if none.
+
+        A blank gamedate is allowed because the date is optional.  The
+        problem found for each distinct date is remembered.
+
+        """
+        if not gamedate:
+            return ""
+        problem = self.dates.get(gamedate)
+        if problem is not None:
+            return problem
+        try:
+            date = datetime.datetime.strptime(gamedate, "%d/%m/%Y").date()
+        except ValueError:
+            problem = "is not a valid 'dd/mm/yyyy' date"
+        else:
+            if self.first is not None and date < self.first:
+                problem = "is before event date"
+            elif self.last is not None and date > self.last:
+                problem = "is after final result date"
+            else:
+                problem = ""
+        self.dates[gamedate] = problem
+        return problem
+
+    def _check_team(self):
+        """Check TeamList entry."""
+        key = (
+            self.record[constants.TEAM_SECTION],
+            self.record.get(constants.TEAM_NAME),
+        )
+        if key in self.teams:
+            self.note(
+                self.offsets[constants.TEAM_SECTION],
+                "TeamList entry for '",
+                str(key[1]),
+                "' in '",
+                key[0],
+                "' is repeated",
+            )
+        else:
+            self.teams.add(key)
+
+    def _check_person(self):
+        """Check PersonList entry."""
+        record = self.record
+        self._check_pin_reference(constants.PERSON_NUMBER)
+        key = (
+            record.get(constants.PERSON_NAME),
+            record.get(constants.PERSON_TEAM_SECTION),
+            record.get(constants.PERSON_TEAM_NAME),
+        )
+        if key in self.persons:
+            self.note(
+                self.offsets[constants.PERSON_NUMBER],
+                "PersonList entry for '",
+                str(key[0]),
+                "' is repeated",
+            )
+        else:
+            self.persons.add(key)
+
+
+def check_submission_file(folder, path=None):
+    """Return list of SubmissionFileError for problems in submission file.
+
+    path is the submission file in folder if None.  The event date range
+    is taken from the event details file in folder.
+
+    Values which are probably mistakes, but which the ECF may accept, are
+    reported as SubmissionFileWarning.
+
+    The errors are in file order and give the byte offset and line of the
+    field with the problem.  They are returned, not raised, so all the
+    problems can be reported together.
+
+    """
+    if path is None:
+        path = os.path.join(folder, constants.SUBMISSION)
+    checker = _IntegrityChecker(*read_event_date_range(folder))
+    add_field = checker.add_field
+    for name, value, offset in tokenize_file(path):
+        add_field(name, value, offset)
+    checker.flush()
+    if not checker.problems:
+        return []
+    problems = sorted(checker.problems, key=lambda problem: problem[0])
+    lines = line_numbers_at(path, (problem[0] for problem in problems))
+    return [
+        error_class(message, path=path, offset=offset, line=lines[offset])
+        for offset, message, error_class in problems
+    ]
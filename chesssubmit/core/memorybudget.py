@@ -0,0 +1,231 @@
+# memorybudget.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Limit the memory used while creating or reading a submission file.
+
+The budget is set, in megabytes, by the CHESSSUBMIT_MEMORY_BUDGET
+environment variable or the constants.MEMORY_BUDGET item in the user's
+configuration file.
+
+When a budget is set a MemoryBudgetTimer is used instead of a StageTimer.
+tracemalloc is started and a snapshot is taken at the end of each stage.
+The call sites which allocated most memory in the stage are added to the
+record written to the TIMING_LOG file, and MemoryBudgetExceeded is raised,
+naming the stage and call sites, if the memory held by Python objects
+exceeds the budget.
+
+The memory used is checked at the end of each stage, and every
+PROGRESS_INTERVAL game rows while rows are converted.
+
+"""
+import os
+import tracemalloc
+import contextlib
+
+from .timings import StageTimer, NULL_TIMER, timings_enabled
+
+# Environment variable giving the memory budget in megabytes.
+MEMORY_BUDGET_ENVIRONMENT_VARIABLE = "CHESSSUBMIT_MEMORY_BUDGET"
+
+# Number of call sites reported for each stage.
+TOP_CALL_SITES = 10
+
+_MEGABYTE = 1048576
+
+
+class MemoryBudgetExceeded(Exception):
+    """Raised when the memory used exceeds the memory budget."""
+
+
+def memory_budget(configuration_value=None):
+    """Return memory budget in bytes or None if there is no budget.
+
+    configuration_value is the value of constants.MEMORY_BUDGET in the
+    user's configuration file, or None if not known.  The environment
+    variable takes precedence if it is set.  Values which are not positive
+    numbers mean there is no budget.
+
+    """
+    value = os.environ.get(MEMORY_BUDGET_ENVIRONMENT_VARIABLE)
+    if value is None:
+        value = configuration_value
+    if not value:
+        return None
+    try:
+        megabytes = float(value)
+    except ValueError:
+        return None
+    if megabytes <= 0:
+        return None
+    return int(megabytes * _MEGABYTE)
+
+
+def _format_megabytes(size):
+    """Return size in bytes as text in megabytes."""
+    return "".join((format(size / _MEGABYTE, ".1f"), " MB"))
+
+
+def _call_sites(statistics):
+    """Return list of dicts describing tracemalloc StatisticDiff items."""
+    sites = []
+    for statistic in statistics:
+        frame = statistic.traceback[0]
+        sites.append(
+            {
+                "site": ":".join((frame.filename, str(frame.lineno))),
+                "size_diff": statistic.size_diff,
+                "count_diff": statistic.count_diff,
+            }
+        )
+    return sites
+
+
+class MemoryBudgetTimer(StageTimer):
+    """Time stages and record memory allocated in each stage.
+
+    tracemalloc is started when the instance is created, unless already
+    tracing, and stopped by the write method.
+
+    """
+
+    def __init__(self, operation, budget, top=TOP_CALL_SITES):
+        """Start timing operation and tracing memory against budget bytes."""
+        super().__init__(operation)
+        self.budget = budget
+        self.top = top
+        self.memory = []
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._snapshot = tracemalloc.take_snapshot()
+        self._stage_name = None
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time body of with statement as stage name and check memory."""
+        outer_stage_name = self._stage_name
+        self._stage_name = name
+        try:
+            with super().stage(name):
+                yield
+        finally:
+            self._stage_name = outer_stage_name
+        self._take_snapshot(name)
+
+    def check(self):
+        """Raise MemoryBudgetExceeded if memory used exceeds budget."""
+        if tracemalloc.get_traced_memory()[0] > self.budget:
+            self._take_snapshot(self._stage_name or "")
+
+    def _take_snapshot(self, name):
+        """Note memory allocated since previous snapshot and check budget.
+
+        The call sites allocating most memory are noted for stage name.
+
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        sites = _call_sites(
+            sorted(
+                snapshot.compare_to(self._snapshot, "lineno"),
+                key=lambda statistic: statistic.size_diff,
+                reverse=True,
+            )[: self.top]
+        )
+        self._snapshot = snapshot
+        self.memory.append(
+            {
+                "stage": name,
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top_call_sites": sites,
+            }
+        )
+        if current > self.budget:
+            raise MemoryBudgetExceeded(
+                "\n".join(
+                    [
+                        "".join(
+                            (
+                                "Memory used, ",
+                                _format_megabytes(current),
+                                ", exceeds budget of ",
+                                _format_megabytes(self.budget),
+                                " in stage '",
+                                name,
+                                "'.",
+                            )
+                        ),
+                        "",
+                        "".join(
+                            (
+                                "Counts: ",
+                                ", ".join(
+                                    "".join((key, " ", str(value)))
+                                    for key, value in self.counts.items()
+                                ),
+                            )
+                        ),
+                        "",
+                        "Largest allocations in stage:",
+                    ]
+                    + [
+                        "".join(
+                            (
+                                _format_megabytes(site["size_diff"]),
+                                "  ",
+                                site["site"],
+                            )
+                        )
+                        for site in sites
+                    ]
+                )
+            )
+
+    def record(self, outcome="ok"):
+        """Return dict of timings, counts, and memory, for the operation."""
+        record = super().record(outcome=outcome)
+        record["memory_budget_bytes"] = self.budget
+        record["memory"] = self.memory
+        return record
+
+    def write(self, folder, outcome="ok"):
+        """Stop tracing memory and append record to TIMING_LOG in folder."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        super().write(folder, outcome=outcome)
+
+
+def make_memory_budget_timer(operation, configuration_value=None):
+    """Return MemoryBudgetTimer for operation or None if no budget set."""
+    budget = memory_budget(configuration_value=configuration_value)
+    if budget is None:
+        return None
+    return MemoryBudgetTimer(operation, budget)
+
+
+def make_timer(operation, configuration_value=None, memory_budget_value=None):
+    """Return timer for operation, or timings.NULL_TIMER if timing is off.
+
+    A MemoryBudgetTimer is returned if a memory budget is set by
+    memory_budget_value, the value of constants.MEMORY_BUDGET in the user's
+    configuration file, or the memory budget environment variable.
+    Otherwise a timings.StageTimer is returned if timing is switched on by
+    configuration_value, the value of constants.RECORD_TIMINGS, or the
+    timings environment variable.
+
+    """
+    timer = make_memory_budget_timer(
+        operation, configuration_value=memory_budget_value
+    )
+    if timer is not None:
+        return timer
+    if timings_enabled(configuration_value=configuration_value):
+        return StageTimer(operation)
+    return NULL_TIMER
@@ -0,0 +1,263 @@
+# namematch.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Find spellings of a player's name which probably refer to one person.
+
+Match cards spell the same player's name in many ways and each spelling
+becomes a separate person in the submission.  A TrigramIndex holds the
+trigrams of each word of the names added, so a query touches only the names
+sharing a trigram with the name asked about rather than every name.
+
+The similarity of two names is the Dice coefficient of their trigram sets:
+twice the number of shared trigrams divided by the total number.  The words
+are padded so 'John Smith' and 'Smith, John' have the same trigrams, and
+names are compared in ratinglist.normalise_name form.
+
+propose_aliases groups the reported names of persons into proposed
+PersonAlias groupings, each with an ECF name if one of the known ECF names
+is similar enough.
+
+"""
+import collections
+
+from .ratinglist import normalise_name, split_surname
+
+# Minimum similarity for two spellings to be proposed as one person.
+ALIAS_THRESHOLD = 0.6
+
+# Minimum similarity for an ECF name to be proposed for a group.
+ECF_NAME_THRESHOLD = 0.7
+
+
+def trigrams(name):
+    """Return frozenset of trigrams of the words of name.
+
+    Each word is normalised and padded with two leading spaces and one
+    trailing space, so single letter initials give trigrams too.
+
+    """
+    grams = set()
+    for word in normalise_name(name).split():
+        padded = "".join(("  ", word, " "))
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """Inverted index from trigrams to the names containing them."""
+
+    def __init__(self, names=()):
+        """Create index of names."""
+        self.names = []
+        self.grams = []
+        self.sizes = []
+        self.postings = collections.defaultdict(list)
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        """Add name to index and return its number."""
+        number = len(self.names)
+        grams = trigrams(name)
+        self.names.append(name)
+        self.grams.append(grams)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings[gram].append(number)
+        return number
+
+    def query(self, name, threshold=ALIAS_THRESHOLD):
+        """Return list of (score, number) of names similar to name.
+
+        The list is in descending order of score and contains names with a
+        score of at least threshold.
+
+        Only the names in the postings of the trigrams of name are looked
+        at, and the shared trigrams are counted by one pass of each posting.
+
+        """
+        grams = trigrams(name)
+        if not grams:
+            return []
+        shared = collections.Counter()
+        postings = self.postings
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting:
+                shared.update(posting)
+        size = len(grams)
+        sizes = self.sizes
+        minimum = threshold / 2.0
+        matches = []
+        for number, count in shared.items():
+            score = count / (size + sizes[number])
+            if score >= minimum:
+                matches.append((score * 2.0, number))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return matches
+
+
+class AliasProposal:
+    """Proposed PersonAlias grouping of the spellings of a player's name.
+
+    alias is the spelling proposed as the PersonAlias value of all the
+    persons, keys is the list of (name, section, team) keys of the persons,
+    and score is the lowest similarity of a spelling to alias.
+
+    ecf_name and ecf_score are the most similar known ECF name and its
+    similarity to alias, or "" and 0.0 if none is similar enough.
+
+    """
+
+    __slots__ = ("alias", "keys", "score", "ecf_name", "ecf_score")
+
+    def __init__(self, alias, keys, score, ecf_name="", ecf_score=0.0):
+        """Note the proposed grouping."""
+        self.alias = alias
+        self.keys = keys
+        self.score = score
+        self.ecf_name = ecf_name
+        self.ecf_score = ecf_score
+
+
+def _split_for_matching(name):
+    """Return (trigrams of surname, first letter of forenames) of name."""
+    surname, forenames = split_surname(name)
+    return trigrams(surname), normalise_name(forenames)[:1]
+
+
+def _similarity(grams, other):
+    """Return Dice coefficient of trigram sets grams and other."""
+    if not grams and not other:
+        return 1.0
+    return 2.0 * len(grams & other) / (len(grams) + len(other))
+
+
+def _is_same_person(parts, other, threshold):
+    """Return True if names split into parts and other may be one person.
+
+    The surnames must score at least threshold and the first forenames
+    must have the same initial, so initials and double-barrelled surnames
+    do not join unrelated names.
+
+    """
+    if parts[1] and other[1] and parts[1] != other[1]:
+        return False
+    return _similarity(parts[0], other[0]) >= threshold
+
+
+def _best_ecf_name(ecf_index, ecf_parts, alias, threshold):
+    """Return (score, ECF name) most similar to alias or None if none."""
+    parts = _split_for_matching(alias)
+    for score, number in ecf_index.query(alias, threshold=threshold):
+        if _is_same_person(parts, ecf_parts[number], threshold):
+            return score, ecf_index.names[number]
+    return None
+
+
+def propose_aliases(
+    person_keys,
+    ecf_names=(),
+    threshold=ALIAS_THRESHOLD,
+    ecf_threshold=ECF_NAME_THRESHOLD,
+):
+    """Return list of AliasProposal for spellings in person_keys.
+
+    person_keys is an iterable of (name, section, team) keys as used in
+    Submission.persons, and ecf_names an iterable of known ECF names.
+
+    Spellings are compared only with others in the same section and team,
+    where the team is "" in events which are not matches, so each section
+    and team has its own index.  These are the groups in which resolve
+    follows PersonAlias links.  Each distinct name is queried once against
+    the index of its section and team.  A name joins the group of the first
+    earlier name, in descending order of number of persons with the name
+    and then of length, with which it scores at least threshold and passes
+    the checks of surname and initial in _is_same_person.  Only groups of
+    two or more spellings are proposed.  The ECF name proposed must pass
+    the same checks.
+
+    """
+    keys_by_team = collections.defaultdict(
+        lambda: collections.defaultdict(list)
+    )
+    for key in person_keys:
+        keys_by_team[key[1], key[2]][key[0]].append(key)
+    ecf_index = TrigramIndex(sorted(set(ecf_names)))
+    ecf_parts = [_split_for_matching(name) for name in ecf_index.names]
+    proposals = []
+    for team in sorted(keys_by_team):
+        keys_by_name = keys_by_team[team]
+        for alias, group in _group_spellings(keys_by_name, threshold):
+            keys = []
+            for score, name in group:
+                keys.extend(keys_by_name[name])
+            proposal = AliasProposal(
+                alias, sorted(keys), min(score for score, name in group)
+            )
+            match = _best_ecf_name(ecf_index, ecf_parts, alias, ecf_threshold)
+            if match is not None:
+                proposal.ecf_score, proposal.ecf_name = match
+            proposals.append(proposal)
+    proposals.sort(key=lambda proposal: (proposal.alias, proposal.keys))
+    return proposals
+
+
+def _group_spellings(keys_by_name, threshold):
+    """Yield (leader, [(score, name), ...]) for groups of similar names.
+
+    keys_by_name maps each name to the list of its person keys.  Only
+    groups of two or more names are given.
+
+    """
+    names = sorted(
+        keys_by_name,
+        key=lambda name: (-len(keys_by_name[name]), -len(name), name),
+    )
+    index = TrigramIndex(names)
+    parts = [_split_for_matching(name) for name in names]
+    assigned = set()
+    for number, name in enumerate(names):
+        if number in assigned:
+            continue
+        assigned.add(number)
+        group = [(1.0, name)]
+        for score, other in index.query(name, threshold=threshold):
+            if other in assigned:
+                continue
+            if not _is_same_person(parts[number], parts[other], threshold):
+                continue
+            assigned.add(other)
+            group.append((score, names[other]))
+        if len(group) > 1:
+            yield name, group
+
+
+def format_proposal(proposal):
+    """Return text describing proposal for review.
+
+    The alias and lowest score are followed by the persons proposed, each
+    as name, section, and team, and the ECF name if any.
+
+    """
+    text = [
+        proposal.alias,
+        " (",
+        format(proposal.score, ".2f"),
+        "): ",
+        "; ".join(
+            ", ".join(part for part in key if part) for key in proposal.keys
+        ),
+    ]
+    if proposal.ecf_name:
+        text.extend(
+            (
+                " -> ",
+                proposal.ecf_name,
+                " (",
+                format(proposal.ecf_score, ".2f"),
+                ")",
+            )
+        )
+    return "".join(text)
@@ -0,0 +1,98 @@
+# pinmap.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Keep the PIN given to each player in an event between regenerations.
+
+PINs are allocated to players in the order the game rows are processed, so
+without a record of previous allocations one added or corrected game could
+change the PIN of every player sorted after it.
+
+The map is saved in the event's folder as a CSV file with one row per
+player: PIN, name, section, and team.  PINs of players no longer present
+are kept so they are not given to a different player later.
+
+"""
+import os
+import csv
+
+from . import constants
+from .atomicfile import open_atomically
+
+
+class PinMap:
+    """Map (name, section, team) player keys to PINs for an event."""
+
+    def __init__(self, folder):
+        """Create PinMap for event in folder with PINs from the saved map.
+
+        folder - contains files of event data.
+
+        """
+        self.folder = folder
+        self.pins = {}
+        self._next_pin = 1  # PIN 0 reserved by ECF.
+        self._modified = False
+        self._read_pin_map()
+
+    @property
+    def path(self):
+        """Return path of file containing saved PIN map."""
+        return os.path.join(self.folder, constants.PIN_MAP)
+
+    def _read_pin_map(self):
+        """Read the saved PIN map if it exists."""
+        try:
+            with open(self.path, "r", newline="", encoding="utf-8") as file:
+                for row in csv.reader(file):
+                    if len(row) != 4:
+                        continue
+                    self._note_pin(tuple(row[1:]), row[0])
+        except FileNotFoundError:
+            pass
+
+    def _note_pin(self, key, pin):
+        """Record pin for player key and adjust next PIN to allocate."""
+        self.pins[key] = pin
+        if pin.isdigit():
+            self._next_pin = max(self._next_pin, int(pin) + 1)
+
+    def get_pin(self, key):
+        """Return PIN for player key, allocating a new one if necessary."""
+        pin = self.pins.get(key)
+        if pin is None:
+            pin = str(self._next_pin)
+            self._note_pin(key, pin)
+            self._modified = True
+        return pin
+
+    def update(self, players):
+        """Record PINs of Player instances in players dict.
+
+        Used to include PINs from an opened submission file, which may have
+        been edited, in the map.
+
+        """
+        for key, player in players.items():
+            if self.pins.get(key) != player.pin:
+                self._note_pin(key, player.pin)
+                self._modified = True
+
+    def write_pin_map(self):
+        """Write PIN map to file if changed since it was read."""
+        if not self._modified:
+            return
+        with open_atomically(self.path, encoding="utf-8") as file:
+            writer = csv.writer(file)
+            for key, pin in sorted(
+                self.pins.items(), key=lambda item: pin_order(item[1])
+            ):
+                writer.writerow((pin,) + key)
+        self._modified = False
+
+
+def pin_order(pin):
+    """Return sort key putting numeric PINs in numeric order."""
+    if pin.isdigit():
+        return (0, int(pin), pin)
+    return (1, 0, pin)
@@ -0,0 +1,143 @@
+# pipeline.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Create an event's submission file without a user interface.
+
+The steps are those done by the Submit button on the source document edit
+page: read and collate the games in the event's source documents, convert
+the games to ECF submission style, and write the submission file.
+
+The unfinished games, which are games reported as not finished and the
+later reports of their results, are collated by contentcache's
+collate_game_rows() for both, so the rows cached by either are used by
+the other.
+
+Nothing imported here, directly or indirectly, should import tkinter so
+the pipeline can run in batch jobs on servers without a display.
+
+"""
+
+import sqlite3
+
+from chessvalidate.core.season import Season
+
+from . import contentcache
+from .codestore import open_code_store
+from .ratinglist import open_rating_list
+from .submission import Submission, open_saved_edition
+from .memorybudget import make_timer
+
+
+class PipelineError(Exception):
+    """Report failure to read an event's source documents."""
+
+
+def open_results_data(folder):
+    """Return results data for the source documents in folder.
+
+    The results data is the same kind of object the user interface holds
+    for an open results folder: get_collated_games() returns the games to
+    be put in the submission.
+
+    """
+    results_data = Season(folder)
+    if not results_data.open_documents(None):
+        raise PipelineError(
+            " ".join(("Unable to read source documents in", folder))
+        )
+    return results_data
+
+
+def build_submission(folder, resolve_players=False, propose_aliases=False):
+    """Create the submission file for event in folder from its documents.
+
+    Return the Submission instance.
+
+    The source documents are read and collated only if they have changed
+    since the collated game rows were cached in folder.
+
+    Players linked by the PersonList entries are merged into one player if
+    resolve_players is True.  PersonAlias groupings of similar names are
+    put in the alias_proposals attribute of the Submission instance, but
+    not applied, if propose_aliases is True.
+
+    """
+    timer = make_timer("build_submission")
+    try:
+        with timer.stage("hash_source_documents"):
+            cache_key = contentcache.make_cache_key(folder)
+            rows = contentcache.read_cached_rows(folder, cache_key)
+        if rows is None:
+            with timer.stage("read_source_documents"):
+                results_data = open_results_data(folder)
+            with timer.stage("game_rows"):
+                rows = contentcache.collate_game_rows(results_data)
+            with timer.stage("write_game_rows_cache"):
+                try:
+                    contentcache.write_cached_rows(folder, cache_key, rows)
+                except (OSError, TypeError, ValueError):
+                    # The cache only saves collating the games again.
+                    pass
+        results = _generate_submission_from_rows(
+            folder,
+            rows,
+            timer,
+            resolve_players=resolve_players,
+            propose_aliases=propose_aliases,
+        )
+    except Exception as exc:
+        timer.write(folder, outcome=exc.__class__.__name__)
+        raise
+    timer.write(folder)
+    return results
+
+
+def _generate_submission_from_rows(
+    folder, rows, timer, resolve_players=False, propose_aliases=False
+):
+    """Convert game rows and write submission file in folder.
+
+    Return the Submission instance.
+
+    The PersonList and TeamList values given in the submission file
+    already in folder, if any, are kept.  Codes are taken from the code
+    store if the code store environment variable is set, and checked
+    against the imported rating list if there is one.
+
+    """
+    try:
+        code_store = open_code_store()
+    except sqlite3.Error:
+        # The code store only saves typing codes in later events.
+        code_store = None
+    rating_list = None
+    saved = None
+    unusable_rating_list = []
+    try:
+        rating_list = open_rating_list(problems=unusable_rating_list)
+        results = Submission(
+            folder,
+            timer=timer,
+            code_store=code_store,
+            rating_list=rating_list,
+        )
+        with timer.stage("read_saved_edition"):
+            saved = open_saved_edition(folder, timer=timer)
+        results.convert_rows_to_submission_style(rows, saved=saved)
+        results.rating_list_problems[:0] = unusable_rating_list
+        if resolve_players:
+            results.resolve_players()
+        results.write_entries_to_submission_file()
+        if propose_aliases:
+            results.alias_proposals = results.propose_person_aliases()
+    finally:
+        if code_store is not None:
+            code_store.close()
+        if rating_list is not None:
+            rating_list.close()
+        if saved is not None:
+            saved.close()
+    results.code_store = None
+    results.rating_list = None
+    return results
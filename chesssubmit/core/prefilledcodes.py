@@ -0,0 +1,58 @@
+# prefilledcodes.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Note the ECF codes filled in for persons rather than given by the user.
+
+Blank PersonECFCode values are filled in from the code store and the rating
+list when a submission is generated.  These codes are guesses: two players
+with the same name may be given the same code.  So they are not saved in
+the code store, and do not link persons into one player, unless the user
+changes them.
+
+The codes filled in are saved in the event's folder as a CSV file with one
+row per person: ECF code, name, section, and team.  The file is read when
+the submission is opened so the codes can be told apart from codes typed
+into the submission file.
+
+"""
+import os
+import csv
+
+from . import constants
+from .atomicfile import open_atomically
+
+
+def _get_path(folder):
+    """Return path of prefilled codes file in folder."""
+    return os.path.join(folder, constants.PREFILLED_CODES)
+
+
+def read_prefilled_codes(folder):
+    """Return dict of prefilled ECF codes keyed by (name, section, team)."""
+    codes = {}
+    try:
+        with open(
+            _get_path(folder), "r", newline="", encoding="utf-8"
+        ) as file:
+            for row in csv.reader(file):
+                if len(row) != 4:
+                    continue
+                codes[tuple(row[1:])] = row[0]
+    except FileNotFoundError:
+        pass
+    return codes
+
+
+def write_prefilled_codes(folder, codes):
+    """Save codes, a dict of ECF codes keyed by (name, section, team).
+
+    The file is not written if it already holds codes.
+
+    """
+    if codes == read_prefilled_codes(folder):
+        return
+    with open_atomically(_get_path(folder), encoding="utf-8") as file:
+        writer = csv.writer(file)
+        for key in sorted(codes):
+            writer.writerow((codes[key],) + key)
@@ -0,0 +1,385 @@
+# ratinglist.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Look up players in a local copy of the ECF rating list.
+
+A rating list CSV file downloaded from the ECF is imported into an index
+file, by default the file named by constants.RATING_LIST_INDEX in the
+user's home directory.  The index is memory mapped when used so only the
+pages touched by lookups are read.
+
+The layout is:
+
+MAGIC
+version: unsigned short
+entry count: unsigned int
+key count: unsigned int
+key offsets: for each key the file offset of its text, an unsigned int
+key entries: for each key the file offset of its entry, an unsigned int
+entries: for each player the UTF-8 encoded ECF code, name, club, and
+membership number, separated by tabs and ended by a newline
+keys: the UTF-8 encoded keys, each ended by a newline
+
+The keys are sorted so a key is found by binary search.  A key is 'C' and
+the ECF code, 'M' and the membership number, or 'N' and the normalised
+surname and first forename separated by a tab.  Several players may have
+the same name key.
+
+All numbers are little-endian.
+
+"""
+
+import os
+import re
+import csv
+import mmap
+import struct
+import warnings
+import unicodedata
+
+from . import constants
+from .atomicfile import open_atomically
+
+MAGIC = b"chesssubmit rating list\n"
+VERSION = 1
+
+CODE_KEY = "C"
+MEMBER_KEY = "M"
+NAME_KEY = "N"
+
+_HEADER = struct.Struct("<HII")
+_OFFSET = struct.Struct("<I")
+
+# Normalised CSV column names, in order of preference, for each value.
+_CODE_COLUMNS = ("ecfcode", "ecfref", "ref", "code")
+_NAME_COLUMNS = ("fullname", "name", "playername")
+_SURNAME_COLUMNS = ("surname", "lastname", "familyname")
+_FORENAME_COLUMNS = ("forename", "forenames", "firstname", "givenname")
+_CLUB_COLUMNS = ("clubname", "club")
+_MEMBER_COLUMNS = (
+    "memberno",
+    "membershipno",
+    "membershipnumber",
+    "memberid",
+    "ecfmemberno",
+)
+
+_non_alphanumeric = re.compile(r"[^0-9a-z ]+")
+
+
+class RatingListError(Exception):
+    """Raised when a rating list file or index cannot be used."""
+
+
+def default_index_path():
+    """Return path of rating list index file in user's home directory."""
+    return os.path.join(os.path.expanduser("~"), constants.RATING_LIST_INDEX)
+
+
+def normalise_name(text):
+    """Return text lower case without accents, punctuation, or extra space."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_non_alphanumeric.sub(" ", text.casefold()).split())
+
+
+def split_surname(name):
+    """Return (surname, forenames) of a player's name.
+
+    'Surname, Forenames' is the ECF style.  Otherwise the last word is
+    taken as the surname.
+
+    """
+    if "," in name:
+        surname, forenames = name.split(",", 1)
+        return surname, forenames
+    words = name.split()
+    if not words:
+        return "", ""
+    return words[-1], " ".join(words[:-1])
+
+
+def name_key(name):
+    """Return key of name: normalised surname and first forename."""
+    surname, forenames = split_surname(name)
+    forenames = normalise_name(forenames).split()
+    return "".join(
+        (
+            NAME_KEY,
+            normalise_name(surname),
+            "\t",
+            forenames[0] if forenames else "",
+        )
+    )
+
+
+def _find_column(columns, candidates):
+    """Return index in columns of first of candidates present or None."""
+    for candidate in candidates:
+        if candidate in columns:
+            return columns[candidate]
+    return None
+
+
+def _clean(value):
+    """Return value stripped with tabs and newlines replaced by spaces."""
+    return " ".join(value.split())
+
+
+def read_rating_list_csv(path, encoding="utf-8-sig"):
+    """Yield (ECF code, name, club, membership number) from CSV file.
+
+    The columns are found by their names in the first row.  The name is
+    taken from a full name column, or from surname and forename columns
+    as 'Surname, Forenames'.
+
+    """
+    with open(path, encoding=encoding, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise RatingListError(" ".join((path, "is empty")))
+        columns = {}
+        for index, title in enumerate(header):
+            columns.setdefault(
+                "".join(_non_alphanumeric.sub("", title.casefold()).split()),
+                index,
+            )
+        code = _find_column(columns, _CODE_COLUMNS)
+        name = _find_column(columns, _NAME_COLUMNS)
+        surname = _find_column(columns, _SURNAME_COLUMNS)
+        forename = _find_column(columns, _FORENAME_COLUMNS)
+        club = _find_column(columns, _CLUB_COLUMNS)
+        member = _find_column(columns, _MEMBER_COLUMNS)
+        if code is None or (name is None and surname is None):
+            raise RatingListError(
+                " ".join((path, "does not have ECF code and name columns"))
+            )
+        for row in reader:
+            if len(row) != len(header):
+                continue
+            if name is not None:
+                player = row[name]
+            elif forename is not None:
+                player = ", ".join((row[surname], row[forename]))
+            else:
+                player = row[surname]
+            yield (
+                _clean(row[code]),
+                _clean(player),
+                "" if club is None else _clean(row[club]),
+                "" if member is None else _clean(row[member]),
+            )
+
+
+def import_rating_list(csv_path, index_path=None, encoding="utf-8-sig"):
+    """Create rating list index from CSV file and return number of players.
+
+    index_path is default_index_path() if None.
+
+    """
+    if index_path is None:
+        index_path = default_index_path()
+    entries = sorted(
+        {
+            entry
+            for entry in read_rating_list_csv(csv_path, encoding=encoding)
+            if entry[0]
+        }
+    )
+    entry_blob = []
+    entry_offsets = []
+    offset = 0
+    for entry in entries:
+        data = "".join(("\t".join(entry), "\n")).encode("utf-8")
+        entry_offsets.append(offset)
+        entry_blob.append(data)
+        offset += len(data)
+    keys = []
+    for index, entry in enumerate(entries):
+        keys.append((CODE_KEY + entry[0], index))
+        keys.append((name_key(entry[1]), index))
+        if entry[3]:
+            keys.append((MEMBER_KEY + entry[3], index))
+    keys.sort()
+    key_blob = [b"".join((key[0].encode("utf-8"), b"\n")) for key in keys]
+    entries_start = len(MAGIC) + _HEADER.size + 2 * _OFFSET.size * len(keys)
+    keys_start = entries_start + offset
+    key_offsets = []
+    offset = keys_start
+    for data in key_blob:
+        key_offsets.append(offset)
+        offset += len(data)
+    if offset > 0xFFFFFFFF:
+        raise RatingListError("Rating list is too big for the index")
+    offsets_format = "".join(("<", str(len(keys)), "I"))
+    with open_atomically(index_path, mode="wb") as file:
+        file.write(MAGIC)
+        file.write(_HEADER.pack(VERSION, len(entries), len(keys)))
+        file.write(struct.pack(offsets_format, *key_offsets))
+        file.write(
+            struct.pack(
+                offsets_format,
+                *(entries_start + entry_offsets[key[1]] for key in keys),
+            )
+        )
+        file.write(b"".join(entry_blob))
+        file.write(b"".join(key_blob))
+    return len(entries)
+
+
+def open_rating_list(index_path=None, problems=None):
+    """Return RatingList for index_path, or None if there is no index.
+
+    None is also returned if the index cannot be used, for example because
+    it is damaged or for another version, so the rating list never stops
+    a submission being created.  The reason is appended to problems, or
+    given as a RuntimeWarning if problems is None.
+
+    """
+    if index_path is None:
+        index_path = default_index_path()
+    try:
+        return RatingList(index_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, RatingListError) as exc:
+        problem = "".join(
+            (
+                "Rating list index cannot be used so codes and names were ",
+                "not checked: ",
+                str(exc),
+            )
+        )
+        if problems is None:
+            warnings.warn(problem, RuntimeWarning)
+        else:
+            problems.append(problem)
+        return None
+
+
+class RatingList:
+    """Memory mapped rating list index.
+
+    close() must be called to release the mapping.
+
+    """
+
+    def __init__(self, path):
+        """Map rating list index at path.
+
+        FileNotFoundError is raised if there is no index, and
+        RatingListError if the file is not a rating list index.
+
+        """
+        self.path = path
+        self._map = None
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError as exc:
+                raise RatingListError(" ".join((path, "is empty"))) from exc
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise RatingListError(
+                " ".join((path, "is not a rating list index"))
+            )
+        try:
+            version, self.entry_count, self.key_count = _HEADER.unpack_from(
+                self._map, len(MAGIC)
+            )
+        except struct.error as exc:
+            self.close()
+            raise RatingListError(
+                " ".join((path, "rating list index header is incomplete"))
+            ) from exc
+        if version != VERSION:
+            self.close()
+            raise RatingListError(
+                " ".join((path, "is for another version of the index"))
+            )
+        self._key_offsets = len(MAGIC) + _HEADER.size
+        self._key_entries = self._key_offsets + _OFFSET.size * self.key_count
+
+    def __len__(self):
+        """Return number of players in rating list."""
+        return self.entry_count
+
+    def _get_line(self, offset):
+        """Return bytes at offset up to the next newline."""
+        return self._map[offset : self._map.find(b"\n", offset)]
+
+    def _get_key(self, index):
+        """Return bytes of key at index in sorted keys."""
+        (offset,) = _OFFSET.unpack_from(
+            self._map, self._key_offsets + _OFFSET.size * index
+        )
+        return self._get_line(offset)
+
+    def _get_entry(self, index):
+        """Return (code, name, club, membership number) for key at index."""
+        (offset,) = _OFFSET.unpack_from(
+            self._map, self._key_entries + _OFFSET.size * index
+        )
+        return tuple(self._get_line(offset).decode("utf-8").split("\t"))
+
+    def _find_first(self, target):
+        """Return index of first key not less than bytes target."""
+        low = 0
+        high = self.key_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, key):
+        """Return list of entries for key."""
+        target = key.encode("utf-8")
+        index = self._find_first(target)
+        entries = []
+        while index < self.key_count and self._get_key(index) == target:
+            entries.append(self._get_entry(index))
+            index += 1
+        return entries
+
+    def _find_prefix(self, prefix):
+        """Return list of entries for keys starting with prefix."""
+        target = prefix.encode("utf-8")
+        index = self._find_first(target)
+        entries = []
+        while index < self.key_count and self._get_key(index).startswith(
+            target
+        ):
+            entries.append(self._get_entry(index))
+            index += 1
+        return entries
+
+    def get_player_for_code(self, code):
+        """Return entry for ECF code or membership number or None."""
+        for kind in (CODE_KEY, MEMBER_KEY):
+            entries = self._find(kind + code)
+            if entries:
+                return entries[0]
+        return None
+
+    def get_players_for_name(self, name):
+        """Return list of entries with the surname and forename of name."""
+        return self._find(name_key(name))
+
+    def get_players_for_surname(self, surname):
+        """Return list of entries with surname, whatever their forenames."""
+        return self._find_prefix(
+            "".join((NAME_KEY, normalise_name(surname), "\t"))
+        )
+
+    def close(self):
+        """Release the memory map."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,222 @@
+# reconcile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Reconcile the entries of a Submission with manual work on the event.
+
+The manual work of earlier report editions is merged into a new edition by
+merge_saved_edition.  PersonAlias groupings of similar names are proposed,
+and applied when accepted, by propose_person_aliases and
+apply_alias_proposals.  The players linked by PersonList entries are merged
+by resolve_players.
+
+The functions take the Submission instance as their first argument: the
+Submission methods of the same names call them.
+
+"""
+
+from . import resolve
+from .ratinglist import normalise_name, split_surname
+
+
+class EditionMerge:
+    """Games added, removed, and changed, between two report editions.
+
+    The games are identified by the keys described in the
+    get_games_by_key() function.  repeated lists the keys given to more
+    than one game in the new edition.
+
+    """
+
+    def __init__(self):
+        """Initialise empty lists of game keys."""
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.repeated = []
+        self.unchanged = 0
+
+
+def resolve_players(submission):
+    """Merge players linked by PersonList entries into one player.
+
+    See resolve.resolve_players for the links followed.  The games of
+    merged players are given the PIN of the player kept.  PersonECFCode
+    values filled in from the code store or rating list are not links.
+
+    This is not done when a submission is generated: it is asked for
+    by the user when the links given in the PersonList are ready.
+
+    Return the number of players removed from submission.players.
+
+    """
+    with submission.timer.stage("resolve_players"):
+        removed = resolve.resolve_players(
+            submission.players,
+            submission.persons,
+            submission.events,
+            prefilled={
+                key
+                for key in submission.persons
+                if submission.is_code_prefilled(key)
+            },
+        )
+    submission.timer.count("merged_players", removed)
+    return removed
+
+
+def propose_person_aliases(submission, ecf_names=()):
+    """Return list of namematch.AliasProposal for spellings in persons.
+
+    Similar spellings of a name in the same section and team are proposed
+    as one person.  The proposed ECF name is chosen from ecf_names, the
+    PersonECFName values already given, and the names in
+    submission.rating_list, if not None, with the surname of a person.
+
+    The proposals are not applied: apply_alias_proposals sets the
+    PersonAlias values when the proposals are accepted.
+
+    """
+    # Imported here because proposals are needed only while editing.
+    from .namematch import propose_aliases
+
+    with submission.timer.stage("propose_person_aliases"):
+        known = {person.ecf_name for person in submission.persons.values()}
+        known.update(ecf_names)
+        rating_list = submission.rating_list
+        if rating_list is not None:
+            surnames = set()
+            for key, person in submission.persons.items():
+                for name in (key[0], person.alias):
+                    surnames.add(normalise_name(split_surname(name)[0]))
+            surnames.discard("")
+            for surname in surnames:
+                known.update(
+                    entry[1]
+                    for entry in rating_list.get_players_for_surname(surname)
+                )
+        known.discard("")
+        return propose_aliases(submission.persons, ecf_names=known)
+
+
+def apply_alias_proposals(submission, proposals):
+    """Set blank PersonAlias and PersonECFName values from proposals.
+
+    proposals is a list of namematch.AliasProposal.  Values already
+    given are not changed.  Return the number of persons changed.
+
+    """
+    changed = 0
+    for proposal in proposals:
+        for key in proposal.keys:
+            person = submission.persons.get(key)
+            if person is None:
+                continue
+            modified = False
+            if not person.alias:
+                person.alias = proposal.alias
+                modified = True
+            if proposal.ecf_name and not person.ecf_name:
+                person.ecf_name = proposal.ecf_name
+                modified = True
+            if modified:
+                changed += 1
+    return changed
+
+
+def merge_saved_edition(submission, saved):
+    """Merge manual work in saved, report edition <n>, into submission.
+
+    submission is expected to be report edition <n+1> created by
+    convert_document_to_submission_style and saved is expected to be
+    the Submission read from the saved state by open_saved_edition.
+
+    Persons are joined on the (name, section, team) key and their
+    PersonAlias, PersonECFName, and PersonECFCode, values are taken
+    from saved where they are not blank in saved.  Teams are joined on
+    the (section, team) key and their TeamClubName and TeamClubCode
+    values are taken from saved where they are not blank in saved.  A
+    PersonECFCode filled in, rather than given by the user, in saved
+    is noted as filled in for submission too.
+
+    Games are joined on the section name, the keys of both players,
+    and the board or round, to report the games added, removed, and
+    changed between editions.  Several games may have the same key,
+    for example when two players meet twice in a section without
+    rounds, so the games with a key are compared as a group and keys
+    with more than one game in submission are listed as repeated.
+
+    The joins are done with dicts so the time taken is proportional
+    to the number of entries in both editions.
+
+    Return an EditionMerge instance describing the games.
+
+    """
+    persons = submission.persons
+    prefilled_codes = submission.prefilled_codes
+    for key, saved_person in saved.persons.items():
+        person = persons.get(key)
+        if person is None:
+            continue
+        if saved_person.alias:
+            person.alias = saved_person.alias
+        if saved_person.ecf_name:
+            person.ecf_name = saved_person.ecf_name
+        if saved_person.ecf_code:
+            person.ecf_code = saved_person.ecf_code
+            if saved.is_code_prefilled(key):
+                prefilled_codes[key] = saved_person.ecf_code
+            else:
+                prefilled_codes.pop(key, None)
+    teams = submission.teams
+    for key, saved_team in saved.teams.items():
+        team = teams.get(key)
+        if team is None:
+            continue
+        if saved_team.club_name:
+            team.club_name = saved_team.club_name
+        if saved_team.club_code:
+            team.club_code = saved_team.club_code
+    new_games = get_games_by_key(submission)
+    saved_games = get_games_by_key(saved)
+    merge = EditionMerge()
+    for key, games in new_games.items():
+        if len(games) > 1:
+            merge.repeated.append(key)
+        saved_group = saved_games.get(key)
+        if saved_group is None:
+            merge.added.append(key)
+        elif sorted(games) != sorted(saved_group):
+            merge.changed.append(key)
+        else:
+            merge.unchanged += len(games)
+    merge.removed.extend(k for k in saved_games if k not in new_games)
+    return merge
+
+
+def get_games_by_key(submission):
+    """Return dict of lists of game details keyed by section and players.
+
+    The key is (section name, player1 key, player2 key, board or round)
+    where the player keys are the (name, section, team) keys of
+    submission.players, because PINs are not comparable between editions.
+
+    """
+    player_keys = {player: key for key, player in submission.players.items()}
+    games = {}
+    for event in submission.events.values():
+        for sections in event.values():
+            for section_name, entries in sections.items():
+                for game in entries:
+                    key = (
+                        section_name,
+                        player_keys.get(game.player1),
+                        player_keys.get(game.player2),
+                        game.board,
+                        game.round_,
+                    )
+                    group = games.get(key)
+                    if group is None:
+                        group = games[key] = []
+                    group.append(game.result_values())
+    return games
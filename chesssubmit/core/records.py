@@ -0,0 +1,230 @@
+# records.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Player, Person, Team, and Game, records held by a Submission instance.
+
+The records hold field values and render the ECF submission style text for
+an entry only when asked, usually when the submission file is written.  The
+values can be edited in place.
+
+The (name, section, team) and (section, team) keys of the dicts holding
+Person and Team records are not repeated in the records: they are given to
+the methods which render these entries.
+
+The edit_fields attribute of Player, Person, and Team, lists the attributes
+which may be edited by update_record(), with the field names used for them
+in the submission file.
+
+"""
+
+from ecfformat.core import constants as ecf_constants
+
+from . import constants
+
+
+class Player:
+    """Player List entry for a player."""
+
+    __slots__ = ("pin", "codes", "name", "club", "club_code")
+
+    edit_fields = (
+        ("name", ecf_constants.NAME),
+        ("club", ecf_constants.CLUB),
+        ("club_code", ecf_constants.NAME_CLUB_CODE),
+    )
+
+    def __init__(self, pin, codes, name, club="", club_code=""):
+        r"""Set Player List field values.
+
+        club_code is probably left as default because there is no pattern
+        which reliably picks club codes (4 characters) but not 4 character
+        club names.  Most club codes are \d\S\S\S so a mis-typed first
+        character could give a club name, for example.
+
+        """
+        self.pin = pin
+        self.codes = codes
+        self.name = name
+        self.club = club
+        self.club_code = club_code
+
+    def player_list_entry(self):
+        """Return ECF submission file player list entry."""
+        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
+        return ecf_constants.FIELD_SEPARATOR.join(
+            (
+                "\n",
+                nvsep.join((ecf_constants.PIN, self.pin)),
+                nvsep.join((ecf_constants.NAME_ECF_CODE, self.codes)),
+                nvsep.join((ecf_constants.NAME, self.name)),
+                nvsep.join((ecf_constants.CLUB, self.club)),
+                nvsep.join((ecf_constants.NAME_CLUB_CODE, self.club_code)),
+            )
+        )
+
+
+class Person:
+    """PersonList entry for a player as reported."""
+
+    __slots__ = ("pin", "codes", "alias", "ecf_name", "ecf_code")
+
+    edit_fields = (
+        ("alias", constants.PERSON_ALIAS),
+        ("ecf_name", constants.PERSON_ECF_NAME),
+        ("ecf_code", constants.PERSON_ECF_CODE),
+    )
+
+    def __init__(self, pin, codes=None, alias="", ecf_name="", ecf_code=""):
+        """Set PersonList field values.
+
+        codes is the set of codes reported with the player's name.
+
+        """
+        self.pin = pin
+        self.codes = set() if codes is None else codes
+        self.alias = alias
+        self.ecf_name = ecf_name
+        self.ecf_code = ecf_code
+
+    def person_list_entry(self, key):
+        """Return submission file person list entry for key.
+
+        key is the (name, section, team) tuple for the person.
+
+        """
+        name, section, team = key
+        fsep = ecf_constants.FIELD_SEPARATOR
+        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
+        if self.codes:
+            codes = fsep.join(
+                nvsep.join((constants.PERSON_CODE, c))
+                for c in sorted(self.codes)
+            )
+        else:
+            codes = nvsep.join((constants.PERSON_CODE, ""))
+        return fsep.join(
+            (
+                "\n",
+                nvsep.join((constants.PERSON_NUMBER, self.pin)),
+                nvsep.join((constants.PERSON_NAME, name)),
+                nvsep.join((constants.PERSON_TEAM_SECTION, section)),
+                nvsep.join((constants.PERSON_TEAM_NAME, team)),
+                nvsep.join((constants.PERSON_ALIAS, self.alias)),
+                nvsep.join((constants.PERSON_ECF_NAME, self.ecf_name)),
+                nvsep.join((constants.PERSON_ECF_CODE, self.ecf_code)),
+                codes,
+            )
+        )
+
+
+class Team:
+    """TeamList entry for a team as reported."""
+
+    __slots__ = ("club_name", "club_code")
+
+    edit_fields = (
+        ("club_name", constants.TEAM_CLUB_NAME),
+        ("club_code", constants.TEAM_CLUB_CODE),
+    )
+
+    def __init__(self, club_name="", club_code=""):
+        """Set TeamList field values."""
+        self.club_name = club_name
+        self.club_code = club_code
+
+    def team_list_entry(self, key):
+        """Return submission file team list entry for (section, team) key."""
+        section, team = key
+        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
+        return ecf_constants.FIELD_SEPARATOR.join(
+            (
+                "\n",
+                nvsep.join((constants.TEAM_SECTION, section)),
+                nvsep.join((constants.TEAM_NAME, team)),
+                nvsep.join((constants.TEAM_CLUB_NAME, self.club_name)),
+                nvsep.join((constants.TEAM_CLUB_CODE, self.club_code)),
+            )
+        )
+
+
+class Game:
+    """Result Details entry for a game.
+
+    player1 and player2 are Player instances so the PINs rendered are the
+    current PINs of the players.
+
+    score and date are in ECF submission style: the mapping from reported
+    values is done when the Game is created.
+
+    """
+
+    __slots__ = (
+        "player1",
+        "score",
+        "player2",
+        "date",
+        "colour",
+        "round_",
+        "board",
+    )
+
+    # This method gets a too-many-arguments message from pylint.
+    # The game entry requires five mandatory, and two optional, items
+    # of information; and these should have helpful names in the argument
+    # list.
+    # The date and colour items are optional downstream, when the
+    # information is sent to the ECF, but it is best if they are always
+    # present.
+    def __init__(
+        self, player1, score, player2, date, colour, round_=None, board=None
+    ):
+        """Set Result Details field values."""
+        self.player1 = player1
+        self.score = score
+        self.player2 = player2
+        self.date = date
+        self.colour = colour
+        self.round_ = round_
+        self.board = board
+
+    def game_list_entry(self):
+        """Return ECF submission file game list entry."""
+        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
+        fields = [
+            "\n",
+            nvsep.join((ecf_constants.NAME_PIN1, self.player1.pin)),
+            nvsep.join((ecf_constants.SCORE, self.score)),
+            nvsep.join((ecf_constants.NAME_PIN2, self.player2.pin)),
+        ]
+        if self.round_ is not None:
+            fields.append(nvsep.join((ecf_constants.ROUND, self.round_)))
+        elif self.board is not None:
+            fields.append(nvsep.join((ecf_constants.BOARD, self.board)))
+        fields.append(nvsep.join((ecf_constants.NAME_GAME_DATE, self.date)))
+        fields.append(nvsep.join((ecf_constants.COLOUR, self.colour)))
+        return ecf_constants.FIELD_SEPARATOR.join(fields)
+
+    def result_values(self):
+        """Return (score, date, colour) for comparing editions of a game."""
+        return (self.score, self.date, self.colour)
+
+
+def update_record(record, values):
+    """Set attributes of record from values and return True if any changed.
+
+    values maps attribute names to new values.  Only the attributes in the
+    record's edit_fields are set, and surrounding whitespace is removed from
+    the new values.
+
+    """
+    changed = False
+    for item in record.edit_fields:
+        attribute = item[0]
+        if attribute not in values:
+            continue
+        value = values[attribute].strip()
+        if getattr(record, attribute) != value:
+            setattr(record, attribute, value)
+            changed = True
+    return changed
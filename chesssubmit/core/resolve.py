@@ -0,0 +1,161 @@
+# resolve.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Resolve the persons of a submission which are one real player.
+
+One real player may be reported under several (name, section, team) keys:
+by different spellings of the name, or after a transfer between teams.  The
+PersonList entries link these keys: entries with the same PersonECFCode, or
+with the same PersonNumber, are one player.  So are entries in the same
+section and team with the same PersonAlias, or with a PersonAlias equal to
+the name of the other entry.
+
+Only values given by the user are links.  PersonECFCode values filled in
+from the code store or rating list are not links because players with the
+same name in different teams may have been given the same code.
+PersonECFName values are not links because different players can have the
+same name, and PersonAlias values are not links between teams for the same
+reason.
+
+The links are put in a disjoint-set structure so chains of links of any
+length are resolved in near linear time.  Each set keeps the Player with
+the lowest PIN, so the PINs of players already submitted do not change
+when later games add spellings.  The other Players are removed from the
+Player List and the games are pointed at the kept Player in one pass.
+
+"""
+from .pinmap import pin_order
+
+
+class DisjointSet:
+    """Disjoint sets of the integers 0 to size - 1.
+
+    Union by size and path halving keep find() almost constant time.
+
+    """
+
+    def __init__(self, size):
+        """Create size sets each containing one integer."""
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item):
+        """Return the representative of the set containing item."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item, other):
+        """Merge the sets containing item and other."""
+        item = self.find(item)
+        other = self.find(other)
+        if item == other:
+            return
+        size = self.size
+        if size[item] < size[other]:
+            item, other = other, item
+        self.parent[other] = item
+        size[item] += size[other]
+
+
+def _link_on_values(sets, values):
+    """Join the sets of indexes with equal values.
+
+    values is an iterable of (value, index): empty values are ignored.
+    A value may be a tuple so links can be limited to a section and team.
+
+    """
+    first = {}
+    for value, index in values:
+        if not value:
+            continue
+        earlier = first.setdefault(value, index)
+        if earlier != index:
+            sets.union(earlier, index)
+
+
+def resolve_players(players, persons, events, prefilled=()):
+    """Merge the Players in players which are one real player.
+
+    players and persons are dicts of Player and Person keyed by
+    (name, section, team), and events is the dict of games as held by a
+    Submission.  All are modified in place: the Person entries of a merged
+    player are given the kept player's PIN.
+
+    prefilled is a container of the keys of persons whose PersonECFCode
+    was filled in rather than given by the user.
+
+    Return the number of Players removed.
+
+    """
+    keys = list(persons)
+    index_of = {key: index for index, key in enumerate(keys)}
+    sets = DisjointSet(len(keys))
+    _link_on_values(
+        sets,
+        (
+            (persons[key].ecf_code.strip(), index)
+            for key, index in index_of.items()
+            if key not in prefilled
+        ),
+    )
+    _link_on_values(
+        sets,
+        (
+            (persons[key].pin.strip(), index)
+            for key, index in index_of.items()
+        ),
+    )
+    _link_on_values(
+        sets,
+        (
+            ((persons[key].alias.strip(),) + key[1:], index)
+            for key, index in index_of.items()
+            if persons[key].alias.strip()
+        ),
+    )
+    for key, index in index_of.items():
+        alias = persons[key].alias
+        if alias and alias != key[0]:
+            other = index_of.get((alias,) + key[1:])
+            if other is not None:
+                sets.union(index, other)
+
+    # Choose the Player with the lowest PIN in each set.
+    kept = {}
+    for key, index in index_of.items():
+        player = players.get(key)
+        if player is None:
+            continue
+        root = sets.find(index)
+        current = kept.get(root)
+        if current is None or (
+            pin_order(player.pin) < pin_order(current.pin)
+        ):
+            kept[root] = player
+
+    replacement = {}
+    for key, index in index_of.items():
+        player = kept.get(sets.find(index))
+        if player is None:
+            continue
+        persons[key].pin = player.pin
+        own = players.get(key)
+        if own is not None and own is not player:
+            replacement[own] = player
+            del players[key]
+    if not replacement:
+        return 0
+
+    # One pass over the games.
+    get_player = replacement.get
+    for event in events.values():
+        for sections in event.values():
+            for games in sections.values():
+                for game in games:
+                    game.player1 = get_player(game.player1, game.player1)
+                    game.player2 = get_player(game.player2, game.player2)
+    return len(replacement)
@@ -0,0 +1,265 @@
+# sectionindex.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Access the sections of a submission file without reading all the file.
+
+The submission file is memory mapped and an index giving the byte range of
+each section is kept in the SUBMISSION_INDEX file beside it.  The sections
+are the PLAYER LIST, each MATCH RESULTS, SECTION RESULTS, and OTHER
+RESULTS, section, FINISH, the TeamList, PersonList, and Final, headers,
+and each entry in the TeamList and PersonList blocks.
+
+The index of a TeamList or PersonList entry includes the key of the Team
+or Person record for the entry in a Submission instance, so the record can
+be found from the entry.
+
+The index is built by a scan of the mapped file for section header fields
+when it does not exist or does not match the size and modification time of
+the submission file.  Afterwards the text of any section is found from the
+index without reading the rest of the file.
+
+"""
+
+import os
+import re
+import json
+import mmap
+import locale
+
+from ecfformat.core import constants as ecf_constants
+
+from . import constants
+from .atomicfile import open_atomically
+from .tokenizer import make_token
+
+# Version of the index file layout: an index with another version is built
+# again.
+INDEX_VERSION = 2
+
+# Field names which start a section.
+SECTION_NAMES = (
+    ecf_constants.NAME_PLAYER_LIST,
+    ecf_constants.NAME_MATCH_RESULTS,
+    ecf_constants.NAME_SECTION_RESULTS,
+    ecf_constants.NAME_OTHER_RESULTS,
+    ecf_constants.FINISH,
+    constants.TEAM_LIST,
+    constants.PERSON_LIST,
+    constants.FINAL,
+)
+
+# Field names which start an entry in the TeamList or PersonList blocks, and
+# the field names giving the key of the Team or Person record for the entry.
+ENTRY_KEYS = {
+    constants.TEAM_SECTION: (constants.TEAM_SECTION, constants.TEAM_NAME),
+    constants.PERSON_NUMBER: (
+        constants.PERSON_NAME,
+        constants.PERSON_TEAM_SECTION,
+        constants.PERSON_TEAM_NAME,
+    ),
+}
+
+
+def _section_header_pattern(encoding):
+    """Return compiled bytes regular expression matching section headers.
+
+    Group 1 is the field name, and group 2 the value if any, of the header
+    field which starts after the field separator.
+
+    """
+    fsep = re.escape(ecf_constants.FIELD_SEPARATOR.encode(encoding))
+    nvsep = re.escape(ecf_constants.NAME_VALUE_SEPARATOR.encode(encoding))
+    names = b"|".join(
+        re.escape(name.encode(encoding))
+        for name in sorted(
+            SECTION_NAMES + tuple(ENTRY_KEYS), key=len, reverse=True
+        )
+    )
+    return re.compile(
+        b"".join(
+            (
+                fsep,
+                rb"\s*(",
+                names,
+                rb")\s*(?:",
+                nvsep,
+                rb"([^",
+                fsep,
+                rb"]*))?(?=",
+                fsep,
+                rb"|\Z)",
+            )
+        )
+    )
+
+
+def build_section_index(data, encoding):
+    """Return list of [field name, value, start, end, key] for sections.
+
+    data is a bytes-like object, usually a mmap of a submission file.
+    start is the offset of the field separator before the section header
+    and end the offset of the field separator before the next section.
+    key is the list of values of the ENTRY_KEYS fields for TeamList and
+    PersonList entries, or None for other sections.
+
+    """
+    sections = []
+    for match in _section_header_pattern(encoding).finditer(data):
+        if sections:
+            sections[-1][3] = match.start()
+        value = match.group(2)
+        sections.append(
+            [
+                match.group(1).decode(encoding),
+                "" if value is None else value.decode(encoding).strip(),
+                match.start(),
+                len(data),
+                None,
+            ]
+        )
+    for section in sections:
+        key_names = ENTRY_KEYS.get(section[0])
+        if key_names is not None:
+            fields = get_fields(data, section[2], section[3], encoding)
+            section[4] = [fields.get(name, "") for name in key_names]
+    return sections
+
+
+def get_fields(data, start, end, encoding):
+    """Return dict of field values by name for fields in data[start:end].
+
+    The last value is kept if a name is repeated.
+
+    """
+    fsep = ecf_constants.FIELD_SEPARATOR.encode(encoding)
+    nvsep = ecf_constants.NAME_VALUE_SEPARATOR.encode(encoding)
+    fields = {}
+    for field in data[start:end].split(fsep):
+        token = make_token(field, nvsep, encoding)
+        if token is not None:
+            fields[token[0]] = token[1]
+    return fields
+
+
+class SubmissionSections:
+    """Memory mapped submission file with index of sections.
+
+    close() must be called to release the mapping before the submission
+    file can be replaced on some platforms.
+
+    """
+
+    def __init__(self, folder, encoding=None):
+        """Map submission file in folder and read or build section index.
+
+        FileNotFoundError is raised if there is no submission file.
+
+        """
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        self.folder = folder
+        self.encoding = encoding
+        self.path = os.path.join(folder, constants.SUBMISSION)
+        self.index_path = os.path.join(folder, constants.SUBMISSION_INDEX)
+        # The mapping does not need the file to stay open.
+        with open(self.path, "rb") as file:
+            status = os.fstat(file.fileno())
+            if status.st_size:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                self._map = b""
+        try:
+            self.sections = self._read_index(status)
+            if self.sections is None:
+                self.sections = build_section_index(self._map, encoding)
+                self._write_index(status)
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_index(self, status):
+        """Return sections from index file or None if stale or missing."""
+        try:
+            with open(self.index_path, encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict):
+            return None
+        if (
+            index.get("version") != INDEX_VERSION
+            or index.get("size") != status.st_size
+            or index.get("mtime_ns") != status.st_mtime_ns
+            or index.get("encoding") != self.encoding
+        ):
+            return None
+        return index.get("sections")
+
+    def _write_index(self, status):
+        """Save index of sections for submission file with status."""
+        try:
+            with open_atomically(self.index_path, encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "version": INDEX_VERSION,
+                        "size": status.st_size,
+                        "mtime_ns": status.st_mtime_ns,
+                        "encoding": self.encoding,
+                        "sections": self.sections,
+                    },
+                    file,
+                    separators=(",", ":"),
+                )
+        except OSError:
+            # The index is only a cache: it is built again next time.
+            pass
+
+    def __len__(self):
+        """Return number of sections."""
+        return len(self.sections)
+
+    def get_section_titles(self):
+        """Return list of 'name=value' titles, or 'name', of sections.
+
+        The titles of TeamList and PersonList entries are their indented
+        record keys.
+
+        """
+        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
+        titles = []
+        for section in self.sections:
+            name, value = section[:2]
+            key = section[4]
+            if key is not None:
+                titles.append("".join(("    ", " / ".join(key))))
+            else:
+                titles.append(nvsep.join((name, value)) if value else name)
+        return titles
+
+    def get_section_name(self, index):
+        """Return field name of header of section at index in sections."""
+        return self.sections[index][0]
+
+    def get_section_key(self, index):
+        """Return record key of entry at index in sections, or None.
+
+        The key is a tuple for TeamList and PersonList entries, as in the
+        dicts of Team and Person records of a Submission instance.
+
+        """
+        key = self.sections[index][4]
+        return None if key is None else tuple(key)
+
+    def get_section_text(self, index):
+        """Return text of section at index in sections."""
+        start, end = self.sections[index][2:4]
+        return self._map[start:end].decode(self.encoding)
+
+    def close(self):
+        """Release the memory map of the submission file."""
+        if isinstance(getattr(self, "_map", None), mmap.mmap):
+            self._map.close()
+        self._map = b""
@@ -0,0 +1,314 @@
+# snapshot.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Save and load the state of a Submission in a compact binary file.
+
+The snapshot is saved beside the submission file whenever the submission
+file is written, or read and parsed, and holds the players, events,
+persons, and teams, of the Submission with the SHA-256 hash of the
+submission file.  A snapshot is used only if the hash matches the current
+submission file, so parsing the text can be avoided when reopening an
+unchanged submission.
+
+The layout is:
+
+MAGIC
+version: unsigned short
+SHA-256 digest of submission file: 32 bytes
+string count: unsigned int
+strings: for each string its length in bytes as an unsigned int and the
+UTF-8 encoded value.  String 0 is None and is not in the file.
+records: tag: 1 byte, field count: unsigned short, then for each field
+the index of its value in the strings as an unsigned int.
+
+Each distinct string is held once, so the many repeated PINs, dates, and
+section names, in the games take four bytes each.
+
+The last record has tag END and gives the number of player, person,
+team, and game, records so a truncated snapshot is detected.
+
+All numbers are little-endian.
+
+"""
+import os
+import struct
+import functools
+
+from . import constants
+from .atomicfile import open_atomically
+from .records import Player, Person, Team, Game
+
+MAGIC = b"chesssubmit snapshot\n"
+VERSION = 1
+
+PLAYER = b"P"
+PERSON = b"N"
+TEAM = b"T"
+GAME = b"G"
+END = b"E"
+
+_HEADER = struct.Struct("<H32s")
+_RECORD = struct.Struct("<cH")
+_LENGTH = struct.Struct("<I")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is not a valid snapshot."""
+
+
+def snapshot_path(folder):
+    """Return path of the snapshot file in folder."""
+    return os.path.join(folder, constants.SUBMISSION_SNAPSHOT)
+
+
+class _StringTable:
+    """Allocate indexes of strings, with None at index 0, for records."""
+
+    def __init__(self):
+        """Initialise table with None at index 0."""
+        self.indexes = {None: 0}
+        self.records = []
+
+    def add_record(self, tag, fields):
+        """Append packed record with tag and indexes of fields."""
+        indexes = self.indexes
+        values = []
+        for field in fields:
+            index = indexes.get(field)
+            if index is None:
+                index = indexes[field] = len(indexes)
+            values.append(index)
+        self.records.append(_RECORD.pack(tag, len(values)))
+        self.records.append(struct.pack(_index_format(len(values)), *values))
+
+    def pack(self):
+        """Return bytes of string table followed by records."""
+        pieces = [_LENGTH.pack(len(self.indexes) - 1)]
+        for string in self.indexes:
+            if string is None:
+                continue
+            data = string.encode("utf-8")
+            pieces.append(_LENGTH.pack(len(data)))
+            pieces.append(data)
+        pieces.extend(self.records)
+        return b"".join(pieces)
+
+
+@functools.lru_cache(maxsize=None)
+def _index_format(count):
+    """Return struct format for count string indexes."""
+    return "".join(("<", str(count), "I"))
+
+
+def _unpack_strings(data, offset):
+    """Return (list of strings with None first, offset after strings)."""
+    (count,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    strings = [None]
+    length_unpack_from = _LENGTH.unpack_from
+    length_size = _LENGTH.size
+    size = len(data)
+    for index in range(count):
+        del index
+        (length,) = length_unpack_from(data, offset)
+        offset += length_size
+        end = offset + length
+        if end > size:
+            raise SnapshotError("Snapshot ends inside the string table")
+        strings.append(data[offset:end].decode("utf-8"))
+        offset = end
+    return strings, offset
+
+
+def _unpack_records(data, offset, strings):
+    """Yield (tag, fields) for records in data starting at offset."""
+    size = len(data)
+    record_unpack_from = _RECORD.unpack_from
+    record_size = _RECORD.size
+    get_string = strings.__getitem__
+    while offset < size:
+        tag, count = record_unpack_from(data, offset)
+        offset += record_size
+        indexes = struct.unpack_from(_index_format(count), data, offset)
+        offset += count * 4
+        yield tag, list(map(get_string, indexes))
+
+
+def save_snapshot(folder, digest, players, events, persons, teams):
+    """Save snapshot of players, events, persons, and teams, in folder.
+
+    digest is the SHA-256 digest of the submission file holding the same
+    data.
+
+    """
+    table = _StringTable()
+    add_record = table.add_record
+    for key, player in players.items():
+        add_record(
+            PLAYER,
+            key
+            + (
+                player.pin,
+                player.codes,
+                player.name,
+                player.club,
+                player.club_code,
+            ),
+        )
+    for key, person in persons.items():
+        add_record(
+            PERSON,
+            key
+            + (person.pin, person.alias, person.ecf_name, person.ecf_code)
+            + tuple(sorted(person.codes)),
+        )
+    for key, team in teams.items():
+        add_record(TEAM, key + (team.club_name, team.club_code))
+    game_count = 0
+    for event_name, event in events.items():
+        for section_key, section in event.items():
+            for section_name, games in section.items():
+                for game in games:
+                    add_record(
+                        GAME,
+                        (
+                            event_name,
+                            section_key,
+                            section_name,
+                            game.player1.pin,
+                            game.score,
+                            game.player2.pin,
+                            game.date,
+                            game.colour,
+                            game.round_,
+                            game.board,
+                        ),
+                    )
+                game_count += len(games)
+    add_record(
+        END,
+        tuple(
+            str(count)
+            for count in (len(players), len(persons), len(teams), game_count)
+        ),
+    )
+    with open_atomically(snapshot_path(folder), mode="wb") as file:
+        file.write(MAGIC)
+        file.write(_HEADER.pack(VERSION, digest))
+        file.write(table.pack())
+
+
+def read_snapshot_digest(folder):
+    """Return submission file digest in snapshot header, or None if none."""
+    try:
+        with open(snapshot_path(folder), "rb") as file:
+            header = file.read(len(MAGIC) + _HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(header) != len(MAGIC) + _HEADER.size:
+        return None
+    if not header.startswith(MAGIC):
+        return None
+    version, digest = _HEADER.unpack_from(header, len(MAGIC))
+    if version != VERSION:
+        return None
+    return digest
+
+
+def load_snapshot(folder, digest, player_for_pin):
+    """Return (players, events, persons, teams) from snapshot in folder.
+
+    None is returned if there is no snapshot, or the snapshot is for a
+    submission file with a different SHA-256 digest than digest, or is
+    for a different version of the layout.
+
+    player_for_pin(pin_players, pin) returns the Player for pin in the
+    pin_players dict, adding one if necessary, for the players in games.
+
+    SnapshotError is raised if the snapshot is damaged.
+
+    """
+    try:
+        with open(snapshot_path(folder), "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    if not data.startswith(MAGIC):
+        raise SnapshotError("File is not a submission snapshot")
+    try:
+        version, snapshot_digest = _HEADER.unpack_from(data, len(MAGIC))
+    except struct.error as exc:
+        raise SnapshotError("Snapshot header is incomplete") from exc
+    if version != VERSION or snapshot_digest != digest:
+        return None
+    players = {}
+    events = {}
+    persons = {}
+    teams = {}
+    pin_players = None
+    game_count = 0
+    counts = None
+    try:
+        strings, offset = _unpack_strings(data, len(MAGIC) + _HEADER.size)
+        for tag, fields in _unpack_records(data, offset, strings):
+            if counts is not None:
+                raise SnapshotError("Snapshot has records after the end")
+            if tag == GAME:
+                if pin_players is None:
+                    pin_players = {}
+                    for player in players.values():
+                        pin_players.setdefault(player.pin, player)
+                (
+                    event_name,
+                    section_key,
+                    section_name,
+                    pin1,
+                    score,
+                    pin2,
+                    date,
+                    colour,
+                    round_,
+                    board,
+                ) = fields
+                events.setdefault(event_name, {}).setdefault(
+                    section_key, {}
+                ).setdefault(section_name, []).append(
+                    Game(
+                        player_for_pin(pin_players, pin1),
+                        score,
+                        player_for_pin(pin_players, pin2),
+                        date,
+                        colour,
+                        round_=round_,
+                        board=board,
+                    )
+                )
+                game_count += 1
+            elif tag == PLAYER:
+                players[tuple(fields[:3])] = Player(*fields[3:])
+            elif tag == PERSON:
+                persons[tuple(fields[:3])] = Person(
+                    fields[3],
+                    codes=set(fields[7:]),
+                    alias=fields[4],
+                    ecf_name=fields[5],
+                    ecf_code=fields[6],
+                )
+            elif tag == TEAM:
+                teams[tuple(fields[:2])] = Team(*fields[2:])
+            elif tag == END:
+                counts = tuple(int(count) for count in fields)
+            else:
+                raise SnapshotError("Snapshot has a record of unknown type")
+    except (
+        struct.error,
+        UnicodeDecodeError,
+        ValueError,
+        TypeError,
+        IndexError,
+    ) as exc:
+        raise SnapshotError("Snapshot record is damaged") from exc
+    if counts != (len(players), len(persons), len(teams), game_count):
+        raise SnapshotError("Snapshot is incomplete")
+    return players, events, persons, teams
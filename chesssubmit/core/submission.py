@@ -17,91 +17,64 @@ Sometimes just the saved state will be worked on: when the ECF submission
 is prepared in several sessions.
 
 """
+
 import os
+import locale
+import sqlite3
+import hashlib
+import operator
 
 from ecfformat.core import constants as ecf_constants
 
-from chessvalidate.core.gameobjects import (
-    get_game_rows_for_csv_format,
-    split_codes_from_name,
-)
 from chessvalidate.core.gameresults import resultmapecf
 
 from ..core import constants
-
-_next_fields = {
-    True: frozenset((ecf_constants.NAME_PLAYER_LIST,)),
-    ecf_constants.NAME_PLAYER_LIST: frozenset(
-        (
-            ecf_constants.PIN,
-            ecf_constants.NAME_MATCH_RESULTS,
-            ecf_constants.NAME_OTHER_RESULTS,
-            ecf_constants.NAME_SECTION_RESULTS,
-            ecf_constants.FINISH,
-        )
-    ),
-    ecf_constants.PIN: frozenset((ecf_constants.NAME_ECF_CODE,)),
-    ecf_constants.NAME_ECF_CODE: frozenset((ecf_constants.NAME,)),
-    ecf_constants.NAME: frozenset((ecf_constants.CLUB,)),
-    ecf_constants.CLUB: frozenset((ecf_constants.NAME_CLUB_CODE,)),
-    ecf_constants.NAME_CLUB_CODE: frozenset(
-        (
-            ecf_constants.PIN,
-            ecf_constants.NAME_MATCH_RESULTS,
-            ecf_constants.NAME_OTHER_RESULTS,
-            ecf_constants.NAME_SECTION_RESULTS,
-            ecf_constants.FINISH,
+from .pinmap import PinMap
+from .atomicfile import open_atomically, write_blocks
+from .records import Player, Person, Team, Game
+from .submissionloader import load_submission_file, get_player_for_pin
+from .canonical import canonical_string, split_name_and_codes
+from .gamedates import make_game_date_converter, GameDateError
+from .timings import NULL_TIMER
+from .contentcache import collate_game_rows, file_digest
+from .ratinglist import normalise_name
+from .prefilledcodes import read_prefilled_codes, write_prefilled_codes
+from . import snapshot
+from . import reconcile
+
+_get_game_row_values = operator.itemgetter(
+    *(
+        constants.TABULAR_REPORT_ROW_ORDER.index(name)
+        for name in (
+            constants.REPORT_EVENT,
+            constants.REPORT_SECTION,
+            constants.REPORT_HOME_TEAM,
+            constants.REPORT_AWAY_TEAM,
+            constants.REPORT_ROUND,
+            constants.REPORT_BOARD,
+            constants.REPORT_HOME_PLAYER,
+            constants.REPORT_AWAY_PLAYER,
+            constants.REPORT_DATE,
+            constants.REPORT_HOME_PLAYER_COLOUR,
+            constants.REPORT_RESULT,
         )
-    ),
-    ecf_constants.NAME_MATCH_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
-    ecf_constants.NAME_OTHER_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
-    ecf_constants.NAME_SECTION_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
-    ecf_constants.NAME_PIN1: frozenset((ecf_constants.SCORE,)),
-    ecf_constants.SCORE: frozenset((ecf_constants.NAME_PIN2,)),
-    ecf_constants.NAME_PIN2: frozenset(
-        (
-            ecf_constants.BOARD,
-            ecf_constants.ROUND,
-            ecf_constants.NAME_GAME_DATE,
-        )
-    ),
-    ecf_constants.BOARD: frozenset((ecf_constants.NAME_GAME_DATE,)),
-    ecf_constants.ROUND: frozenset((ecf_constants.NAME_GAME_DATE,)),
-    ecf_constants.NAME_GAME_DATE: frozenset((ecf_constants.COLOUR,)),
-    ecf_constants.COLOUR: frozenset(
-        (
-            ecf_constants.NAME_PIN1,
-            ecf_constants.NAME_MATCH_RESULTS,
-            ecf_constants.NAME_OTHER_RESULTS,
-            ecf_constants.NAME_SECTION_RESULTS,
-            ecf_constants.FINISH,
-        )
-    ),
-    ecf_constants.FINISH: frozenset((constants.TEAM_LIST, constants.FINAL)),
-    constants.TEAM_LIST: frozenset(
-        (constants.TEAM_SECTION, constants.PERSON_LIST)
-    ),
-    constants.TEAM_SECTION: frozenset((constants.TEAM_NAME,)),
-    constants.TEAM_NAME: frozenset((constants.TEAM_CLUB_NAME,)),
-    constants.TEAM_CLUB_NAME: frozenset((constants.TEAM_CLUB_CODE,)),
-    constants.TEAM_CLUB_CODE: frozenset(
-        (constants.TEAM_SECTION, constants.PERSON_LIST)
-    ),
-    constants.PERSON_LIST: frozenset(
-        (constants.PERSON_NUMBER, constants.FINAL)
-    ),
-    constants.PERSON_NUMBER: frozenset((constants.PERSON_NAME,)),
-    constants.PERSON_NAME: frozenset((constants.PERSON_TEAM_SECTION,)),
-    constants.PERSON_TEAM_SECTION: frozenset((constants.PERSON_TEAM_NAME,)),
-    constants.PERSON_TEAM_NAME: frozenset((constants.PERSON_ALIAS,)),
-    constants.PERSON_ALIAS: frozenset((constants.PERSON_ECF_NAME,)),
-    constants.PERSON_ECF_NAME: frozenset((constants.PERSON_ECF_CODE,)),
-    constants.PERSON_ECF_CODE: frozenset((constants.PERSON_CODE,)),
-    constants.PERSON_CODE: frozenset(
-        (constants.PERSON_CODE, constants.PERSON_NUMBER, constants.FINAL)
-    ),
-    constants.FINAL: False,
-}
+    )
+)
+
+# Number of game rows converted between calls to progress function.
+PROGRESS_INTERVAL = 1000
+
+
+class SubmissionCancelled(Exception):
+    """Raised by a progress function to stop creation of a submission."""
+
+
+def _describe_person(key):
+    """Return description of PersonList entry with key for messages."""
+    name, section, team = key
+    if team:
+        return "".join((name, " (", section, ", ", team, ")"))
+    return "".join((name, " (", section, ")"))
 
 
 class Submission:
@@ -128,10 +101,18 @@ class Submission:
 
     """
 
-    def __init__(self, folder):
+    def __init__(
+        self, folder, timer=NULL_TIMER, code_store=None, rating_list=None
+    ):
         """Create Submission instance for event results in folder.
 
         folder - contains files of event data.
+        timer - timings.StageTimer which records time taken by each stage,
+        or timings.NULL_TIMER to not record timings.
+        code_store - codestore.CodeStore giving codes found in earlier
+        events, or None if codes are not remembered between events.
+        rating_list - ratinglist.RatingList used to check and fill in ECF
+        codes and names, or None if there is no rating list.
 
         """
         self.folder = folder
@@ -139,31 +120,48 @@ class Submission:
         self.events = {}
         self.persons = {}
         self.teams = {}
+        self.pin_map = None
+        self.date_converter = None
+        self.timer = timer
+        self.code_store = code_store
+        self.rating_list = rating_list
+        self.rating_list_problems = []
+        self.prefilled_codes = {}
+        self.edition_merge = None
+        self.alias_proposals = []
 
     def open_documents(self, parent):
-        """Extract data from tkinter.Text.dump() file and return True if ok."""
-        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
-        with open(
-            os.path.join(self.folder, constants.SUBMISSION), "r", newline=""
-        ) as file:
-            current_field = True
-            for field in file.read().split(ecf_constants.FIELD_SEPARATOR):
-                field = field.split(nvsep)
-                name = field[0].strip()
-                if len(field) == 2:
-                    value = field[1].strip()
-                else:
-                    value = ""
-                    if not name:
-                        continue
-                if name not in _next_fields[current_field]:
-                    return False
-                current_field = name
-            if _next_fields[current_field]:
-                return False
+        """Extract data from submission file and return True if ok.
+
+        The file is read in chunks and the sequence of field names is
+        checked as each field arrives.  The same pass collects the values
+        which are put in self.players, self.events, self.persons, and
+        self.teams, keyed as by convert_document_to_submission_style.
+
+        The submission file does not record the event name, so the games
+        are put in self.events under the key "".  The section is found
+        from the PersonList entry of the first player in each game.
+
+        tokenizer.SubmissionFileError is raised, giving the byte offset
+        and line of the field, if the field names are not in the order
+        required.
+
+        """
+        del parent
+        path = os.path.join(self.folder, constants.SUBMISSION)
+        with self.timer.stage("read_submission_file"):
+            loader = load_submission_file(path)
+        with self.timer.stage("populate"):
+            loader.populate(
+                self.players, self.events, self.persons, self.teams
+            )
+        self.prefilled_codes = read_prefilled_codes(self.folder)
+        self.count_entries()
         return True
 
-    def convert_document_to_submission_style(self, results_data):
+    def convert_document_to_submission_style(
+        self, results_data, progress=None, saved=None
+    ):
         """Generate text lines for the games in game rows.
 
         Stubs for Player List entries are put in self.players, keyed to be
@@ -179,134 +177,367 @@ class Submission:
         The teams, as reported, are put in self.teams, keyed to be
         sorted into alphabetic order by team name.
 
+        Players keep the PINs given in earlier generations of the event's
+        submission file, which are held in self.pin_map.
+
+        The PersonList and TeamList values in saved, the Submission read
+        from the submission file by open_saved_edition, are merged into
+        self by reconcile.merge_saved_edition if saved is not None.  The
+        description of the games added, removed, and changed, is put in
+        self.edition_merge.
+
+        Persons and teams are given codes found in earlier events if
+        self.code_store is not None.  Then ECF codes and names are checked
+        against self.rating_list, if not None, and the problems found are
+        put in self.rating_list_problems.
+
+        Game dates are checked by self.date_converter and GameDateError is
+        raised, after all games are converted, listing every problem date.
+
+        progress, if not None, is called as progress(rows done, total rows)
+        every PROGRESS_INTERVAL rows and when all rows are done.  It may
+        raise SubmissionCancelled to stop the conversion.
+
         """
-        trro = {
-            item: i
-            for i, item in enumerate(constants.TABULAR_REPORT_ROW_ORDER)
-        }
-        for row in sorted(
-            get_game_rows_for_csv_format(results_data.get_collated_games())
-        ):
-            self._process_csv_row({item: row[trro[item]] for item in trro})
-
-    def _process_csv_row(self, row):
-        """Collate row in section in events."""
-        events = self.events
-        if row[constants.REPORT_HOME_PLAYER] is None:
-            row[constants.REPORT_HOME_PLAYER] = ""
-        if row[constants.REPORT_AWAY_PLAYER] is None:
-            row[constants.REPORT_AWAY_PLAYER] = ""
-        if row[constants.REPORT_EVENT] not in events:
-            events[row[constants.REPORT_EVENT]] = {}
-        event = events[row[constants.REPORT_EVENT]]
-        if row[constants.REPORT_SECTION] not in event:
-            event[row[constants.REPORT_SECTION]] = {}
-        section = event[row[constants.REPORT_SECTION]]
-        player1 = self._create_home_player_entries_for_row(row)
-        player2 = self._create_away_player_entries_for_row(row)
+        with self.timer.stage("game_rows"):
+            rows = collate_game_rows(results_data)
+        self.convert_rows_to_submission_style(
+            rows, progress=progress, saved=saved
+        )
+
+    def convert_rows_to_submission_style(
+        self, rows, progress=None, saved=None
+    ):
+        """Generate entries for game rows in TABULAR_REPORT_ROW_ORDER order.
+
+        This is the part of convert_document_to_submission_style done after
+        the game rows have been extracted from the results data: see that
+        method for description of arguments and exceptions.
+
+        """
+        timer = self.timer
+        with timer.stage("read_event_files"):
+            if self.pin_map is None:
+                self.pin_map = PinMap(self.folder)
+            if self.date_converter is None:
+                self.date_converter = make_game_date_converter(self.folder)
+        section_names = {}
+        with timer.stage("sort_rows"):
+            rows = sorted(rows)
+        total = len(rows)
+        timer.count("rows", total)
+        with timer.stage("process_rows"):
+            for count, row in enumerate(rows):
+                if not count % PROGRESS_INTERVAL:
+                    timer.check()
+                    if progress is not None:
+                        progress(count, total)
+                self._process_csv_row(_GameRow(row), section_names)
+        if saved is not None:
+            with timer.stage("merge_saved_edition"):
+                self.edition_merge = reconcile.merge_saved_edition(self, saved)
+        if self.code_store is not None:
+            with timer.stage("prefill_codes"):
+                try:
+                    self.prefill_codes()
+                except sqlite3.Error:
+                    # The code store only saves typing codes so carry on
+                    # without it.
+                    self.code_store = None
+        if self.rating_list is not None:
+            with timer.stage("check_rating_list"):
+                self.rating_list_problems = self.check_rating_list()
+        if progress is not None:
+            progress(total, total)
+        self.count_entries()
+        report = self.date_converter.report()
+        if report:
+            raise GameDateError(
+                "\n\n".join(("Problems with game dates:", report))
+            )
+
+    def _process_csv_row(self, row, section_names):
+        """Collate row in section in events.
+
+        row is a _GameRow instance.
+
+        section_names caches the section name for each match or section
+        so the name is built once, not once per game.
+
+        """
+        event = self.events.get(row.event)
+        if event is None:
+            event = self.events[row.event] = {}
+        section = event.get(row.section)
+        if section is None:
+            section = event[row.section] = {}
+        player1 = self._create_player_entries_for_row(
+            row.home_player, row.section, row.home_team
+        )
+        player2 = self._create_player_entries_for_row(
+            row.away_player, row.section, row.away_team
+        )
         if player1 is None or player2 is None:
             return
-        players = self.players
-        if row[constants.REPORT_HOME_TEAM] and row[constants.REPORT_AWAY_TEAM]:
-            section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
-                (
-                    ecf_constants.NAME_MATCH_RESULTS,
-                    " - ".join(
-                        (
-                            row[constants.REPORT_HOME_TEAM],
-                            row[constants.REPORT_AWAY_TEAM],
-                        )
-                    ),
-                )
+        if row.home_team and row.away_team:
+            section_name = self._get_section_name(
+                section_names,
+                ecf_constants.NAME_MATCH_RESULTS,
+                (row.home_team, row.away_team),
             )
             game = self._create_game_list_entry(
-                players[player1][0],
-                row[constants.REPORT_RESULT],
-                players[player2][0],
-                row[constants.REPORT_DATE],
-                row[constants.REPORT_HOME_PLAYER_COLOUR],
-                board=row[constants.REPORT_BOARD],
+                player1,
+                row.result,
+                player2,
+                row.date,
+                row.colour,
+                board=row.board,
             )
-        elif row[constants.REPORT_ROUND] is not None:
-            section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
-                (
-                    ecf_constants.NAME_SECTION_RESULTS,
-                    row[constants.REPORT_SECTION],
-                )
+        elif row.round_ is not None:
+            section_name = self._get_section_name(
+                section_names, ecf_constants.NAME_SECTION_RESULTS, row.section
             )
             game = self._create_game_list_entry(
-                players[player1][0],
-                row[constants.REPORT_RESULT],
-                players[player2][0],
-                row[constants.REPORT_DATE],
-                row[constants.REPORT_HOME_PLAYER_COLOUR],
-                round_=row[constants.REPORT_ROUND],
+                player1,
+                row.result,
+                player2,
+                row.date,
+                row.colour,
+                round_=row.round_,
             )
         else:
-            section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
-                (
-                    ecf_constants.NAME_OTHER_RESULTS,
-                    row[constants.REPORT_SECTION],
-                )
+            section_name = self._get_section_name(
+                section_names, ecf_constants.NAME_OTHER_RESULTS, row.section
             )
             game = self._create_game_list_entry(
-                players[player1][0],
-                row[constants.REPORT_RESULT],
-                players[player2][0],
-                row[constants.REPORT_DATE],
-                row[constants.REPORT_HOME_PLAYER_COLOUR],
+                player1,
+                row.result,
+                player2,
+                row.date,
+                row.colour,
             )
-        if section_name not in section:
-            section[section_name] = []
-        section[section_name].append(game)
-
-    def _create_away_player_entries_for_row(self, row):
-        """Add away details to players, events, persons, and teams."""
-        return self._create_player_entries_for_row(
-            row, constants.REPORT_AWAY_PLAYER, constants.REPORT_AWAY_TEAM
-        )
+        games = section.get(section_name)
+        if games is None:
+            games = section[section_name] = []
+        games.append(game)
 
-    def _create_home_player_entries_for_row(self, row):
-        """Add home details to players, events, persons, and teams."""
-        return self._create_player_entries_for_row(
-            row, constants.REPORT_HOME_PLAYER, constants.REPORT_HOME_TEAM
-        )
+    @staticmethod
+    def _get_section_name(section_names, kind, value):
+        """Return section name for kind of results section and value.
+
+        value is a section name, or a (home team, away team) tuple for
+        MATCH RESULTS sections.
+
+        """
+        key = (kind, value)
+        section_name = section_names.get(key)
+        if section_name is None:
+            if kind == ecf_constants.NAME_MATCH_RESULTS:
+                value = " - ".join(value)
+            section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
+                (kind, value)
+            )
+            section_names[key] = section_name
+        return section_name
+
+    def _create_player_entries_for_row(self, player, section, team):
+        """Add details to players, persons, and teams, and return Player.
 
-    def _create_player_entries_for_row(self, row, player, team):
-        """Add  details to players, events, persons, and teams."""
-        name, codes = split_codes_from_name(row[player])
+        None is returned if player name is blank.
+
+        """
+        name, codes = split_name_and_codes(player)
         if not name:
             return None
-        person = (
+        person = (name, section, team)  # team is "" unless MATCH SECTION.
+        entry = self.players.get(person)
+        if entry is not None:
+            if codes:
+                self.persons[person].codes.update(codes)
+            return entry
+        pin = self.pin_map.get_pin(person)
+        entry = Player(
+            pin,
+            " ".join(codes),  # Probably put "" here.
             name,
-            row[constants.REPORT_SECTION],
-            row[team],  # "" unless MATCH SECTION.
+            club=team,  # Probably keep for name duplication.
         )
-        players = self.players
-        if person not in players:
-            pin = str(len(players) + 1)  # PIN 0 reserved by ECF.
-            players[person] = (
-                pin,
-                self._create_player_list_entry(
-                    pin,
-                    " ".join(codes),  # Probably put "" here.
-                    name,
-                    club=row[team],  # Probably keep for name duplication.
-                ),
-            )
-        else:
-            pin = players[person][0]
+        self.players[person] = entry
         persons = self.persons
         if person not in persons:
-            persons[person] = (pin, set())
+            persons[person] = Person(pin)
         if codes:
-            reported_codes = persons[person][1]
-            reported_codes.update(codes)
+            persons[person].codes.update(codes)
         teams = self.teams
         team = person[1:]
         if team not in teams:
-            teams[team] = self._create_team_list_entry(*team)
-        return person
+            teams[team] = Team()
+        return entry
+
+    def prefill_codes(self):
+        """Fill blank person and team codes from self.code_store.
+
+        PersonECFCode and PersonECFName, and TeamClubCode and TeamClubName,
+        values are set only where the code is blank.  The PersonECFCode
+        values set are noted in self.prefilled_codes.
+
+        """
+        code_store = self.code_store
+        prefilled_codes = self.prefilled_codes
+        for key, person in self.persons.items():
+            if person.ecf_code:
+                continue
+            found = code_store.get_person_code(key[0], key[2])
+            if found is None:
+                continue
+            person.ecf_code = found[0]
+            prefilled_codes[key] = found[0]
+            if not person.ecf_name:
+                person.ecf_name = found[1]
+        for key, team in self.teams.items():
+            if team.club_code or not key[1]:
+                continue
+            found = code_store.get_team_code(key[1])
+            if found is None:
+                continue
+            if not team.club_name:
+                team.club_name = found[0]
+            team.club_code = found[1]
+
+    def record_codes(self):
+        """Save person and team codes in self.code_store for later events.
+
+        PersonECFCode values which are still the values filled in from the
+        code store or rating list are not saved: only codes given by the
+        user are saved.
+
+        """
+        with self.timer.stage("record_codes"):
+            self.code_store.record_persons(
+                {
+                    key: person
+                    for key, person in self.persons.items()
+                    if not self.is_code_prefilled(key)
+                }
+            )
+            self.code_store.record_teams(self.teams)
+
+    def is_code_prefilled(self, key):
+        """Return True if PersonECFCode of person key was filled in.
+
+        The code was filled in from the code store or rating list, and has
+        not been changed, if it is the code in self.prefilled_codes.
+
+        """
+        code = self.prefilled_codes.get(key)
+        return code is not None and code == self.persons[key].ecf_code
+
+    def check_rating_list(self):
+        """Check and fill in ECF codes and names from self.rating_list.
+
+        A PersonECFCode value must be in the rating list, and a blank
+        PersonECFName is given the name in the rating list for the code.
+
+        A blank PersonECFCode is filled in if the codes reported with the
+        player's name, or else the PersonAlias or name, identify exactly
+        one player in the rating list.  The codes filled in are noted in
+        self.prefilled_codes.
+
+        Return a list of problems: codes not in the rating list, and ECF
+        names which differ from the rating list.
+
+        """
+        rating_list = self.rating_list
+        problems = []
+        for key, person in self.persons.items():
+            for code in sorted(person.codes):
+                if rating_list.get_player_for_code(code) is None:
+                    problems.append(
+                        "".join(
+                            (
+                                "Reported code '",
+                                code,
+                                "' is not in the rating list: ",
+                                _describe_person(key),
+                            )
+                        )
+                    )
+            if person.ecf_code:
+                entry = rating_list.get_player_for_code(person.ecf_code)
+                if entry is None:
+                    problems.append(
+                        "".join(
+                            (
+                                constants.PERSON_ECF_CODE,
+                                " '",
+                                person.ecf_code,
+                                "' is not in the rating list: ",
+                                _describe_person(key),
+                            )
+                        )
+                    )
+                elif not person.ecf_name:
+                    person.ecf_name = entry[1]
+                elif normalise_name(person.ecf_name) != normalise_name(
+                    entry[1]
+                ):
+                    problems.append(
+                        "".join(
+                            (
+                                constants.PERSON_ECF_NAME,
+                                " '",
+                                person.ecf_name,
+                                "' is '",
+                                entry[1],
+                                "' in the rating list: ",
+                                _describe_person(key),
+                            )
+                        )
+                    )
+                continue
+            entries = {
+                entry
+                for entry in map(rating_list.get_player_for_code, person.codes)
+                if entry is not None
+            }
+            if not entries:
+                entries = set(
+                    rating_list.get_players_for_name(person.alias or key[0])
+                )
+            if len(entries) != 1:
+                continue
+            entry = entries.pop()
+            person.ecf_code = entry[0]
+            self.prefilled_codes[key] = entry[0]
+            if not person.ecf_name:
+                person.ecf_name = entry[1]
+        return problems
+
+    def resolve_players(self):
+        """Merge players linked by PersonList entries into one player.
+
+        See reconcile.resolve_players.  Return the number of players
+        removed from self.players.
+
+        """
+        return reconcile.resolve_players(self)
+
+    def propose_person_aliases(self, ecf_names=()):
+        """Return list of namematch.AliasProposal for spellings in persons.
+
+        See reconcile.propose_person_aliases.
+
+        """
+        return reconcile.propose_person_aliases(self, ecf_names=ecf_names)
+
+    def apply_alias_proposals(self, proposals):
+        """Set blank PersonAlias and PersonECFName values from proposals.
+
+        See reconcile.apply_alias_proposals.  Return the number of persons
+        changed.
+
+        """
+        return reconcile.apply_alias_proposals(self, proposals)
 
     def write_entries_to_submission_file(self):
         """Write players, events, teams, and persons, to lines file.
@@ -315,97 +546,202 @@ class Submission:
         prepended to the submission data when an actual submission file
         is created for upload to ECF.
 
-        """
-        fsep = ecf_constants.FIELD_SEPARATOR
-        players = self.players
-        events = self.events
-        persons = self.persons
-        teams = self.teams
-        with open(
-            os.path.join(self.folder, constants.SUBMISSION), "w", newline=""
-        ) as file:
-            file.write("".join((fsep, ecf_constants.NAME_PLAYER_LIST)))
-            for item in sorted(players):
-                file.write(players[item][-1])
-            for item in sorted(events):
-                event = events[item]
-                for subevent in sorted(event):
-                    sections = event[subevent]
-                    for section in sections:
-                        file.write(fsep.join(("\n", section)))
-                        file.write("".join(sections[section]))
-            file.write(fsep.join(("\n", ecf_constants.FINISH)))
-            file.write(fsep.join(("\n", constants.TEAM_LIST)))
-            for item in sorted(teams.items()):
-                file.write(item[1])
-            file.write(fsep.join(("\n", constants.PERSON_LIST)))
-            for item in sorted(persons.items()):
-                file.write(self._create_person_list_entry(*item))
-            file.write(fsep.join(("\n", constants.FINAL)))
+        The file is replaced atomically: a reader sees the old or the new
+        file, never a partly written one.
 
-    @staticmethod
-    def _create_player_list_entry(pin, codes, name, club="", clubcode=""):
-        r"""Return ECF submission file player list entry.
+        The PINs of the players are saved in the event's PIN map file, and
+        the ECF codes filled in for persons in the prefilled codes file.
+
+        The time recorded by self.timer for writing the submission file
+        includes the time, also recorded separately, spent formatting it.
 
-        clubcode is probably left as default because there is no pattern
-        which reliably picks club codes (4 characters) but not 4 character
-        club names.  Most club codes are \d\S\S\S so a mis-typed first
-        character could give a club name, for example.
+        The submission file is not replaced if it already contains the text
+        which would be written.  Return True if the file was replaced.
 
         """
-        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
-        return ecf_constants.FIELD_SEPARATOR.join(
-            (
-                "\n",
-                nvsep.join((ecf_constants.PIN, pin)),
-                nvsep.join((ecf_constants.NAME_ECF_CODE, codes)),
-                nvsep.join((ecf_constants.NAME, name)),
-                nvsep.join((ecf_constants.CLUB, club)),
-                nvsep.join((ecf_constants.NAME_CLUB_CODE, clubcode)),
+        timer = self.timer
+        path = os.path.join(self.folder, constants.SUBMISSION)
+        with timer.stage("write_submission_file"):
+            digest, replaced = self._write_submission_file(path)
+        with timer.stage("write_pin_map"):
+            if self.pin_map is None:
+                self.pin_map = PinMap(self.folder)
+            self.pin_map.update(self.players)
+            self.pin_map.write_pin_map()
+        with timer.stage("write_prefilled_codes"):
+            write_prefilled_codes(
+                self.folder,
+                {
+                    key: code
+                    for key, code in self.prefilled_codes.items()
+                    if key in self.persons and self.is_code_prefilled(key)
+                },
             )
-        )
+        with timer.stage("write_snapshot"):
+            if (
+                replaced
+                or snapshot.read_snapshot_digest(self.folder) != digest
+            ):
+                try:
+                    self.save_snapshot(digest=digest)
+                except OSError:
+                    # The snapshot is only a cache of the submission file.
+                    pass
+        return replaced
+
+    def _write_submission_file(self, path):
+        """Write submission file at path unless it holds the same text.
+
+        The text is formatted once: it is encoded and hashed as it is
+        written to the temporary file which replaces path.  The file at
+        path is read, to compare hashes, only if it is the same length as
+        the text.
+
+        Return (SHA-256 digest of text, True if path was replaced).
 
-    @staticmethod
-    def _create_person_list_entry(key, value):
-        """Return ECF submission file person list entry."""
-        name, section, team = key
-        pin, codes = value
-        fsep = ecf_constants.FIELD_SEPARATOR
-        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
-        if codes:
-            codes = fsep.join(
-                nvsep.join((constants.PERSON_CODE, c)) for c in codes
+        """
+        writer = None
+        replaced = True
+
+        def is_changed():
+            nonlocal replaced
+            try:
+                replaced = (
+                    os.path.getsize(path) != writer.length
+                    or file_digest(path) != writer.digest.digest()
+                )
+            except OSError:
+                replaced = True
+            return replaced
+
+        with open_atomically(path, mode="wb", replace=is_changed) as file:
+            writer = _DigestWriter(file, locale.getpreferredencoding(False))
+            write_blocks(
+                writer,
+                self.timer.timed_iter(
+                    "format_submission_text", self._generate_submission_text()
+                ),
             )
-        else:
-            codes = nvsep.join((constants.PERSON_CODE, ""))
-        return fsep.join(
-            (
-                "\n",
-                nvsep.join((constants.PERSON_NUMBER, pin)),
-                nvsep.join((constants.PERSON_NAME, name)),
-                nvsep.join((constants.PERSON_TEAM_SECTION, section)),
-                nvsep.join((constants.PERSON_TEAM_NAME, team)),
-                nvsep.join((constants.PERSON_ALIAS, "")),
-                nvsep.join((constants.PERSON_ECF_NAME, "")),
-                nvsep.join((constants.PERSON_ECF_CODE, "")),
-                codes,
+        return writer.digest.digest(), replaced
+
+    def save_snapshot(self, digest=None):
+        """Save snapshot of players, events, persons, and teams.
+
+        digest is the SHA-256 digest of the submission file which holds
+        the same data as self: it is calculated if None.
+
+        """
+        if digest is None:
+            digest = file_digest(
+                os.path.join(self.folder, constants.SUBMISSION)
             )
+        snapshot.save_snapshot(
+            self.folder,
+            digest,
+            self.players,
+            self._get_events_as_read(),
+            self.persons,
+            self.teams,
         )
 
-    @staticmethod
-    def _create_team_list_entry(section, team, teamclub="", teamclubcode=""):
-        """Create entry in teamss for team."""
-        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
-        return ecf_constants.FIELD_SEPARATOR.join(
-            (
-                "\n",
-                nvsep.join((constants.TEAM_SECTION, section)),
-                nvsep.join((constants.TEAM_NAME, team)),
-                nvsep.join((constants.TEAM_CLUB_NAME, teamclub)),
-                nvsep.join((constants.TEAM_CLUB_CODE, teamclubcode)),
+    def _get_events_as_read(self):
+        """Return self.events keyed as open_documents would key them.
+
+        The submission file does not record the event name so the games
+        are put under the key "" with the section given by the PersonList
+        entry of the first player in each game, in the order written.
+
+        """
+        pin_sections = {}
+        for key in sorted(self.persons):
+            pin_sections.setdefault(self.persons[key].pin, key[1])
+        player_pins = {player.pin for player in self.players.values()}
+        event_as_read = {}
+        for item in sorted(self.events):
+            event = self.events[item]
+            for subevent in sorted(event):
+                sections = event[subevent]
+                for section_name, games in sections.items():
+                    for game in games:
+                        pin = game.player1.pin
+                        if pin in player_pins:
+                            section = pin_sections.get(pin, "")
+                        else:
+                            section = ""
+                        event_as_read.setdefault(section, {}).setdefault(
+                            section_name, []
+                        ).append(game)
+        return {"": event_as_read}
+
+    def open_snapshot(self):
+        """Extract data from snapshot of submission file and return True.
+
+        False is returned if there is no snapshot, or the snapshot is not
+        of the current submission file, or is damaged.  Then the data must
+        be extracted from the submission file by open_documents.
+
+        FileNotFoundError is raised if there is no submission file.
+
+        """
+        with self.timer.stage("read_snapshot"):
+            digest = file_digest(
+                os.path.join(self.folder, constants.SUBMISSION)
             )
+            try:
+                state = snapshot.load_snapshot(
+                    self.folder, digest, get_player_for_pin
+                )
+            except snapshot.SnapshotError:
+                return False
+        if state is None:
+            return False
+        self.players, self.events, self.persons, self.teams = state
+        self.prefilled_codes = read_prefilled_codes(self.folder)
+        self.count_entries()
+        return True
+
+    def count_entries(self):
+        """Set counts of players, persons, teams, and sections, in timer."""
+        timer = self.timer
+        timer.count("players", len(self.players))
+        timer.count("persons", len(self.persons))
+        timer.count("teams", len(self.teams))
+        timer.count(
+            "sections",
+            sum(
+                len(section)
+                for event in self.events.values()
+                for section in event.values()
+            ),
         )
 
+    def _generate_submission_text(self):
+        """Yield the text of the submission file in pieces."""
+        fsep = ecf_constants.FIELD_SEPARATOR
+        players = self.players
+        events = self.events
+        persons = self.persons
+        teams = self.teams
+        yield "".join((fsep, ecf_constants.NAME_PLAYER_LIST))
+        for item in sorted(players):
+            yield players[item].player_list_entry()
+        for item in sorted(events):
+            event = events[item]
+            for subevent in sorted(event):
+                sections = event[subevent]
+                for section in sections:
+                    yield fsep.join(("\n", section))
+                    for game in sections[section]:
+                        yield game.game_list_entry()
+        yield fsep.join(("\n", ecf_constants.FINISH))
+        yield fsep.join(("\n", constants.TEAM_LIST))
+        for key in sorted(teams):
+            yield teams[key].team_list_entry(key)
+        yield fsep.join(("\n", constants.PERSON_LIST))
+        for key in sorted(persons):
+            yield persons[key].person_list_entry(key)
+        yield fsep.join(("\n", constants.FINAL))
+
     # This method gets a too-many-arguments message from pylint.
     # The game entry requires five mandatory, and two optional, items
     # of information; and these should have helpful names in the argument
@@ -414,58 +750,24 @@ class Submission:
     # information is sent to the ECF, but it is best if they are always
     # present.
     def _create_game_list_entry(
-        self, pin1, score, pin2, gamedate, pin1colour, round_=None, board=None
+        self,
+        player1,
+        score,
+        player2,
+        gamedate,
+        pin1colour,
+        round_=None,
+        board=None,
     ):
-        """Return ECF submission file game list entry."""
-        nvsep = ecf_constants.NAME_VALUE_SEPARATOR
-        if round_ is not None:
-            return ecf_constants.FIELD_SEPARATOR.join(
-                (
-                    "\n",
-                    nvsep.join((ecf_constants.NAME_PIN1, pin1)),
-                    nvsep.join((ecf_constants.SCORE, resultmapecf[score])),
-                    nvsep.join((ecf_constants.NAME_PIN2, pin2)),
-                    nvsep.join((ecf_constants.ROUND, round_)),
-                    self._convert_date_to_ecf_format(gamedate),
-                    nvsep.join((ecf_constants.COLOUR, pin1colour)),
-                )
-            )
-        if board is not None:
-            return ecf_constants.FIELD_SEPARATOR.join(
-                (
-                    "\n",
-                    nvsep.join((ecf_constants.NAME_PIN1, pin1)),
-                    nvsep.join((ecf_constants.SCORE, resultmapecf[score])),
-                    nvsep.join((ecf_constants.NAME_PIN2, pin2)),
-                    nvsep.join((ecf_constants.BOARD, board)),
-                    self._convert_date_to_ecf_format(gamedate),
-                    nvsep.join((ecf_constants.COLOUR, pin1colour)),
-                )
-            )
-        return ecf_constants.FIELD_SEPARATOR.join(
-            (
-                "\n",
-                nvsep.join((ecf_constants.NAME_PIN1, pin1)),
-                nvsep.join((ecf_constants.SCORE, resultmapecf[score])),
-                nvsep.join((ecf_constants.NAME_PIN2, pin2)),
-                self._convert_date_to_ecf_format(gamedate),
-                nvsep.join((ecf_constants.COLOUR, pin1colour)),
-            )
-        )
-
-    @staticmethod
-    def _convert_date_to_ecf_format(gamedate):
-        """Return date in 'dd/mm/yyyy' format assuming 'yyyy-mm-dd' input.
-
-        The date format is not checked except for 'gamedate is None'.
-        """
-        return ecf_constants.NAME_VALUE_SEPARATOR.join(
-            (
-                ecf_constants.NAME_GAME_DATE,
-                "/".join(reversed(gamedate.split("-")))
-                if gamedate is not None
-                else "",
-            )
+        """Return Game for ECF submission file game list entry."""
+        return Game(
+            player1,
+            resultmapecf[score],
+            player2,
+            self.date_converter.convert(gamedate),
+            pin1colour,
+            round_=round_,
+            board=board,
         )
 
     def close(self):
@@ -475,3 +777,101 @@ class Submission:
         self.events = None
         self.persons = None
         self.teams = None
+        self.pin_map = None
+        self.date_converter = None
+        self.timer = NULL_TIMER
+        self.code_store = None
+        self.rating_list = None
+        self.prefilled_codes = None
+        self.edition_merge = None
+        self.alias_proposals = None
+
+
+class _DigestWriter:
+    """Encode text written to a binary file and note its digest and length.
+
+    Used so the text of a submission file is formatted once even though its
+    digest is needed.
+
+    """
+
+    def __init__(self, file, encoding):
+        """Note binary file to be written and the encoding of the text."""
+        self.file = file
+        self.encoding = encoding
+        self.digest = hashlib.sha256()
+        self.length = 0
+
+    def write(self, text):
+        """Encode text, add it to the digest, and write it to file."""
+        data = text.encode(self.encoding)
+        self.digest.update(data)
+        self.length += len(data)
+        self.file.write(data)
+
+
+def open_saved_edition(folder, timer=NULL_TIMER):
+    """Return Submission read from the submission file in folder or None.
+
+    None is returned if there is no submission file.  The snapshot of the
+    submission file is used if it is up to date.
+
+    tokenizer.SubmissionFileError is raised if the submission file is not
+    valid: it must be corrected, or deleted, before the submission is
+    generated again so the work saved in it is not lost.
+
+    """
+    saved = Submission(folder, timer=timer)
+    try:
+        if not saved.open_snapshot():
+            saved.open_documents(None)
+    except FileNotFoundError:
+        return None
+    return saved
+
+
+class _GameRow:
+    """Values of a game row, in TABULAR_REPORT_ROW_ORDER order, by name.
+
+    Blank player names are given as "" rather than None.
+
+    The event, section, and team, names are in canonical form.  Player
+    names are put in canonical form when split from any reported codes.
+
+    """
+
+    __slots__ = (
+        "event",
+        "section",
+        "home_team",
+        "away_team",
+        "round_",
+        "board",
+        "home_player",
+        "away_player",
+        "date",
+        "colour",
+        "result",
+    )
+
+    def __init__(self, row):
+        """Set attributes from row, a tuple in TABULAR_REPORT_ROW_ORDER."""
+        (
+            event,
+            section,
+            home_team,
+            away_team,
+            self.round_,
+            self.board,
+            home_player,
+            away_player,
+            self.date,
+            self.colour,
+            self.result,
+        ) = _get_game_row_values(row)
+        self.event = canonical_string(event)
+        self.section = canonical_string(section)
+        self.home_team = canonical_string(home_team)
+        self.away_team = canonical_string(away_team)
+        self.home_player = "" if home_player is None else home_player
+        self.away_player = "" if away_player is None else away_player
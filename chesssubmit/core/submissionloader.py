@@ -0,0 +1,303 @@
+# submissionloader.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read the fields of a submission file into Submission records.
+
+The file is read in chunks by tokenizer.tokenize_file and the sequence of
+field names is checked as each field arrives.  The same pass collects the
+field values in a SubmissionLoader, which puts them in the dicts of a
+Submission instance as Player, Person, Team, and Game, records when the
+whole file has been read.
+
+"""
+
+from ecfformat.core import constants as ecf_constants
+
+from . import constants
+from .tokenizer import tokenize_file, line_number_at, SubmissionFileError
+from .records import Player, Person, Team, Game
+
+_next_fields = {
+    True: frozenset((ecf_constants.NAME_PLAYER_LIST,)),
+    ecf_constants.NAME_PLAYER_LIST: frozenset(
+        (
+            ecf_constants.PIN,
+            ecf_constants.NAME_MATCH_RESULTS,
+            ecf_constants.NAME_OTHER_RESULTS,
+            ecf_constants.NAME_SECTION_RESULTS,
+            ecf_constants.FINISH,
+        )
+    ),
+    ecf_constants.PIN: frozenset((ecf_constants.NAME_ECF_CODE,)),
+    ecf_constants.NAME_ECF_CODE: frozenset((ecf_constants.NAME,)),
+    ecf_constants.NAME: frozenset((ecf_constants.CLUB,)),
+    ecf_constants.CLUB: frozenset((ecf_constants.NAME_CLUB_CODE,)),
+    ecf_constants.NAME_CLUB_CODE: frozenset(
+        (
+            ecf_constants.PIN,
+            ecf_constants.NAME_MATCH_RESULTS,
+            ecf_constants.NAME_OTHER_RESULTS,
+            ecf_constants.NAME_SECTION_RESULTS,
+            ecf_constants.FINISH,
+        )
+    ),
+    ecf_constants.NAME_MATCH_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
+    ecf_constants.NAME_OTHER_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
+    ecf_constants.NAME_SECTION_RESULTS: frozenset((ecf_constants.NAME_PIN1,)),
+    ecf_constants.NAME_PIN1: frozenset((ecf_constants.SCORE,)),
+    ecf_constants.SCORE: frozenset((ecf_constants.NAME_PIN2,)),
+    ecf_constants.NAME_PIN2: frozenset(
+        (
+            ecf_constants.BOARD,
+            ecf_constants.ROUND,
+            ecf_constants.NAME_GAME_DATE,
+        )
+    ),
+    ecf_constants.BOARD: frozenset((ecf_constants.NAME_GAME_DATE,)),
+    ecf_constants.ROUND: frozenset((ecf_constants.NAME_GAME_DATE,)),
+    ecf_constants.NAME_GAME_DATE: frozenset((ecf_constants.COLOUR,)),
+    ecf_constants.COLOUR: frozenset(
+        (
+            ecf_constants.NAME_PIN1,
+            ecf_constants.NAME_MATCH_RESULTS,
+            ecf_constants.NAME_OTHER_RESULTS,
+            ecf_constants.NAME_SECTION_RESULTS,
+            ecf_constants.FINISH,
+        )
+    ),
+    ecf_constants.FINISH: frozenset((constants.TEAM_LIST, constants.FINAL)),
+    constants.TEAM_LIST: frozenset(
+        (constants.TEAM_SECTION, constants.PERSON_LIST)
+    ),
+    constants.TEAM_SECTION: frozenset((constants.TEAM_NAME,)),
+    constants.TEAM_NAME: frozenset((constants.TEAM_CLUB_NAME,)),
+    constants.TEAM_CLUB_NAME: frozenset((constants.TEAM_CLUB_CODE,)),
+    constants.TEAM_CLUB_CODE: frozenset(
+        (constants.TEAM_SECTION, constants.PERSON_LIST)
+    ),
+    constants.PERSON_LIST: frozenset(
+        (constants.PERSON_NUMBER, constants.FINAL)
+    ),
+    constants.PERSON_NUMBER: frozenset((constants.PERSON_NAME,)),
+    constants.PERSON_NAME: frozenset((constants.PERSON_TEAM_SECTION,)),
+    constants.PERSON_TEAM_SECTION: frozenset((constants.PERSON_TEAM_NAME,)),
+    constants.PERSON_TEAM_NAME: frozenset((constants.PERSON_ALIAS,)),
+    constants.PERSON_ALIAS: frozenset((constants.PERSON_ECF_NAME,)),
+    constants.PERSON_ECF_NAME: frozenset((constants.PERSON_ECF_CODE,)),
+    constants.PERSON_ECF_CODE: frozenset((constants.PERSON_CODE,)),
+    constants.PERSON_CODE: frozenset(
+        (constants.PERSON_CODE, constants.PERSON_NUMBER, constants.FINAL)
+    ),
+    constants.FINAL: False,
+}
+
+
+def _describe_field(name):
+    """Return description of field name for error messages."""
+    if name is True:
+        return "start of file"
+    return "".join(("field '", name, "'"))
+
+
+def load_submission_file(path):
+    """Return SubmissionLoader with fields read from file at path.
+
+    tokenizer.SubmissionFileError is raised if the field names are not
+    in the order required.
+
+    """
+    loader = SubmissionLoader()
+    add_field = loader.add_field
+    current_field = True
+    offset = 0
+    for name, value, offset in tokenize_file(path):
+        if name not in _next_fields[current_field]:
+            raise SubmissionFileError(
+                "".join(
+                    (
+                        "Field '",
+                        name,
+                        "' not expected after ",
+                        _describe_field(current_field),
+                    )
+                ),
+                path=path,
+                offset=offset,
+                line=line_number_at(path, offset),
+            )
+        add_field(name, value)
+        current_field = name
+    if _next_fields[current_field]:
+        raise SubmissionFileError(
+            "".join(
+                (
+                    "Submission file ends at ",
+                    _describe_field(current_field),
+                    " before the '",
+                    constants.FINAL,
+                    "' field",
+                )
+            ),
+            path=path,
+            offset=offset,
+            line=line_number_at(path, offset),
+        )
+    return loader
+
+
+def get_player_for_pin(pin_players, pin):
+    """Return Player for pin, creating one not in Player List if needed.
+
+    The Player created allows a game referring to a PIN missing from the
+    Player List to be written back to the submission file unchanged.
+
+    """
+    player = pin_players.get(pin)
+    if player is None:
+        player = pin_players[pin] = Player(pin, "", "")
+    return player
+
+
+class SubmissionLoader:
+    """Collect the values of fields read from a submission file.
+
+    The Player List and Result Details sections refer to players by PIN,
+    while Submission keys players by (name, section, team) which is known
+    only when the PersonList section, near the end of the file, has been
+    read.  The records are held here until then.
+
+    """
+
+    _record_starts = frozenset(
+        (
+            ecf_constants.PIN,
+            ecf_constants.NAME_PIN1,
+            constants.TEAM_SECTION,
+            constants.PERSON_NUMBER,
+        )
+    )
+    _section_starts = frozenset(
+        (
+            ecf_constants.NAME_MATCH_RESULTS,
+            ecf_constants.NAME_OTHER_RESULTS,
+            ecf_constants.NAME_SECTION_RESULTS,
+            ecf_constants.FINISH,
+            constants.TEAM_LIST,
+            constants.PERSON_LIST,
+            constants.FINAL,
+        )
+    )
+
+    def __init__(self):
+        """Initialise empty collections of records."""
+        self.record = {}
+        self.codes = []
+        self.section_name = None
+        self.player_list = {}
+        self.games = []
+        self.teams = {}
+        self.persons = []
+
+    def add_field(self, name, value):
+        """Add name and value to current, or new if name starts one, record."""
+        if name in self._record_starts:
+            self.flush()
+        elif name in self._section_starts:
+            self.flush()
+            self.section_name = ecf_constants.NAME_VALUE_SEPARATOR.join(
+                (name, value)
+            )
+            return
+        if name == constants.PERSON_CODE:
+            if value:
+                self.codes.append(value)
+            return
+        self.record[name] = value
+
+    def flush(self):
+        """Move current record to the collection for it's type."""
+        record = self.record
+        if not record:
+            return
+        if ecf_constants.PIN in record:
+            self.player_list[record[ecf_constants.PIN]] = (
+                record[ecf_constants.NAME_ECF_CODE],
+                record[ecf_constants.NAME],
+                record[ecf_constants.CLUB],
+                record[ecf_constants.NAME_CLUB_CODE],
+            )
+        elif ecf_constants.NAME_PIN1 in record:
+            self.games.append((self.section_name, record))
+        elif constants.TEAM_SECTION in record:
+            self.teams[
+                (record[constants.TEAM_SECTION], record[constants.TEAM_NAME])
+            ] = (
+                record[constants.TEAM_CLUB_NAME],
+                record[constants.TEAM_CLUB_CODE],
+            )
+        elif constants.PERSON_NUMBER in record:
+            self.persons.append((record, self.codes))
+            self.codes = []
+        self.record = {}
+
+    def populate(self, players, events, persons, teams):
+        """Put the records collected in the dicts of a Submission instance.
+
+        The games are put in events under the key "" because the submission
+        file does not record the event name.
+
+        """
+        self.flush()
+        player_list = self.player_list
+        pin_keys = {}
+        for record, codes in self.persons:
+            pin = record[constants.PERSON_NUMBER]
+            key = (
+                record[constants.PERSON_NAME],
+                record[constants.PERSON_TEAM_SECTION],
+                record[constants.PERSON_TEAM_NAME],
+            )
+            persons[key] = Person(
+                pin,
+                codes=set(codes),
+                alias=record[constants.PERSON_ALIAS],
+                ecf_name=record[constants.PERSON_ECF_NAME],
+                ecf_code=record[constants.PERSON_ECF_CODE],
+            )
+            if pin in player_list and pin not in pin_keys:
+                pin_keys[pin] = key
+                players[key] = Player(pin, *player_list[pin])
+        # Player List entries without a PersonList entry cannot be given
+        # their section so the club is assumed to be the team.
+        for pin, entry in player_list.items():
+            if pin not in pin_keys:
+                key = (entry[1], "", entry[2])
+                pin_keys[pin] = key
+                players[key] = Player(pin, *entry)
+        for key, value in self.teams.items():
+            teams[key] = Team(*value)
+        event = events.setdefault("", {})
+        pin_players = {}
+        for player in players.values():
+            pin_players.setdefault(player.pin, player)
+        for section_name, record in self.games:
+            player1 = get_player_for_pin(
+                pin_players, record[ecf_constants.NAME_PIN1]
+            )
+            player2 = get_player_for_pin(
+                pin_players, record[ecf_constants.NAME_PIN2]
+            )
+            key = pin_keys.get(player1.pin)
+            section = "" if key is None else key[1]
+            event.setdefault(section, {}).setdefault(section_name, []).append(
+                Game(
+                    player1,
+                    record[ecf_constants.SCORE],
+                    player2,
+                    record[ecf_constants.NAME_GAME_DATE],
+                    record[ecf_constants.COLOUR],
+                    round_=record.get(ecf_constants.ROUND),
+                    board=record.get(ecf_constants.BOARD),
+                )
+            )
@@ -0,0 +1,173 @@
+# timings.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Record the time taken by each stage of creating a submission file.
+
+Timing is switched on by setting the CHESSSUBMIT_TIMINGS environment
+variable, or by setting the constants.RECORD_TIMINGS item in the user's
+configuration file to constants.RECORD_TIMINGS_TRUE.
+
+When timing is on a StageTimer collects the seconds spent in each stage and
+counts of rows, players, persons, teams, and sections.  The record is
+appended as one line of JSON to the TIMING_LOG file in the event folder,
+beside the ERROR_LOG file, so slow events can be diagnosed later.
+
+When timing is off the NULL_TIMER instance does nothing.
+
+Use memorybudget.make_timer to get the timer for an operation: it gives a
+memorybudget.MemoryBudgetTimer, which also records memory used in each
+stage, if a memory budget is set.  This module does not import memorybudget
+so the dependency goes one way.
+
+"""
+import os
+import json
+import time
+import datetime
+import contextlib
+
+from .. import TIMING_LOG
+from . import constants
+
+# Environment variable which switches timing on unless empty, '0', or
+# 'false'.
+TIMINGS_ENVIRONMENT_VARIABLE = "CHESSSUBMIT_TIMINGS"
+
+
+def timings_enabled(configuration_value=None):
+    """Return True if stages should be timed.
+
+    configuration_value is the value of constants.RECORD_TIMINGS in the
+    user's configuration file, or None if not known.  The environment
+    variable takes precedence if it is set.
+
+    """
+    value = os.environ.get(TIMINGS_ENVIRONMENT_VARIABLE)
+    if value is not None:
+        return value.strip().lower() not in ("", "0", "false")
+    return configuration_value == constants.RECORD_TIMINGS_TRUE
+
+
+class StageTimer:
+    """Time stages and count items of an operation on an event.
+
+    Stages with the same name are accumulated: the record gives the total
+    time and the number of times the stage was entered.
+
+    """
+
+    def __init__(self, operation):
+        """Start timing operation, a name such as 'create_ecf_submission'."""
+        self.operation = operation
+        self.started = datetime.datetime.now()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.counts = {}
+
+    def add(self, name, seconds):
+        """Add seconds to time spent in stage name."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = [0.0, 0]
+        stage[0] += seconds
+        stage[1] += 1
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the body of the with statement as stage name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed_iter(self, name, iterable):
+        """Yield items from iterable adding time to produce them to name.
+
+        Used to separate the time spent formatting lines from the time
+        spent writing them when the lines are produced by a generator.
+
+        """
+        iterator = iter(iterable)
+        perf_counter = time.perf_counter
+        seconds = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += perf_counter() - start
+                yield item
+        finally:
+            self.add(name, seconds)
+
+    def count(self, name, value):
+        """Set count of items called name to value."""
+        self.counts[name] = value
+
+    def check(self):
+        """Do nothing: subclasses may check resources used so far."""
+
+    def record(self, outcome="ok"):
+        """Return dict of timings and counts for the operation."""
+        return {
+            "operation": self.operation,
+            "started": self.started.isoformat(timespec="seconds"),
+            "seconds": time.perf_counter() - self._start,
+            "outcome": outcome,
+            "stages": [
+                {"stage": name, "seconds": seconds, "calls": calls}
+                for name, (seconds, calls) in self.stages.items()
+            ],
+            "counts": dict(self.counts),
+        }
+
+    def write(self, folder, outcome="ok"):
+        """Append record for operation to TIMING_LOG file in folder."""
+        with open(
+            os.path.join(folder, TIMING_LOG), "a", encoding="utf-8"
+        ) as file:
+            file.write(json.dumps(self.record(outcome=outcome)))
+            file.write("\n")
+
+
+class _NullTimer:
+    """A StageTimer which does nothing, used when timing is off."""
+
+    @staticmethod
+    def add(name, seconds):
+        """Do nothing."""
+        del name, seconds
+
+    @staticmethod
+    def stage(name):
+        """Return a context manager which does nothing."""
+        del name
+        return contextlib.nullcontext()
+
+    @staticmethod
+    def timed_iter(name, iterable):
+        """Return iterable."""
+        del name
+        return iterable
+
+    @staticmethod
+    def count(name, value):
+        """Do nothing."""
+        del name, value
+
+    @staticmethod
+    def check():
+        """Do nothing."""
+
+    @staticmethod
+    def write(folder, outcome="ok"):
+        """Do nothing."""
+        del folder, outcome
+
+
+NULL_TIMER = _NullTimer()
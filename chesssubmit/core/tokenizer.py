@@ -0,0 +1,134 @@
+# tokenizer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Read the fields of an ECF submission style file in fixed-size chunks.
+
+The file is read as bytes so the offset of each field in the file can be
+reported.  The field separator and name value separator are single byte
+characters in the encodings likely to be used for submission files, so
+splitting the bytes before decoding the fields is safe.
+
+"""
+import locale
+
+from ecfformat.core import constants as ecf_constants
+
+# Number of bytes read from the submission file at a time.
+CHUNK_SIZE = 65536
+
+
+class SubmissionFileError(Exception):
+    """Report a problem at a location in a submission file.
+
+    offset is the byte offset of the start of the field in the file and
+    line is the number of the line, counting from 1, containing offset.
+
+    """
+
+    def __init__(self, message, path=None, offset=None, line=None):
+        """Note location of problem and delegate."""
+        super().__init__(message)
+        self.message = message
+        self.path = path
+        self.offset = offset
+        self.line = line
+
+    def __str__(self):
+        """Return message with location of problem."""
+        if self.offset is None:
+            return self.message
+        return "".join(
+            (
+                self.message,
+                " at byte offset ",
+                str(self.offset),
+                " (line ",
+                str(self.line),
+                ")",
+            )
+        )
+
+
+def tokenize_file(path, chunk_size=CHUNK_SIZE, encoding=None):
+    """Yield (name, value, offset) for each field in file named path.
+
+    name and value have whitespace stripped and offset is the byte offset
+    of the field, excluding the preceding field separator, in the file.
+
+    Fields with no name and no name value separator, usually whitespace
+    between records, are not yielded.
+
+    Peak memory use is proportional to chunk_size and the length of the
+    longest field, not to the size of the file.
+
+    """
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    fsep = ecf_constants.FIELD_SEPARATOR.encode(encoding)
+    nvsep = ecf_constants.NAME_VALUE_SEPARATOR.encode(encoding)
+    fsep_length = len(fsep)
+    offset = 0
+    pending = b""
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            fields = (pending + chunk).split(fsep)
+            pending = fields.pop()
+            for field in fields:
+                token = make_token(field, nvsep, encoding)
+                if token is not None:
+                    yield token + (offset,)
+                offset += len(field) + fsep_length
+    token = make_token(pending, nvsep, encoding)
+    if token is not None:
+        yield token + (offset,)
+
+
+def make_token(field, nvsep, encoding):
+    """Return (name, value) from field bytes or None if field is empty."""
+    name, separator, value = field.partition(nvsep)
+    name = name.decode(encoding).strip()
+    if not separator and not name:
+        return None
+    return name, value.decode(encoding).strip()
+
+
+def line_number_at(path, offset, chunk_size=CHUNK_SIZE):
+    """Return line number, counting from 1, of byte offset in file path.
+
+    This is intended for use when reporting errors so the count of
+    newlines is not done while tokenizing the file.
+
+    """
+    return line_numbers_at(path, (offset,), chunk_size=chunk_size)[offset]
+
+
+def line_numbers_at(path, offsets, chunk_size=CHUNK_SIZE):
+    """Return dict of line numbers for byte offsets in file path.
+
+    The file is read once whatever the number of offsets.
+
+    """
+    lines = {}
+    pending = sorted(set(offsets), reverse=True)
+    line = 1
+    position = 0
+    with open(path, "rb") as file:
+        while pending:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            end = position + len(chunk)
+            while pending and pending[-1] < end:
+                target = pending.pop()
+                lines[target] = line + chunk.count(
+                    b"\n", 0, target - position
+                )
+            line += chunk.count(b"\n")
+            position = end
+    for target in pending:
+        lines[target] = line
+    return lines
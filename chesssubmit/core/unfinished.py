@@ -0,0 +1,50 @@
+# unfinished.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Collate unfinished games with the later reports of their results.
+
+A game may be reported unfinished, adjourned for example, and its result
+reported later.  Both reports are in the game rows extracted from the
+source documents.  The report of the unfinished game is dropped when there
+is a report of the same game with a result which is submitted to the ECF.
+
+The same game is the same event, section, teams, round, board, and
+players: the TABULAR_REPORT_ROW_ORDER columns before the date, which may be
+the date the game was finished in the later report.
+
+This module works on game rows, so Submit and the command line pipeline
+collate the unfinished games the same way without referring to widgets.
+
+"""
+
+from chessvalidate.core.gameresults import resultmapecf
+
+from . import constants
+
+# The columns which identify a game are before the date column.
+_GAME_KEY_LENGTH = constants.TABULAR_REPORT_ROW_ORDER.index(
+    constants.REPORT_DATE
+)
+_RESULT = constants.TABULAR_REPORT_ROW_ORDER.index(constants.REPORT_RESULT)
+
+
+def collate_unfinished_games(rows):
+    """Return list of rows without reports of games finished later.
+
+    rows is a list of tuples in TABULAR_REPORT_ROW_ORDER order.  A row
+    whose result has no ECF score is dropped if another row for the same
+    game has a result with an ECF score.  The order of the remaining rows
+    is not changed.
+
+    """
+    finished = set()
+    for row in rows:
+        if resultmapecf.get(row[_RESULT]):
+            finished.add(row[:_GAME_KEY_LENGTH])
+    return [
+        row
+        for row in rows
+        if resultmapecf.get(row[_RESULT])
+        or row[:_GAME_KEY_LENGTH] not in finished
+    ]
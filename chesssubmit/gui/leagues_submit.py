@@ -11,7 +11,6 @@ from chessvalidate.gui import leagues_validate
 
 from ..core import configuration
 from ..core import constants
-from ..core.submission import Submission
 from . import sourceedit
 from . import submissionedit
 from .. import ERROR_LOG
@@ -287,10 +286,40 @@ class Leagues(leagues_validate.Leagues):
 
     def _read_submission_file(self, title, submission_folder, conf=None):
         """Read submission file from submission folder."""
-        submission_data = Submission(submission_folder)
+        # Imported here to keep the module out of application startup.
+        from ..core.submission import Submission
+        from ..core.tokenizer import SubmissionFileError
+        from ..core.memorybudget import MemoryBudgetExceeded, make_timer
+        from ..core import timings
+
+        if conf is None:
+            conf = self.make_configuration_instance()
+        timer = make_timer(
+            "open_submission",
+            configuration_value=conf.get_configuration_value(
+                constants.RECORD_TIMINGS
+            ),
+            memory_budget_value=conf.get_configuration_value(
+                constants.MEMORY_BUDGET
+            ),
+        )
+        submission_data = Submission(submission_folder, timer=timer)
         try:
-            if not submission_data.open_documents(self.get_widget()):
-                return None
+            try:
+                if not submission_data.open_snapshot():
+                    submission_data.open_documents(self.get_widget())
+                    try:
+                        submission_data.save_snapshot()
+                    except OSError:
+                        # The snapshot is only a cache of the submission.
+                        pass
+            except Exception as exc:
+                self._write_timings(timer, submission_folder, exc)
+                raise
+            self._write_timings(timer, submission_folder, None)
+            # The timer's record is written so later changes, such as
+            # resolving players, are not timed.
+            submission_data.timer = timings.NULL_TIMER
         except FileNotFoundError:
             tkinter.messagebox.showinfo(
                 parent=self.get_widget(),
@@ -307,10 +336,38 @@ class Leagues(leagues_validate.Leagues):
                 title=title,
             )
             return None
+        except SubmissionFileError as exc:
+            tkinter.messagebox.showinfo(
+                parent=self.get_widget(),
+                message="".join(
+                    (
+                        os.path.join(
+                            submission_data.folder, constants.SUBMISSION
+                        ),
+                        "\nis not a valid submission file.\n\n",
+                        str(exc),
+                    )
+                ),
+                title=title,
+            )
+            return None
+        except MemoryBudgetExceeded as exc:
+            tkinter.messagebox.showinfo(
+                parent=self.get_widget(),
+                message="".join(
+                    (
+                        os.path.join(
+                            submission_data.folder, constants.SUBMISSION
+                        ),
+                        "\nis too big for the memory budget.\n\n",
+                        str(exc),
+                    )
+                ),
+                title=title,
+            )
+            return None
         self.submission_data = submission_data
         if self._submission_folder != submission_folder:
-            if conf is None:
-                conf = self.make_configuration_instance()
             conf.set_configuration_value(
                 constants.RECENT_DOCUMENT,
                 conf.convert_home_directory_to_tilde(submission_folder),
@@ -318,6 +375,49 @@ class Leagues(leagues_validate.Leagues):
             self._submission_folder = submission_folder
         return True
 
+    @staticmethod
+    def _write_timings(timer, folder, error):
+        """Write timer's record, with outcome error, to folder if possible."""
+        try:
+            timer.write(
+                folder,
+                outcome="ok" if error is None else error.__class__.__name__,
+            )
+        except OSError:
+            pass
+
+    def record_submission_codes(self):
+        """Save codes in submission data in code store if one is used.
+
+        Called when the user saves the submission data, not when it is
+        opened, so the code store holds only finished PersonList and
+        TeamList values.
+
+        """
+        # Imported here to keep the modules out of application startup.
+        import sqlite3
+        from ..core import codestore
+
+        submission_data = self.submission_data
+        if submission_data is None:
+            return
+        conf = self.make_configuration_instance()
+        try:
+            code_store = codestore.open_code_store(
+                conf.get_configuration_value(constants.CODE_STORE)
+            )
+            if code_store is None:
+                return
+            try:
+                submission_data.code_store = code_store
+                submission_data.record_codes()
+            finally:
+                submission_data.code_store = None
+                code_store.close()
+        except sqlite3.Error:
+            # The code store only saves typing codes in later events.
+            pass
+
     def delete_submission_file(self):
         """Delete submission file."""
         title = "".join(("Delete", " ", "Submission"))
@@ -9,8 +9,9 @@ from solentware_bind.gui.exceptionhandler import ExceptionHandler
 import chessvalidate.gui.resultsroot
 
 from .. import APPLICATION_NAME
-from . import help_
-from . import eventdetails
+
+# The help_ and eventdetails modules are imported when first used to keep
+# them out of application startup time.
 
 # This statement gets a protected-access message from pylint.
 # Cannot set by set_application_name() because chessvalidate.gui.resultsroot
@@ -24,18 +25,26 @@ class Results(chessvalidate.gui.resultsroot.Results):
 
     def help_about(self):
         """Display information about Submit Results application."""
+        from . import help_
+
         help_.help_about(self.root)
 
     def help_guide(self):
         """Display brief User Guide for Submit Results application."""
+        from . import help_
+
         help_.help_guide(self.root)
 
     def help_keyboard(self):
         """Display list of keyboard actions for Submit Results application."""
+        from . import help_
+
         help_.help_keyboard(self.root)
 
     def configure_event_details(self):
         """Set event details to event and for ECF results submission files."""
+        from . import eventdetails
+
         eventdetails.EventDetails(
             master=self.root,
             use_toplevel=True,
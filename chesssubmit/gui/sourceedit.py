@@ -8,6 +8,8 @@ Add creation of ECF result submission file to SourceEdit class.
 
 """
 
+import queue
+import threading
 import tkinter
 import tkinter.messagebox
 
@@ -15,13 +17,28 @@ from chessvalidate.gui import sourceedit
 
 from ..core import constants
 from ..core import configuration
-from ..core import submission
+
+# The submission, gamedates, memorybudget, contentcache, codestore, ratinglist,
+# and integrity, modules are imported when first needed to keep them out of
+# application startup time.
+
+# Message types put on submission worker's queue.
+_PROGRESS = "progress"
+_FINISHED = "finished"
+
+# Maximum number of rating list, or submission file, problems listed in the
+# dialogue.
+_RATING_LIST_PROBLEMS_SHOWN = 20
 
 
 class SourceEdit(sourceedit.SourceEdit):
     """The Edit panel for raw results data."""
 
     _btn_submission = "sourceedit_submission"
+    _submission_title = "Create ECF Submission File"
+    _submission_poll_interval = 100  # milliseconds
+    _submission_worker = None
+    _submission_progress = None
 
     def describe_buttons(self):
         """Define all action buttons that may appear on data input page."""
@@ -94,11 +111,12 @@ class SourceEdit(sourceedit.SourceEdit):
         Reported ECF codes are used witout question or by references to
         entries in the event configuration file.
 
+        The submission is created in a background thread: the buttons are
+        shown again when it is finished.
+
         """
         del event
-        if self.create_ecf_submission():
-            self.show_buttons_for_generate()
-            self.create_buttons()
+        self.create_ecf_submission()
 
     def show_buttons_for_update(self):
         """Show buttons for actions allowed after generating reports."""
@@ -115,7 +133,23 @@ class SourceEdit(sourceedit.SourceEdit):
         )
 
     def create_ecf_submission(self):
-        """Show create ECF submission dialogue and return True if created."""
+        """Start creating ECF submission and return True if started.
+
+        The source documents are hashed, the games are converted, and the
+        submission file is written, in a background thread so the
+        application stays responsive.  The panel buttons are hidden, and a
+        progress dialogue with a Cancel button is shown, until the thread
+        finishes.
+
+        The dialogue holds the application's grab so the results data read
+        by the thread cannot be edited meanwhile.  The unfinished games are
+        collated in the thread with the other games, so the submission file
+        is the one the command line pipeline writes for the source
+        documents.
+
+        """
+        if self._submission_worker is not None:
+            return False
         if self.is_report_modified():
             tkinter.messagebox.showinfo(
                 parent=self.get_widget(),
@@ -125,20 +159,367 @@ class SourceEdit(sourceedit.SourceEdit):
                         "Save the data first.",
                     )
                 ),
-                title="Create ECF Submission File",
+                title=self._submission_title,
             )
             return False
+        from ..core import memorybudget
+
         folder = self.get_context().results_folder
         conf = configuration.Configuration()
         conf.set_configuration_value(
             constants.RECENT_SOURCE_SUBMISSION,
             conf.convert_home_directory_to_tilde(folder),
         )
-
-        self._collate_unfinished_games()
-        results = submission.Submission(folder)
-        results.convert_document_to_submission_style(
-            self.get_context().results_data
+        timer = memorybudget.make_timer(
+            "create_ecf_submission",
+            configuration_value=conf.get_configuration_value(
+                constants.RECORD_TIMINGS
+            ),
+            memory_budget_value=conf.get_configuration_value(
+                constants.MEMORY_BUDGET
+            ),
+        )
+        worker = _SubmissionWorker(
+            folder, self.get_context().results_data, timer
+        )
+        try:
+            worker.code_store_value = conf.get_configuration_value(
+                constants.CODE_STORE
+            )
+            self._submission_progress = _SubmissionProgress(
+                self.get_widget(), self._submission_title, worker.cancel
+            )
+            self.hide_panel_buttons()
+            self.create_buttons()
+            worker.start()
+        except BaseException as exc:
+            # The worker, which writes the timer's record and so stops any
+            # memory tracing, has not started.
+            worker.write_timings(exc.__class__.__name__)
+            if self._submission_progress is not None:
+                self._submission_progress.destroy()
+                self._submission_progress = None
+            raise
+        self._submission_worker = worker
+        self.get_widget().after(
+            self._submission_poll_interval, self._poll_submission_worker
         )
-        results.write_entries_to_submission_file()
         return True
+
+    def _poll_submission_worker(self):
+        """Show progress of submission worker and tidy up when finished."""
+        worker = self._submission_worker
+        while True:
+            try:
+                message = worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == _PROGRESS:
+                self._submission_progress.show_progress(*message[1:])
+            else:
+                self._finish_submission(
+                    message[1],
+                    worker.rating_list_problems,
+                    worker.submission_file_problems,
+                )
+                return
+        self.get_widget().after(
+            self._submission_poll_interval, self._poll_submission_worker
+        )
+
+    def _finish_submission(
+        self, error, rating_list_problems=(), submission_file_problems=()
+    ):
+        """Restore buttons and report outcome of submission worker."""
+        self._submission_worker = None
+        self._submission_progress.destroy()
+        self._submission_progress = None
+        if error is None:
+            self.show_buttons_for_generate()
+            self.create_buttons()
+            if rating_list_problems:
+                self._show_rating_list_problems(rating_list_problems)
+            if submission_file_problems:
+                self._show_submission_file_problems(submission_file_problems)
+            return
+        self.show_buttons_for_update()
+        self.create_buttons()
+        from ..core import submission
+        from ..core import gamedates
+        from ..core.memorybudget import MemoryBudgetExceeded
+
+        if isinstance(error, submission.SubmissionCancelled):
+            message = "Creation of submission file cancelled."
+        elif isinstance(error, MemoryBudgetExceeded):
+            message = "".join(
+                (
+                    "Submission file is too big for the memory budget.\n\n",
+                    str(error),
+                )
+            )
+        elif isinstance(error, gamedates.GameDateError):
+            message = "".join(
+                (
+                    str(error),
+                    "\n\nCorrect the dates, or the event dates in ",
+                    "event details, and create the submission again.",
+                )
+            )
+        else:
+            message = "".join(
+                (
+                    "Unable to create submission file.\n\n",
+                    "The reported exception is:\n\n",
+                    str(error),
+                )
+            )
+        tkinter.messagebox.showinfo(
+            parent=self.get_widget(),
+            message=message,
+            title=self._submission_title,
+        )
+
+    def _show_rating_list_problems(self, problems):
+        """Report ECF codes and names which do not match the rating list."""
+        self._show_problems(
+            "".join(
+                (
+                    "Submission file created but some codes and ",
+                    "names do not match the rating list.",
+                )
+            ),
+            problems,
+        )
+
+    def _show_submission_file_problems(self, problems):
+        """Report problems found by checking the submission file."""
+        self._show_problems(
+            "".join(
+                (
+                    "Submission file created but checking it found ",
+                    "these problems.",
+                )
+            ),
+            problems,
+        )
+
+    def _show_problems(self, summary, problems):
+        """Report summary and the first few of the text of problems."""
+        shown = problems[:_RATING_LIST_PROBLEMS_SHOWN]
+        if len(problems) > len(shown):
+            shown.append(
+                "".join(
+                    (
+                        "and ",
+                        str(len(problems) - len(shown)),
+                        " more problems",
+                    )
+                )
+            )
+        tkinter.messagebox.showinfo(
+            parent=self.get_widget(),
+            message="\n\n".join(
+                (
+                    summary,
+                    "\n".join(shown),
+                    "Correct these before the results are submitted.",
+                )
+            ),
+            title=self._submission_title,
+        )
+
+
+class _SubmissionWorker(threading.Thread):
+    """Create submission file in a background thread.
+
+    Progress and the outcome are put on the messages queue as tuples for
+    the main thread to collect: (_PROGRESS, rows done, total rows), and
+    (_FINISHED, exception or None).
+
+    The timer's record is written to the event folder when the worker
+    finishes, whatever the outcome.  This matters for a memory budget
+    timer, which stops tracing memory only when its record is written.
+
+    The source documents are hashed in the worker and the game rows cached
+    for the hash are used if present.  Otherwise the games in results_data,
+    including the unfinished games, are collated and the rows cached.
+
+    code_store_value is the constants.CODE_STORE configuration value.  The
+    code store is opened in the worker's thread because an SQLite
+    connection cannot be shared between threads.
+
+    ECF codes and names are checked against the imported rating list, if
+    any, and the problems found are put in rating_list_problems.  The text
+    of the problems found by integrity.check_submission_file in the file
+    written is put in submission_file_problems.  A failure of the check is
+    put there too, not reported as failure to create the file, because
+    the file has been written by then.
+
+    """
+
+    def __init__(self, folder, results_data, timer, code_store_value=None):
+        """Note event folder, results data, and timer, for submission."""
+        super().__init__(daemon=True)
+        self.folder = folder
+        self.results_data = results_data
+        self.timer = timer
+        self.code_store_value = code_store_value
+        self.rating_list_problems = []
+        self.submission_file_problems = []
+        self.messages = queue.Queue()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to stop at the next progress report."""
+        self._cancel.set()
+
+    def _get_game_rows(self):
+        """Return cached game rows or collate games in results data."""
+        from ..core import contentcache
+
+        with self.timer.stage("hash_source_documents"):
+            cache_key = contentcache.make_cache_key(self.folder)
+            rows = contentcache.read_cached_rows(self.folder, cache_key)
+        if rows is not None:
+            return rows
+        if self._cancel.is_set():
+            from ..core import submission
+
+            raise submission.SubmissionCancelled()
+        with self.timer.stage("game_rows"):
+            rows = contentcache.collate_game_rows(self.results_data)
+        with self.timer.stage("write_game_rows_cache"):
+            try:
+                contentcache.write_cached_rows(self.folder, cache_key, rows)
+            except (OSError, TypeError, ValueError):
+                # The cache only saves collating the games again.
+                pass
+        return rows
+
+    def _progress(self, done, total):
+        """Report progress or raise SubmissionCancelled if cancelled."""
+        if self._cancel.is_set():
+            from ..core import submission
+
+            raise submission.SubmissionCancelled()
+        self.messages.put((_PROGRESS, done, total))
+
+    def run(self):
+        """Convert the games and write the submission file."""
+        import sqlite3
+        from ..core import submission
+        from ..core import codestore
+        from ..core import ratinglist
+        from ..core import integrity
+
+        code_store = None
+        rating_list = None
+        saved = None
+        unusable_rating_list = []
+        try:
+            try:
+                code_store = codestore.open_code_store(self.code_store_value)
+            except sqlite3.Error:
+                # The code store only saves typing codes in later events.
+                code_store = None
+            rating_list = ratinglist.open_rating_list(
+                problems=unusable_rating_list
+            )
+            results = submission.Submission(
+                self.folder,
+                timer=self.timer,
+                code_store=code_store,
+                rating_list=rating_list,
+            )
+            rows = self._get_game_rows()
+            with self.timer.stage("read_saved_edition"):
+                saved = submission.open_saved_edition(
+                    self.folder, timer=self.timer
+                )
+            results.convert_rows_to_submission_style(
+                rows, progress=self._progress, saved=saved
+            )
+            if self._cancel.is_set():
+                raise submission.SubmissionCancelled()
+            results.write_entries_to_submission_file()
+            self.rating_list_problems = (
+                unusable_rating_list + results.rating_list_problems
+            )
+            try:
+                with self.timer.stage("check_submission_file"):
+                    self.submission_file_problems = [
+                        str(problem)
+                        for problem in integrity.check_submission_file(
+                            self.folder
+                        )
+                    ]
+            except Exception as exc:  # pylint: disable=broad-except
+                # The file has been written so only the check failed.
+                self.submission_file_problems = [
+                    "".join(
+                        (
+                            "The submission file could not be checked: ",
+                            exc.__class__.__name__,
+                            ": ",
+                            str(exc),
+                        )
+                    )
+                ]
+        except Exception as exc:  # pylint: disable=broad-except
+            self.write_timings(exc.__class__.__name__)
+            self.messages.put((_FINISHED, exc))
+            return
+        finally:
+            if code_store is not None:
+                code_store.close()
+            if rating_list is not None:
+                rating_list.close()
+            if saved is not None:
+                saved.close()
+        self.write_timings("ok")
+        self.messages.put((_FINISHED, None))
+
+    def write_timings(self, outcome):
+        """Write timer's record with outcome, ignoring failure to write."""
+        try:
+            self.timer.write(self.folder, outcome=outcome)
+        except OSError:
+            pass
+
+
+class _SubmissionProgress:
+    """Dialogue showing progress of submission worker with Cancel button."""
+
+    def __init__(self, master, title, cancel):
+        """Create dialogue over master which calls cancel if cancelled."""
+        self.toplevel = tkinter.Toplevel(master=master)
+        self.toplevel.wm_title(title)
+        self.toplevel.transient(master.winfo_toplevel())
+        self.toplevel.protocol("WM_DELETE_WINDOW", cancel)
+        self.label = tkinter.Label(
+            master=self.toplevel, text="Creating submission file", width=40
+        )
+        self.label.pack(side=tkinter.TOP, padx=10, pady=10)
+        tkinter.Button(
+            master=self.toplevel, text="Cancel", underline=0, command=cancel
+        ).pack(side=tkinter.TOP, pady=10)
+
+        # The grab stops the source documents being edited while the worker
+        # reads the results data.
+        try:
+            self.toplevel.wait_visibility()
+            self.toplevel.grab_set()
+        except tkinter.TclError:
+            pass
+
+    def show_progress(self, done, total):
+        """Show number of game rows converted."""
+        self.label.configure(
+            text="".join(
+                ("Converted ", str(done), " of ", str(total), " game rows")
+            )
+        )
+
+    def destroy(self):
+        """Destroy the dialogue."""
+        self.toplevel.destroy()
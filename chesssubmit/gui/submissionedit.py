@@ -4,19 +4,51 @@
 
 """Submission file data edit class."""
 
+import bisect
 import tkinter
 import tkinter.messagebox
 
 from solentware_misc.gui import panel
 
+from ecfformat.core import constants as ecf_constants
+
+from ..core import constants
+
+# The Submission attributes holding the records of the sections, and of the
+# TeamList and PersonList entries, which can be edited.
+_EDITABLE_SECTIONS = {
+    ecf_constants.NAME_PLAYER_LIST: "players",
+    constants.TEAM_LIST: "teams",
+    constants.TEAM_SECTION: "teams",
+    constants.PERSON_LIST: "persons",
+    constants.PERSON_NUMBER: "persons",
+}
+
 
 class SubmissionEdit(panel.PlainPanel):
-    """The Edit panel for submission data."""
+    """The Edit panel for submission data.
+
+    The submission file is memory mapped and the text of a section is read
+    only when the section is selected in the list of sections.
+
+    The Player List, TeamList, and PersonList, entries are edited in place
+    in the records held by the submission data.  The edits are written to
+    the submission file when it is saved.
+
+    """
 
     btn_opensubmission = "submission_open"  # menu button only
     btn_closesubmission = "submission_close"
     _btn_savesubmission = "submission_save"
     _btn_submit = "submission_submit"
+    _btn_resolveplayers = "submission_resolve_players"
+    _btn_proposealiases = "submission_propose_aliases"
+    _proposals_shown = 20
+    _sections = None
+    _section_list = None
+    _section_text = None
+    _record_editor = None
+    _modified = False
 
     def __init__(self, parent=None, cnf=None, **kargs):
         """Extend and define results data input panel for results database."""
@@ -43,6 +75,13 @@ class SubmissionEdit(panel.PlainPanel):
         Used, at least, as callback from AppSysFrame container.
 
         """
+        self._close_sections()
+
+    def _close_sections(self):
+        """Release the memory mapped submission file if open."""
+        if self._sections is not None:
+            self._sections.close()
+            self._sections = None
 
     def describe_buttons(self):
         """Define all action buttons that may appear on data input page."""
@@ -50,7 +89,8 @@ class SubmissionEdit(panel.PlainPanel):
             self._btn_savesubmission,
             text="Save",
             tooltip=(
-                "Save edited results data with changes from original noted."
+                "Save submission file with edited Player List, TeamList, "
+                "and PersonList, entries."
             ),
             underline=2,
             command=self.on_save,
@@ -62,6 +102,30 @@ class SubmissionEdit(panel.PlainPanel):
             underline=1,
             command=self.on_submit,
         )
+        self.define_button(
+            self._btn_resolveplayers,
+            text="Resolve Players",
+            tooltip=" ".join(
+                (
+                    "Merge players linked by PersonECFCode, PersonAlias, or",
+                    "PersonNumber, values and save submission.",
+                )
+            ),
+            underline=0,
+            command=self.on_resolve_players,
+        )
+        self.define_button(
+            self._btn_proposealiases,
+            text="Propose Aliases",
+            tooltip=" ".join(
+                (
+                    "Propose PersonAlias and PersonECFName values for similar",
+                    "names in each team and save submission if accepted.",
+                )
+            ),
+            underline=0,
+            command=self.on_propose_aliases,
+        )
         self.define_button(
             self.btn_closesubmission,
             text="Close",
@@ -96,6 +160,16 @@ class SubmissionEdit(panel.PlainPanel):
         del event
         self.submit_results_to_ecf()
 
+    def on_resolve_players(self, event=None):
+        """Merge players linked in PersonList and save submission file."""
+        del event
+        self.resolve_players()
+
+    def on_propose_aliases(self, event=None):
+        """Propose PersonAlias values for similar names and save if agreed."""
+        del event
+        self.propose_aliases()
+
     def show_buttons_for_submit(self):
         """Show buttons for actions allowed after generating reports."""
         self.hide_panel_buttons()
@@ -103,13 +177,84 @@ class SubmissionEdit(panel.PlainPanel):
             (
                 self.btn_closesubmission,
                 self._btn_savesubmission,
+                self._btn_resolveplayers,
+                self._btn_proposealiases,
                 self._btn_submit,
             )
         )
 
     def show_submission(self):
-        """Display widgets showing submission data."""
+        """Display widgets showing submission data.
+
+        A list of the sections in the submission file, the text of the
+        section selected in the list, and the records which can be edited
+        for the section, are shown.
+
+        """
+        # Imported here to keep the module out of application startup.
+        from ..core.sectionindex import SubmissionSections
+
         self._hide_panes()
+        self._close_sections()
+        folder = self.get_context().submission_folder
+        if folder is None:
+            return
+        try:
+            self._sections = SubmissionSections(folder)
+        except FileNotFoundError:
+            return
+        self._section_list = tkinter.Listbox(
+            master=self.toppane, exportselection=tkinter.FALSE, width=40
+        )
+        for title in self._sections.get_section_titles():
+            self._section_list.insert(tkinter.END, title)
+        self._section_list.bind("<<ListboxSelect>>", self.on_select_section)
+        sectionpane = tkinter.PanedWindow(
+            master=self.toppane,
+            opaqueresize=tkinter.FALSE,
+            orient=tkinter.VERTICAL,
+        )
+        self._section_text = tkinter.Text(
+            master=sectionpane, wrap=tkinter.NONE
+        )
+        self._record_editor = _RecordEditor(
+            sectionpane, self._note_record_edited
+        )
+        sectionpane.add(self._section_text)
+        sectionpane.add(self._record_editor.frame)
+        self.toppane.add(self._section_list)
+        self.toppane.add(sectionpane)
+
+    def on_select_section(self, event=None):
+        """Show text and records of the section selected in list."""
+        del event
+        selection = self._section_list.curselection()
+        if not selection or self._sections is None:
+            return
+        self._section_text.delete("1.0", tkinter.END)
+        self._section_text.insert(
+            tkinter.END, self._sections.get_section_text(selection[0])
+        )
+        kind = _EDITABLE_SECTIONS.get(
+            self._sections.get_section_name(selection[0])
+        )
+        submission_data = self.get_context().submission_data
+        if kind is None or submission_data is None:
+            self._record_editor.show_records(None)
+            return
+        self._record_editor.show_records(getattr(submission_data, kind))
+        key = self._sections.get_section_key(selection[0])
+        if key is not None:
+            self._record_editor.select_record(key)
+
+    def _note_record_edited(self):
+        """Note a record has been edited since the submission was saved."""
+        self._modified = True
+
+    def _apply_record_edits(self):
+        """Copy values shown for the selected record into the record."""
+        if self._record_editor is not None:
+            self._record_editor.apply_edits()
 
     def _hide_panes(self):
         """Forget the configuration of PanedWindows on submission page."""
@@ -132,23 +277,175 @@ class SubmissionEdit(panel.PlainPanel):
                 title="Close",
             ):
                 return
+        self._close_sections()
         self.get_context().submission_close()
 
+    def resolve_players(self):
+        """Merge players linked in PersonList and save submission file.
+
+        The links followed are described in core.resolve: only values given
+        by the user are links.
+
+        """
+        title = "Resolve Players"
+        submission_data = self.get_context().submission_data
+        if submission_data is None:
+            return
+        self._apply_record_edits()
+        if not tkinter.messagebox.askyesno(
+            parent=self.get_widget(),
+            message="".join(
+                (
+                    "Merge the players linked by the PersonECFCode, ",
+                    "PersonAlias, or PersonNumber, values given in the ",
+                    "PersonList?\n\nThe submission file is saved with ",
+                    "the games of merged players given one PIN.",
+                )
+            ),
+            title=title,
+        ):
+            return
+        removed = submission_data.resolve_players()
+        if removed:
+            if not self._write_submission(title):
+                return
+            message = "".join(
+                (str(removed), " players merged into the players linked.")
+            )
+        else:
+            message = "No players are linked to other players."
+        tkinter.messagebox.showinfo(
+            parent=self.get_widget(), message=message, title=title
+        )
+
+    def propose_aliases(self):
+        """Propose PersonAlias values for similar names and save if agreed.
+
+        ECF names are proposed from the PersonECFName values given and the
+        imported rating list, if any.  Only blank PersonAlias and
+        PersonECFName values are set when the proposals are accepted.
+
+        """
+        # Imported here to keep the modules out of application startup.
+        from ..core.namematch import format_proposal
+        from ..core.ratinglist import open_rating_list
+
+        title = "Propose Aliases"
+        submission_data = self.get_context().submission_data
+        if submission_data is None:
+            return
+        self._apply_record_edits()
+        problems = []
+        rating_list = open_rating_list(problems=problems)
+        try:
+            submission_data.rating_list = rating_list
+            proposals = submission_data.propose_person_aliases()
+        finally:
+            submission_data.rating_list = None
+            if rating_list is not None:
+                rating_list.close()
+        if not proposals:
+            tkinter.messagebox.showinfo(
+                parent=self.get_widget(),
+                message="\n\n".join(
+                    problems + ["No similar names found in any team."]
+                ),
+                title=title,
+            )
+            return
+        lines = [
+            format_proposal(proposal)
+            for proposal in proposals[: self._proposals_shown]
+        ]
+        if len(proposals) > len(lines):
+            lines.append(
+                " ".join(
+                    ("and", str(len(proposals) - len(lines)), "more")
+                )
+            )
+        if not tkinter.messagebox.askyesno(
+            parent=self.get_widget(),
+            message="".join(
+                (
+                    "\n\n".join(problems + ["Proposed aliases:"]),
+                    "\n\n",
+                    "\n".join(lines),
+                    "\n\nSet the blank PersonAlias and PersonECFName ",
+                    "values of these persons and save the submission file?",
+                )
+            ),
+            title=title,
+        ):
+            return
+        changed = submission_data.apply_alias_proposals(proposals)
+        if changed:
+            if not self._write_submission(title):
+                return
+        tkinter.messagebox.showinfo(
+            parent=self.get_widget(),
+            message="".join((str(changed), " persons given aliases.")),
+            title=title,
+        )
+
+    def _write_submission(self, title):
+        """Write submission file and record its codes, return True if saved.
+
+        The codes are saved in the code store, if one is used, only when
+        the user saves the submission.  The sections shown are refreshed.
+
+        """
+        self._apply_record_edits()
+        submission_data = self.get_context().submission_data
+        # The submission file cannot be replaced while mapped on some
+        # platforms.
+        self._close_sections()
+        try:
+            submission_data.write_entries_to_submission_file()
+        except OSError as exc:
+            tkinter.messagebox.showinfo(
+                parent=self.get_widget(),
+                message="".join(
+                    (
+                        "Unable to save submission file.\n\n",
+                        "The reported exception is:\n\n",
+                        str(exc),
+                    )
+                ),
+                title=title,
+            )
+            self.show_submission()
+            return False
+        self._modified = False
+        self.get_context().record_submission_codes()
+        self.show_submission()
+        return True
+
     def save_data_folder(self):
-        """Show save data input file dialogue and return True if saved."""
+        """Save submission file with edited records, return True if saved."""
+        title = "Save ECF Submission File"
+        if self.get_context().submission_data is None:
+            return False
+        self._apply_record_edits()
+        if not self._modified:
+            tkinter.messagebox.showinfo(
+                parent=self.get_widget(),
+                message="No entries have been edited",
+                title=title,
+            )
+            return False
+        if not self._write_submission(title):
+            return False
         tkinter.messagebox.showinfo(
             parent=self.get_widget(),
-            message="Placeholder for save submission dialogue",
-            title="Save ECF Submission File",
+            message="Submission file saved",
+            title=title,
         )
+        return True
 
     def is_report_modified(self):
-        """Return Text.edit_modified(). Work around see Python issue 961805."""
-        # return self.editedtext.edit_modified()
-        # return self.editedtext.winfo_toplevel().tk.call(
-        #     "eval", "%s edit modified" % self.editedtext
-        # )
-        return True
+        """Return True if records have been edited since the last save."""
+        self._apply_record_edits()
+        return self._modified
 
     def submit_results_to_ecf(self):
         """Create submission file and enter dialogue to submit to ECF."""
@@ -157,3 +454,123 @@ class SubmissionEdit(panel.PlainPanel):
             message="Placeholder for submission to ECF dialogue",
             title="Submit ECF Submission File",
         )
+
+
+class _RecordEditor:
+    """List of records in a section of submission data and their values.
+
+    The Player, Person, or Team, records are edited in place: the values
+    shown for the selected record are copied into it when another record
+    is selected, or when apply_edits() is called.
+
+    """
+
+    def __init__(self, master, on_edit):
+        """Create widgets in a Frame in master.
+
+        on_edit is called with no arguments when a record is changed.
+
+        """
+        self.on_edit = on_edit
+        self.frame = tkinter.Frame(master=master)
+        self._record_list = tkinter.Listbox(
+            master=self.frame, exportselection=tkinter.FALSE, width=60
+        )
+        self._record_list.bind("<<ListboxSelect>>", self.on_select_record)
+        self._record_list.grid(row=0, column=0, sticky=tkinter.NSEW)
+        self.frame.grid_columnconfigure(0, weight=1)
+        self._records = None
+        self._keys = ()
+        self._key = None
+        self._values = {}
+
+    def show_records(self, records):
+        """Show keys of records in list of records.
+
+        records is a dict of Player, Person, or Team, records keyed as in
+        Submission instances, or None if the section has no records which
+        can be edited.
+
+        """
+        self.apply_edits()
+        if records is self._records:
+            return
+        self._records = records
+        self._key = None
+        self._record_list.delete(0, tkinter.END)
+        for widget in self.frame.grid_slaves():
+            if widget is not self._record_list:
+                widget.destroy()
+        for row in range(self.frame.grid_size()[1]):
+            self.frame.grid_rowconfigure(row, weight=0)
+        self._values = {}
+        self._keys = () if records is None else sorted(records)
+        for key in self._keys:
+            self._record_list.insert(
+                tkinter.END, self._get_record_title(key, records[key])
+            )
+        if not self._keys:
+            return
+        fields = records[self._keys[0]].edit_fields
+        for row, item in enumerate(fields):
+            attribute, field = item
+            tkinter.Label(master=self.frame, text=field).grid(
+                row=row, column=1, sticky=tkinter.NW
+            )
+            value = tkinter.StringVar(master=self.frame)
+            tkinter.Entry(
+                master=self.frame, textvariable=value, width=40
+            ).grid(row=row, column=2, sticky=tkinter.EW)
+            self._values[attribute] = value
+        self._record_list.grid_configure(rowspan=len(fields) + 1)
+        self.frame.grid_rowconfigure(len(fields), weight=1)
+
+    @staticmethod
+    def _get_record_title(key, record):
+        """Return title of record with key for list of records."""
+        pin = getattr(record, "pin", None)
+        title = " / ".join(item for item in key if item)
+        if pin is None:
+            return title
+        return "".join((pin, "  ", title))
+
+    def select_record(self, key):
+        """Select and show record with key if it is in list of records."""
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            return
+        self._record_list.selection_clear(0, tkinter.END)
+        self._record_list.selection_set(index)
+        self._record_list.see(index)
+        self.on_select_record()
+
+    def on_select_record(self, event=None):
+        """Show values of the record selected in list of records."""
+        del event
+        self.apply_edits()
+        selection = self._record_list.curselection()
+        if not selection:
+            return
+        self._key = self._keys[selection[0]]
+        record = self._records[self._key]
+        for attribute, value in self._values.items():
+            value.set(getattr(record, attribute))
+
+    def apply_edits(self):
+        """Copy values shown for the selected record into the record."""
+        # Imported here to keep the module out of application startup.
+        from ..core.records import update_record
+
+        if self._key is None:
+            return
+        record = self._records.get(self._key)
+        if record is None:
+            return
+        if update_record(
+            record,
+            {
+                attribute: value.get()
+                for attribute, value in self._values.items()
+            },
+        ):
+            self.on_edit()
@@ -0,0 +1,165 @@
+# importtime.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Measure the import time of the Submit Results application's startup.
+
+Run as 'python -m chesssubmit.importtime'.
+
+The modules imported by chesssubmit.submit before the main window is drawn
+are imported in a new interpreter run with '-X importtime'.  The modules
+taking most cumulative time are listed, and any module which should be
+imported only when a menu or tab is first used is reported.
+
+The exit status is 1 if a deferred module was imported at startup, or if
+the total import time exceeds the '--limit' option, so the command can be
+used to catch startup regressions.
+
+"""
+import sys
+import argparse
+import subprocess
+
+# The modules imported by chesssubmit.submit before the main window exists.
+STARTUP_MODULES = (
+    "chesssubmit.gui.resultsroot",
+    "chesssubmit.gui.leagues_submit",
+)
+
+# Modules which should be imported only when their menu or tab is used.
+DEFERRED_MODULES = (
+    "chesssubmit.core.submission",
+    "chesssubmit.gui.eventdetails",
+    "chesssubmit.gui.help_",
+    "chesssubmit.help_",
+)
+
+
+def measure_import_times(modules=STARTUP_MODULES):
+    """Return list of (self us, cumulative us, module, depth) for modules.
+
+    The list is in the order reported by 'python -X importtime'.  depth is
+    0 for modules imported directly by the 'import' statement run, or by
+    interpreter startup, 1 for modules imported by those, and so on.
+
+    """
+    completed = subprocess.run(
+        (
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "".join(("import ", ", ".join(modules))),
+        ),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            continue  # The heading line.
+        name = fields[2][1:]
+        module = name.lstrip()
+        depth = (len(name) - len(module)) // 2
+        times.append((self_us, cumulative_us, module, depth))
+    return times
+
+
+def _make_parser():
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chesssubmit.importtime",
+        description="Report import time of Submit Results startup modules.",
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=STARTUP_MODULES,
+        help="modules to import (default the application startup modules)",
+    )
+    parser.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=25,
+        help="number of modules with largest cumulative time to list",
+    )
+    parser.add_argument(
+        "-l",
+        "--limit",
+        type=float,
+        default=None,
+        help="fail if total startup import time exceeds this (milliseconds)",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Report import times for startup modules and return exit status."""
+    args = _make_parser().parse_args(argv)
+    try:
+        times = measure_import_times(modules=args.modules)
+    except RuntimeError as exc:
+        sys.stderr.write("".join(("Import failed: ", str(exc), "\n")))
+        return 2
+    total_us = sum(
+        item[1]
+        for item in times
+        if item[3] == 0 and item[2].split(".")[0] == "chesssubmit"
+    )
+    sys.stdout.write("Cumulative us  Self us  Module\n")
+    for self_us, cumulative_us, module, depth in sorted(
+        times, key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        del depth
+        sys.stdout.write(
+            "".join(
+                (
+                    format(cumulative_us, "13d"),
+                    format(self_us, "9d"),
+                    "  ",
+                    module,
+                    "\n",
+                )
+            )
+        )
+    status = 0
+    imported = {item[2] for item in times}
+    for module in DEFERRED_MODULES:
+        if module in imported and args.modules is STARTUP_MODULES:
+            sys.stdout.write(
+                "".join(
+                    ("Deferred module imported at startup: ", module, "\n")
+                )
+            )
+            status = 1
+    sys.stdout.write(
+        "".join(
+            (
+                "Total startup import time: ",
+                format(total_us / 1000, ".1f"),
+                " ms\n",
+            )
+        )
+    )
+    if args.limit is not None and total_us / 1000 > args.limit:
+        sys.stdout.write(
+            "".join(("Exceeds limit of ", format(args.limit, ".1f"), " ms\n"))
+        )
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
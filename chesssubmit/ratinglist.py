@@ -0,0 +1,68 @@
+# ratinglist.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Import an ECF rating list CSV file from the command line.
+
+Run as 'python -m chesssubmit.ratinglist <CSV file>'.
+
+The index created is used to check, and fill in, the ECF codes and names
+of players when submission files are created.
+
+"""
+import sys
+import argparse
+
+
+def _make_parser():
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m chesssubmit.ratinglist",
+        description=" ".join(
+            (
+                "Import a rating list CSV file downloaded from the ECF",
+                "into the index used to check ECF codes and names.",
+            )
+        ),
+    )
+    parser.add_argument("csv", help="rating list CSV file")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="index file (default '~/.chesssubmit.ratinglist')",
+    )
+    parser.add_argument(
+        "-e",
+        "--encoding",
+        default="utf-8-sig",
+        help="encoding of the CSV file (default utf-8-sig)",
+    )
+    return parser
+
+
+def main(argv=None):
+    """Import rating list CSV file named in argv and return status."""
+    args = _make_parser().parse_args(argv)
+
+    # Deferred so 'python -m chesssubmit.ratinglist --help' is quick.
+    from .core import ratinglist
+
+    index_path = args.output
+    if index_path is None:
+        index_path = ratinglist.default_index_path()
+    try:
+        count = ratinglist.import_rating_list(
+            args.csv, index_path=index_path, encoding=args.encoding
+        )
+    except (OSError, UnicodeDecodeError, ratinglist.RatingListError) as exc:
+        sys.stderr.write("".join((args.csv, ": ", str(exc), "\n")))
+        return 1
+    sys.stdout.write(
+        "".join((str(count), " players imported to ", index_path, "\n"))
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# test_atomicfile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for replacing a file so readers never see partial content."""
+
+import io
+import os
+import stat
+import tempfile
+import unittest
+
+from chesssubmit.core.atomicfile import open_atomically, write_blocks
+
+
+class OpenAtomically(unittest.TestCase):
+    """Test the target file is replaced only when writing succeeds."""
+
+    def setUp(self):
+        """Make temporary folder with a target file."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "submission")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("old")
+        os.chmod(self.path, 0o600)
+
+    def tearDown(self):
+        """Remove temporary folder."""
+        self.folder.cleanup()
+
+    def _read_target(self):
+        """Return content of target file."""
+        with open(self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def test_01_target_replaced(self):
+        """The target has the new content and keeps its permissions."""
+        with open_atomically(self.path, encoding="utf-8") as file:
+            file.write("new")
+            self.assertEqual(self._read_target(), "old")
+        self.assertEqual(self._read_target(), "new")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual(os.listdir(self.folder.name), ["submission"])
+
+    def test_02_target_kept_on_failure(self):
+        """An exception leaves the target unchanged and no temporary file."""
+        with self.assertRaises(RuntimeError):
+            with open_atomically(self.path, encoding="utf-8") as file:
+                file.write("partial")
+                raise RuntimeError("failed")
+        self.assertEqual(self._read_target(), "old")
+        self.assertEqual(os.listdir(self.folder.name), ["submission"])
+
+    def test_03_target_kept_when_replace_false(self):
+        """The target is not replaced when replace returns False."""
+        with open_atomically(
+            self.path, encoding="utf-8", replace=lambda: False
+        ) as file:
+            file.write("new")
+        self.assertEqual(self._read_target(), "old")
+        self.assertEqual(os.listdir(self.folder.name), ["submission"])
+
+
+class WriteBlocks(unittest.TestCase):
+    """Test pieces are written in blocks."""
+
+    def test_01_blocks(self):
+        """Pieces are joined into blocks of at least block_size."""
+        file = io.StringIO()
+        writes = []
+        file.write = writes.append
+        write_blocks(file, ("ab", "cd", "e", "fgh", "i"), block_size=4)
+        self.assertEqual(writes, ["abcd", "efgh", "i"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# test_canonical.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for canonical forms of names from game reports."""
+
+import unittest
+
+from chesssubmit.core import canonical
+
+
+class CanonicalString(unittest.TestCase):
+    """Test Unicode and whitespace normalisation of names."""
+
+    def setUp(self):
+        """Start with empty caches."""
+        canonical.clear_caches()
+
+    def test_01_nfkc(self):
+        """Compatibility characters are replaced by their NFKC forms."""
+        self.assertEqual(canonical.canonical_string("\ufb01nch"), "finch")
+        self.assertEqual(
+            canonical.canonical_string("\uff24\uff49\uff56 \uff11"), "Div 1"
+        )
+
+    def test_02_composed(self):
+        """A decomposed accent gives the same string as the composed one."""
+        self.assertEqual(
+            canonical.canonical_string("Rene\u0301"),
+            canonical.canonical_string("Ren\u00e9"),
+        )
+
+    def test_03_whitespace(self):
+        """Runs of whitespace, including no-break space, become one space."""
+        self.assertEqual(
+            canonical.canonical_string("  J\u00a0 Smith\t "), "J Smith"
+        )
+
+    def test_04_interned(self):
+        """Equal names are the same object."""
+        first = canonical.canonical_string("".join(("J ", "Smith")))
+        canonical.clear_caches()
+        self.assertIs(
+            canonical.canonical_string("".join(("J  ", "Smith"))), first
+        )
+
+    def test_05_none(self):
+        """None is returned unchanged."""
+        self.assertIs(canonical.canonical_string(None), None)
+
+
+class SplitNameAndCodes(unittest.TestCase):
+    """Test splitting codes from canonical names."""
+
+    def setUp(self):
+        """Start with empty caches."""
+        canonical.clear_caches()
+
+    def test_01_split(self):
+        """Codes are split from the normalised name as a tuple."""
+        self.assertEqual(
+            canonical.split_name_and_codes(
+                "J  Smith \uff11\uff12\uff13\uff14\uff15\uff16A"
+            ),
+            ("J Smith", ("123456A",)),
+        )
+
+    def test_02_no_codes(self):
+        """A name without codes gives an empty tuple of codes."""
+        self.assertEqual(
+            canonical.split_name_and_codes("A Brown"), ("A Brown", ())
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# test_codestore.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the store of codes found in earlier events."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from chesssubmit.core import constants
+from chesssubmit.core import codestore
+from chesssubmit.core.records import Person, Team
+
+
+class CodeStore(unittest.TestCase):
+    """Test codes recorded for persons and teams are found again."""
+
+    def setUp(self):
+        """Open code store in temporary folder."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.store = codestore.CodeStore(
+            os.path.join(self.folder.name, "codes.sqlite")
+        )
+
+    def tearDown(self):
+        """Close code store and remove temporary folder."""
+        self.store.close()
+        self.folder.cleanup()
+
+    def test_01_person_by_name_and_team(self):
+        """A code is found for the same name in the same team only."""
+        self.store.record_persons(
+            {
+                ("J Smith", "Division 1", "Alpha"): Person(
+                    "1", ecf_name="Smith, John", ecf_code=" 111111A "
+                ),
+                ("A Brown", "Division 1", "Beta"): Person("2"),
+            }
+        )
+        self.assertEqual(
+            self.store.get_person_code("J Smith", "Alpha"),
+            ("111111A", "Smith, John"),
+        )
+        self.assertEqual(self.store.get_person_code("J Smith", "Beta"), None)
+        self.assertEqual(self.store.get_person_code("A Brown", "Beta"), None)
+
+    def test_02_person_by_alias(self):
+        """A code is found by alias when the name is not known."""
+        self.store.record_persons(
+            {
+                ("Smith J", "Division 1", "Alpha"): Person(
+                    "1", alias="J Smith", ecf_code="111111A"
+                )
+            }
+        )
+        self.assertEqual(
+            self.store.get_person_code("J Smith", "Alpha"), ("111111A", "")
+        )
+
+    def test_03_codes_disagree(self):
+        """No code is given when entries for a name give different codes."""
+        self.store.record_persons(
+            {
+                ("J Smith", "Division 1", "Alpha"): Person(
+                    "1", ecf_code="111111A"
+                ),
+                ("J Smith", "Division 2", "Alpha"): Person(
+                    "2", alias="John Smith", ecf_code="222222B"
+                ),
+            }
+        )
+        self.assertEqual(self.store.get_person_code("J Smith", "Alpha"), None)
+
+    def test_04_person_code_replaced(self):
+        """A later code for the same name, team, and alias replaces it."""
+        key = ("J Smith", "Division 1", "Alpha")
+        self.store.record_persons({key: Person("1", ecf_code="111111A")})
+        self.store.record_persons({key: Person("1", ecf_code="222222B")})
+        self.assertEqual(
+            self.store.get_person_code("J Smith", "Alpha"), ("222222B", "")
+        )
+
+    def test_05_team(self):
+        """Club codes are found by team name, and blank ones ignored."""
+        self.store.record_teams(
+            {
+                ("Division 1", "Alpha"): Team("Alpha Club", "4ABC"),
+                ("Division 1", "Beta"): Team("Beta Club", ""),
+                ("Division 1", ""): Team("", "4XYZ"),
+            }
+        )
+        self.assertEqual(
+            self.store.get_team_code("Alpha"), ("Alpha Club", "4ABC")
+        )
+        self.assertEqual(self.store.get_team_code("Beta"), None)
+        self.assertEqual(self.store.get_team_code(""), None)
+
+
+class CodeStorePath(unittest.TestCase):
+    """Test choice of code store file."""
+
+    def test_01_environment_variable(self):
+        """The environment variable overrides the configuration value."""
+        with mock.patch.dict(
+            os.environ,
+            {codestore.CODE_STORE_ENVIRONMENT_VARIABLE: "false"},
+        ):
+            self.assertEqual(
+                codestore.code_store_path(constants.CODE_STORE_TRUE), None
+            )
+        with mock.patch.dict(
+            os.environ,
+            {codestore.CODE_STORE_ENVIRONMENT_VARIABLE: "/tmp/codes"},
+        ):
+            self.assertEqual(codestore.code_store_path(), "/tmp/codes")
+
+    def test_02_configuration_value(self):
+        """The default file is used if the configuration value is true."""
+        with mock.patch.dict(os.environ):
+            os.environ.pop(codestore.CODE_STORE_ENVIRONMENT_VARIABLE, None)
+            self.assertEqual(
+                os.path.basename(
+                    codestore.code_store_path(constants.CODE_STORE_TRUE)
+                ),
+                constants.CODE_STORE_FILE,
+            )
+            self.assertEqual(
+                codestore.code_store_path(constants.CODE_STORE_FALSE), None
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# test_configuration.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the configuration file shared by running instances."""
+
+import os
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from solentware_misc.core import configuration as base_configuration
+
+from chesssubmit.core import constants
+from chesssubmit.core import configuration
+
+
+def _reset_state():
+    """Forget configuration state left by earlier instances."""
+    timer = configuration._file_state["timer"]
+    if timer is not None:
+        timer.cancel()
+    for key in configuration._file_state:
+        configuration._file_state[key] = None
+    configuration._saved.clear()
+    configuration._pending.clear()
+    base_configuration._items.clear()
+
+
+class Configuration(unittest.TestCase):
+    """Read, reload, and write, the configuration file in a temporary home."""
+
+    def setUp(self):
+        """Make temporary home folder with a configuration file."""
+        _reset_state()
+        self.writes = 0
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(
+            self.folder.name, configuration.Configuration._CONFIGURATION
+        )
+        self._write_file(
+            "\n".join(
+                (
+                    " ".join((constants.RECENT_DOCUMENT, "~/one")),
+                    " ".join((constants.RECENT_EMAIL_SELECTION, "~/mail")),
+                )
+            )
+        )
+        self.patches = [
+            mock.patch.dict(os.environ, {"HOME": self.folder.name}),
+            mock.patch.object(configuration, "STAT_INTERVAL", 0),
+            mock.patch.object(configuration, "FLUSH_DELAY", 3600),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        """Remove temporary home folder and forget configuration state."""
+        for patch in self.patches:
+            patch.stop()
+        _reset_state()
+        self.folder.cleanup()
+
+    def _write_file(self, text):
+        """Write text to configuration file with a later modification time."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(text)
+        self.writes += 1
+        mtime = time.time() + self.writes
+        os.utime(self.path, (mtime, mtime))
+
+    def test_01_file_read_once(self):
+        """The first instance reads the configuration file once."""
+        base = base_configuration.Configuration
+        with mock.patch.object(
+            base,
+            "get_configuration_text_for_items_from_file",
+            autospec=True,
+            side_effect=base.get_configuration_text_for_items_from_file,
+        ) as read:
+            configuration.Configuration()
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(
+            configuration.Configuration.get_configuration_value(
+                constants.RECENT_DOCUMENT
+            ),
+            "~/one",
+        )
+
+    def test_02_reload_when_modified(self):
+        """Values changed by another process are seen."""
+        config = configuration.Configuration()
+        self._write_file(" ".join((constants.RECENT_DOCUMENT, "~/two")))
+        self.assertEqual(
+            config.get_configuration_value(constants.RECENT_DOCUMENT), "~/two"
+        )
+
+    def test_03_removed_item_dropped(self):
+        """An item removed from the file is not remembered as saved."""
+        config = configuration.Configuration()
+        self._write_file(" ".join((constants.RECENT_DOCUMENT, "~/one")))
+        self.assertEqual(
+            config.get_configuration_value(constants.RECENT_EMAIL_SELECTION),
+            "~",
+        )
+        self.assertNotIn(
+            constants.RECENT_EMAIL_SELECTION, configuration._saved
+        )
+
+    def test_04_pending_value_kept_on_reload(self):
+        """A value not yet written survives reading the file again."""
+        config = configuration.Configuration()
+        config.set_configuration_value(constants.RECENT_DOCUMENT, "~/mine")
+        self._write_file(" ".join((constants.RECENT_EMAIL_SELECTION, "~/x")))
+        self.assertEqual(
+            config.get_configuration_value(constants.RECENT_DOCUMENT), "~/mine"
+        )
+        configuration.flush_configuration()
+        with open(self.path, encoding="utf-8") as file:
+            text = file.read()
+        self.assertIn(" ".join((constants.RECENT_DOCUMENT, "~/mine")), text)
+        self.assertIn(
+            " ".join((constants.RECENT_EMAIL_SELECTION, "~/x")), text
+        )
+
+
+class LockedFile(unittest.TestCase):
+    """Take and release the lock file beside the configuration file."""
+
+    def setUp(self):
+        """Make temporary folder for the configuration and lock files."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "config")
+        self.lock_path = "".join((self.path, ".lock"))
+
+    def tearDown(self):
+        """Remove temporary folder."""
+        self.folder.cleanup()
+
+    def test_01_lock_released(self):
+        """The lock file exists only while the lock is held."""
+        with configuration._locked_file(self.path):
+            self.assertEqual(os.path.exists(self.lock_path), True)
+        self.assertEqual(os.path.exists(self.lock_path), False)
+
+    def test_02_lock_held_elsewhere(self):
+        """TimeoutError is raised while another process holds the lock."""
+        with open(self.lock_path, "w", encoding="utf-8"):
+            pass
+        with mock.patch.object(configuration, "LOCK_TIMEOUT", 0.1):
+            with self.assertRaises(TimeoutError):
+                with configuration._locked_file(self.path):
+                    pass
+        self.assertEqual(os.path.exists(self.lock_path), True)
+
+    def test_03_stale_lock_removed(self):
+        """A lock file older than STALE_LOCK_AGE is taken over."""
+        with open(self.lock_path, "w", encoding="utf-8"):
+            pass
+        mtime = time.time() - configuration.STALE_LOCK_AGE - 10
+        os.utime(self.lock_path, (mtime, mtime))
+        with configuration._locked_file(self.path):
+            pass
+        self.assertEqual(os.path.exists(self.lock_path), False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# test_contentcache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the cache of collated game rows."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core import contentcache
+
+
+class MakeCacheKey(unittest.TestCase):
+    """Test cache keys for rows collated from source documents."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        with open(
+            os.path.join(self.folder.name, "results.txt"),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write("A Smith 1-0 B Jones\n")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_01_key_changes_with_source_documents(self):
+        key = contentcache.make_cache_key(self.folder.name)
+        with open(
+            os.path.join(self.folder.name, "results.txt"),
+            "a",
+            encoding="utf-8",
+        ) as file:
+            file.write("C Brown 0-1 D White\n")
+        self.assertNotEqual(contentcache.make_cache_key(self.folder.name), key)
+
+    def test_02_rows_read_for_key_written(self):
+        rows = [("A Smith", "1-0", "B Jones")]
+        key = contentcache.make_cache_key(self.folder.name)
+        contentcache.write_cached_rows(self.folder.name, key, rows)
+        self.assertIsNone(
+            contentcache.read_cached_rows(self.folder.name, "other")
+        )
+        cached = contentcache.read_cached_rows(self.folder.name, key)
+        self.assertEqual([tuple(row) for row in cached], rows)
+
+    def test_03_generated_files_not_in_key(self):
+        key = contentcache.make_cache_key(self.folder.name)
+        with open(
+            os.path.join(self.folder.name, constants.SUBMISSION),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write("#EVENT DETAILS\n")
+        self.assertEqual(contentcache.make_cache_key(self.folder.name), key)
+
+
+if __name__ == "__main__":
+    unittest.main()
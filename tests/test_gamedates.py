@@ -0,0 +1,109 @@
+# test_gamedates.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for conversion of reported game dates to the ECF format."""
+
+import os
+import datetime
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core.gamedates import (
+    GameDateConverter,
+    make_game_date_converter,
+)
+
+
+class GameDateRange(unittest.TestCase):
+    """Test dates at, and just outside, the event's date range."""
+
+    def setUp(self):
+        """Make converter for an event from 1 Sep 2025 to 31 May 2026."""
+        self.converter = GameDateConverter(
+            datetime.date(2025, 9, 1), datetime.date(2026, 5, 31)
+        )
+
+    def test_01_first_and_last_dates(self):
+        """The event date and final result date are accepted."""
+        self.assertEqual(self.converter.convert("2025-09-01"), "01/09/2025")
+        self.assertEqual(self.converter.convert("2026-05-31"), "31/05/2026")
+        self.assertEqual(self.converter.report(), "")
+
+    def test_02_day_before_first_date(self):
+        """The day before the event date is reported."""
+        self.assertEqual(self.converter.convert("2025-08-31"), "31/08/2025")
+        self.assertEqual(
+            self.converter.report(),
+            "2025-08-31 is before event date 01/09/2025 (1 game)",
+        )
+
+    def test_03_day_after_last_date(self):
+        """The day after the final result date is reported for each game."""
+        self.converter.convert("2026-06-01")
+        self.converter.convert("2026-06-01")
+        self.assertEqual(
+            self.converter.report(),
+            "2026-06-01 is after final result date 31/05/2026 (2 games)",
+        )
+
+    def test_04_not_calendar_date(self):
+        """Dates which are not calendar dates are reported."""
+        self.assertEqual(self.converter.convert("2026-02-29"), "29/02/2026")
+        self.converter.convert("2026/02/01")
+        self.assertEqual(
+            self.converter.report().splitlines(),
+            [
+                "2026-02-29 is not a valid 'yyyy-mm-dd' date (1 game)",
+                "2026/02/01 is not a valid 'yyyy-mm-dd' date (1 game)",
+            ],
+        )
+
+    def test_05_no_date(self):
+        """A game without a date is given a blank date."""
+        self.assertEqual(self.converter.convert(None), "")
+        self.assertEqual(self.converter.report(), "")
+
+
+class EventDateRange(unittest.TestCase):
+    """Test the date range is read from the event details file."""
+
+    def setUp(self):
+        """Make temporary event folder."""
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove temporary event folder."""
+        self.folder.cleanup()
+
+    def test_01_range_from_event_details(self):
+        """The range is from EVENT DATE to FINAL RESULT DATE."""
+        with open(
+            os.path.join(self.folder.name, constants.EVENT_DETAILS),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(
+                "".join(
+                    (
+                        "#EVENT DETAILS",
+                        "\n#EVENT DATE=01/09/2025",
+                        "\n#FINAL RESULT DATE=31/05/2026",
+                    )
+                )
+            )
+        converter = make_game_date_converter(self.folder.name)
+        self.assertEqual(converter.first, datetime.date(2025, 9, 1))
+        self.assertEqual(converter.last, datetime.date(2026, 5, 31))
+
+    def test_02_no_event_details(self):
+        """The range is unbounded without an event details file."""
+        converter = make_game_date_converter(self.folder.name)
+        self.assertEqual((converter.first, converter.last), (None, None))
+        converter.convert("1900-01-01")
+        self.assertEqual(converter.report(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# test_integrity.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the check of values in a submission file."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core import integrity
+from chesssubmit.core.tokenizer import SubmissionFileError
+
+_EVENT_DETAILS = "#EVENT DATE=01/01/2026#FINAL RESULT DATE=31/03/2026\n"
+
+_SUBMISSION = "\n".join(
+    (
+        "#PLAYER LIST",
+        "#PIN=1#NAME=Smith, John#ECF CODE=111111A",
+        "#PIN=2#NAME=Brown, Alan",
+        "#MATCH RESULTS=Alpha - Beta",
+        "#PIN1=1#PIN2=2#SCORE=10#BOARD=1#COLOUR=W#GAME DATE=10/01/2026",
+        "#FINISH#",
+        "",
+    )
+)
+
+
+class CheckSubmissionFile(unittest.TestCase):
+    """Test check_submission_file with one error injected at a time."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        with open(
+            os.path.join(self.folder.name, constants.EVENT_DETAILS),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(_EVENT_DETAILS)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def check(self, old="", new=""):
+        """Return problems in _SUBMISSION with old replaced by new."""
+        text = _SUBMISSION.replace(old, new, 1) if old else _SUBMISSION
+        with open(
+            os.path.join(self.folder.name, constants.SUBMISSION),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(text)
+        return integrity.check_submission_file(self.folder.name)
+
+    def assert_one_problem(self, problems, message, line):
+        """Assert problems has one error with message at line."""
+        self.assertEqual(len(problems), 1)
+        self.assertNotIsInstance(
+            problems[0], integrity.SubmissionFileWarning
+        )
+        self.assertIsInstance(problems[0], SubmissionFileError)
+        self.assertEqual(problems[0].message, message)
+        self.assertEqual(problems[0].line, line)
+
+    def assert_one_warning(self, problems, message, line):
+        """Assert problems has one warning with message at line."""
+        self.assertEqual(len(problems), 1)
+        self.assertIsInstance(problems[0], integrity.SubmissionFileWarning)
+        self.assertEqual(problems[0].message, message)
+        self.assertEqual(problems[0].line, line)
+
+    def test_01_no_problems(self):
+        self.assertEqual(self.check(), [])
+
+    def test_02_repeated_pin(self):
+        self.assert_one_problem(
+            self.check("#PIN=2#", "#PIN=1#NAME=Brown, A\n#PIN=2#"),
+            "PIN '1' is repeated in Player List",
+            3,
+        )
+
+    def test_03_pin_not_in_player_list(self):
+        self.assert_one_problem(
+            self.check("PIN2=2", "PIN2=3"),
+            "Field 'PIN2' PIN '3' is not in Player List",
+            5,
+        )
+
+    def test_04_score(self):
+        problems = self.check("SCORE=10", "SCORE=12")
+        self.assertEqual(len(problems), 1)
+        self.assertTrue(problems[0].message.startswith("SCORE '12' is not"))
+        self.assertEqual(problems[0].line, 5)
+
+    def test_05_colour(self):
+        self.assert_one_problem(
+            self.check("COLOUR=W", "COLOUR=X"), "COLOUR 'X' is not W or B", 5
+        )
+
+    def test_06_board(self):
+        self.assert_one_problem(
+            self.check("BOARD=1", "BOARD=0"),
+            "Field 'BOARD' value '0' is not a positive integer",
+            5,
+        )
+
+    def test_07_date_after_event(self):
+        self.assert_one_problem(
+            self.check("10/01/2026", "10/05/2026"),
+            "Game date '10/05/2026' is after final result date",
+            5,
+        )
+
+    def test_08_repeated_game(self):
+        game = _SUBMISSION.splitlines()[4]
+        self.assert_one_problem(
+            self.check(game, "\n".join((game, game))),
+            "Game is repeated in section",
+            6,
+        )
+
+    def test_09_repeated_section_is_warning(self):
+        section = "\n".join(_SUBMISSION.splitlines()[3:5])
+        self.assert_one_warning(
+            self.check(
+                section,
+                "\n".join((section, section.replace("BOARD=1", "BOARD=2"))),
+            ),
+            "Section 'MATCH RESULTS=Alpha - Beta' is repeated",
+            6,
+        )
+
+    def test_10_long_value_is_warning(self):
+        problems = self.check("ECF CODE=111111A", "ECF CODE=111111AB")
+        self.assertEqual(len(problems), 1)
+        self.assertIsInstance(problems[0], integrity.SubmissionFileWarning)
+        self.assertEqual(problems[0].line, 2)
+        self.assertTrue(str(problems[0]).startswith("Warning: Field "))
+
+    def test_11_problems_in_file_order(self):
+        problems = self.check("COLOUR=W", "COLOUR=X#BOARD=0")
+        self.assertEqual(len(problems), 2)
+        self.assertEqual(
+            [problem.offset for problem in problems],
+            sorted(problem.offset for problem in problems),
+        )
+
+    def test_12_blank_game_date(self):
+        self.assertEqual(self.check("GAME DATE=10/01/2026", "GAME DATE="), [])
+
+    def test_13_game_repeated_on_other_date(self):
+        game = _SUBMISSION.splitlines()[4]
+        other = game.replace("#BOARD=1", "")
+        self.assertEqual(
+            self.check(
+                game,
+                "\n".join(
+                    (
+                        "#OTHER RESULTS=Friendlies",
+                        other,
+                        other.replace("10/01/2026", "17/01/2026"),
+                    )
+                ),
+            ),
+            [],
+        )
+
+    def test_14_game_repeated_on_same_date_without_board_is_warning(self):
+        game = _SUBMISSION.splitlines()[4].replace("#BOARD=1", "")
+        self.assert_one_warning(
+            self.check(
+                _SUBMISSION.splitlines()[4],
+                "\n".join(("#OTHER RESULTS=Friendlies", game, game)),
+            ),
+            "Game is repeated in section",
+            7,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# test_memorybudget.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the memory budget mode of timing stages."""
+
+import os
+import json
+import tempfile
+import unittest
+import tracemalloc
+from unittest import mock
+
+from chesssubmit import TIMING_LOG
+from chesssubmit.core import memorybudget
+from chesssubmit.core.timings import (
+    StageTimer,
+    NULL_TIMER,
+    TIMINGS_ENVIRONMENT_VARIABLE,
+)
+
+
+def _environment(budget=None, timings=None):
+    """Return patch of environment with budget and timings variables."""
+    patch = mock.patch.dict(os.environ)
+    patch.start()
+    for name, value in (
+        (memorybudget.MEMORY_BUDGET_ENVIRONMENT_VARIABLE, budget),
+        (TIMINGS_ENVIRONMENT_VARIABLE, timings),
+    ):
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    return patch
+
+
+class MemoryBudget(unittest.TestCase):
+    """Test the budget is taken from the environment or configuration."""
+
+    def tearDown(self):
+        """Restore the environment."""
+        mock.patch.stopall()
+
+    def test_01_configuration_value(self):
+        """The configuration value is a number of megabytes."""
+        _environment()
+        self.assertEqual(memorybudget.memory_budget("1.5"), 1572864)
+        self.assertEqual(memorybudget.memory_budget(""), None)
+        self.assertEqual(memorybudget.memory_budget(None), None)
+
+    def test_02_environment_variable(self):
+        """The environment variable takes precedence."""
+        _environment(budget="2")
+        self.assertEqual(memorybudget.memory_budget("1"), 2097152)
+
+    def test_03_not_positive_number(self):
+        """Values which are not positive numbers mean no budget."""
+        _environment()
+        for value in ("0", "-1", "lots"):
+            self.assertEqual(memorybudget.memory_budget(value), None)
+
+    def test_04_make_timer(self):
+        """A budget takes precedence over timings, and neither gives none."""
+        _environment(timings="1")
+        self.assertIsInstance(
+            memorybudget.make_timer("op", memory_budget_value="1"),
+            memorybudget.MemoryBudgetTimer,
+        )
+        timer = memorybudget.make_timer("op")
+        self.assertIs(type(timer), StageTimer)
+        mock.patch.stopall()
+        _environment(timings="0")
+        self.assertIs(memorybudget.make_timer("op"), NULL_TIMER)
+
+
+class MemoryBudgetTimer(unittest.TestCase):
+    """Test memory is recorded for each stage and the budget enforced."""
+
+    def setUp(self):
+        """Make temporary event folder."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.was_tracing = tracemalloc.is_tracing()
+
+    def tearDown(self):
+        """Stop tracing if started by a test and remove folder."""
+        if tracemalloc.is_tracing() and not self.was_tracing:
+            tracemalloc.stop()
+        self.folder.cleanup()
+
+    def test_01_stage_recorded(self):
+        """Each stage notes memory used, and tracing stops on write."""
+        timer = memorybudget.MemoryBudgetTimer("op", 1 << 40)
+        with timer.stage("allocate"):
+            data = [str(number) for number in range(10000)]
+        del data
+        self.assertEqual(
+            [stage["stage"] for stage in timer.memory], ["allocate"]
+        )
+        self.assertLessEqual(len(timer.memory[0]["top_call_sites"]), 10)
+        timer.write(self.folder.name)
+        self.assertEqual(tracemalloc.is_tracing(), self.was_tracing)
+        with open(
+            os.path.join(self.folder.name, TIMING_LOG), encoding="utf-8"
+        ) as file:
+            record = json.loads(file.readline())
+        self.assertEqual(record["memory_budget_bytes"], 1 << 40)
+        self.assertEqual(record["memory"][0]["stage"], "allocate")
+
+    def test_02_budget_exceeded(self):
+        """MemoryBudgetExceeded names the stage which exceeded the budget."""
+        timer = memorybudget.MemoryBudgetTimer("op", 1)
+        data = None
+        with self.assertRaises(memorybudget.MemoryBudgetExceeded) as context:
+            with timer.stage("allocate"):
+                data = [str(number) for number in range(1000)]
+        del data
+        self.assertIn("in stage 'allocate'", str(context.exception))
+
+    def test_03_check_outside_stage(self):
+        """check raises MemoryBudgetExceeded outside any stage."""
+        timer = memorybudget.MemoryBudgetTimer("op", 1)
+        data = [str(number) for number in range(1000)]
+        with self.assertRaises(memorybudget.MemoryBudgetExceeded) as context:
+            timer.check()
+        del data
+        self.assertIn("stage ''", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# test_namematch.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for proposing PersonAlias groupings of similar names."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import ratinglist
+from chesssubmit.core.records import Person
+from chesssubmit.core.submission import Submission
+
+_RATING_LIST = "\n".join(
+    (
+        "ECFCode,FullName,ClubName",
+        "111111A,\"Smith, John\",Alpha",
+        "222222B,\"Smithson, Jane\",Beta",
+        "333333C,\"Brown, Alan\",Alpha",
+    )
+)
+
+
+class RatingListSurname(unittest.TestCase):
+    """Test RatingList.get_players_for_surname method."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(self.folder.name, "list.csv")
+        with open(csv_path, "w", encoding="utf-8") as file:
+            file.write(_RATING_LIST)
+        self.index_path = os.path.join(self.folder.name, "index")
+        ratinglist.import_rating_list(csv_path, index_path=self.index_path)
+        self.rating_list = ratinglist.RatingList(self.index_path)
+
+    def tearDown(self):
+        self.rating_list.close()
+        self.folder.cleanup()
+
+    def test_01_surname_is_not_a_prefix(self):
+        entries = self.rating_list.get_players_for_surname("SMITH")
+        self.assertEqual([entry[1] for entry in entries], ["Smith, John"])
+        self.assertEqual(self.rating_list.get_players_for_surname("Smit"), [])
+
+    def test_02_proposals_use_rating_list_names(self):
+        submission = Submission(None, rating_list=self.rating_list)
+        alpha = ("J Smith", "Division 1", "Alpha")
+        beta = ("John Smith", "Division 1", "Alpha")
+        other = ("John Smyth", "Division 1", "Beta")
+        submission.persons = {
+            alpha: Person("1"),
+            beta: Person("2", alias="Johnny"),
+            other: Person("3"),
+        }
+        proposals = submission.propose_person_aliases()
+        self.assertEqual(len(proposals), 1)
+        self.assertEqual(proposals[0].keys, [alpha, beta])
+        self.assertEqual(proposals[0].ecf_name, "Smith, John")
+        self.assertEqual(submission.apply_alias_proposals(proposals), 2)
+        self.assertEqual(submission.persons[alpha].alias, proposals[0].alias)
+        self.assertEqual(submission.persons[beta].alias, "Johnny")
+        self.assertEqual(submission.persons[beta].ecf_name, "Smith, John")
+        self.assertEqual(submission.persons[other].alias, "")
+
+    def test_03_same_team_name_in_other_section(self):
+        """Teams with one name in different sections are not one team."""
+        submission = Submission(None, rating_list=self.rating_list)
+        first = ("J Smith", "Division 1", "Alpha")
+        second = ("John Smith", "Division 2", "Alpha")
+        submission.persons = {first: Person("1"), second: Person("2")}
+        self.assertEqual(submission.propose_person_aliases(), [])
+
+    def test_04_other_events_grouped_by_section(self):
+        """Spellings in a section without teams are grouped together."""
+        submission = Submission(None, rating_list=self.rating_list)
+        first = ("J Smith", "Open", "")
+        second = ("John Smith", "Open", "")
+        third = ("John Smith", "Minor", "")
+        submission.persons = {
+            first: Person("1"),
+            second: Person("2"),
+            third: Person("3"),
+        }
+        proposals = submission.propose_person_aliases()
+        self.assertEqual(len(proposals), 1)
+        self.assertEqual(proposals[0].keys, [first, second])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# test_pinmap.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the PIN map saved between regenerations of a submission."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core.pinmap import PinMap, pin_order
+from chesssubmit.core.records import Player
+
+_SMITH = ("J Smith", "Division 1", "Alpha")
+_BROWN = ("A Brown", "Division 1", 'Beta, the "B" team')
+_JONES = ("B Jones", "Division 1", "Beta")
+
+
+class PinMapFile(unittest.TestCase):
+    """Test PINs are kept when the map is written and read again."""
+
+    def setUp(self):
+        """Make temporary event folder."""
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove temporary event folder."""
+        self.folder.cleanup()
+
+    def test_01_round_trip(self):
+        """PINs, and keys needing CSV quoting, survive write and read."""
+        pin_map = PinMap(self.folder.name)
+        self.assertEqual(pin_map.get_pin(_SMITH), "1")
+        self.assertEqual(pin_map.get_pin(_BROWN), "2")
+        pin_map.write_pin_map()
+        pin_map = PinMap(self.folder.name)
+        self.assertEqual(pin_map.pins, {_SMITH: "1", _BROWN: "2"})
+        self.assertEqual(pin_map.get_pin(_BROWN), "2")
+        self.assertEqual(pin_map.get_pin(_JONES), "3")
+
+    def test_02_pins_not_reused(self):
+        """New players get PINs after the highest PIN read, not gaps."""
+        pin_map = PinMap(self.folder.name)
+        pin_map.update({_SMITH: Player("7", "", "J Smith")})
+        pin_map.write_pin_map()
+        self.assertEqual(PinMap(self.folder.name).get_pin(_JONES), "8")
+
+    def test_03_unchanged_map_not_written(self):
+        """The map file is not written when no PINs are allocated."""
+        pin_map = PinMap(self.folder.name)
+        pin_map.write_pin_map()
+        self.assertEqual(os.path.exists(pin_map.path), False)
+
+    def test_04_pin_order(self):
+        """Numeric PINs sort numerically before other PINs."""
+        self.assertEqual(
+            sorted(("10", "x", "9", "2"), key=pin_order),
+            ["2", "9", "10", "x"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
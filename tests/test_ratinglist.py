@@ -0,0 +1,116 @@
+# test_ratinglist.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for lookups in the memory mapped rating list index."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import ratinglist
+
+_CSV = "\n".join(
+    (
+        "ECF code,Full name,Club name,Member no",
+        '100000A,"Aaron, Adam",Alpha,M1',
+        '200000B,"Smith, John",Beta,',
+        '300000C,"Smith, John",Gamma,',
+        '400000D,"Smithson, Jane",Beta,',
+        '999999Z,"Zygmunt, Zoe",Omega,M9',
+        "",
+    )
+)
+
+
+class RatingList(unittest.TestCase):
+    """Test binary search finds names at and beside the key boundaries."""
+
+    def setUp(self):
+        """Import rating list CSV file into an index and open it."""
+        self.folder = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(self.folder.name, "rating.csv")
+        with open(csv_path, "w", encoding="utf-8") as file:
+            file.write(_CSV)
+        index_path = os.path.join(self.folder.name, "rating.index")
+        self.assertEqual(
+            ratinglist.import_rating_list(csv_path, index_path=index_path),
+            5,
+        )
+        self.rating_list = ratinglist.RatingList(index_path)
+
+    def tearDown(self):
+        """Close rating list and remove temporary folder."""
+        self.rating_list.close()
+        self.folder.cleanup()
+
+    def test_01_first_and_last_keys(self):
+        """The first code key and the last name key are found."""
+        self.assertEqual(
+            self.rating_list.get_player_for_code("100000A"),
+            ("100000A", "Aaron, Adam", "Alpha", "M1"),
+        )
+        self.assertEqual(
+            [
+                entry[0]
+                for entry in self.rating_list.get_players_for_name(
+                    "Zoe Zygmunt"
+                )
+            ],
+            ["999999Z"],
+        )
+
+    def test_02_before_first_and_after_last_keys(self):
+        """Keys sorting before the first, or after the last, are not found."""
+        self.assertEqual(self.rating_list.get_player_for_code("000000A"), None)
+        self.assertEqual(self.rating_list.get_players_for_name("Zz Zz"), [])
+        self.assertEqual(self.rating_list.get_players_for_name("A Aaro"), [])
+
+    def test_03_membership_number(self):
+        """A membership number is found when it is not an ECF code."""
+        self.assertEqual(
+            self.rating_list.get_player_for_code("M9")[0], "999999Z"
+        )
+
+    def test_04_repeated_name(self):
+        """All players with the same name key are found."""
+        self.assertEqual(
+            [
+                entry[0]
+                for entry in self.rating_list.get_players_for_name(
+                    "smith, JOHN"
+                )
+            ],
+            ["200000B", "300000C"],
+        )
+
+    def test_05_surname_not_prefix_of_longer_surname(self):
+        """A surname does not find surnames which start with it."""
+        self.assertEqual(
+            [
+                entry[0]
+                for entry in self.rating_list.get_players_for_surname("Smith")
+            ],
+            ["200000B", "300000C"],
+        )
+        self.assertEqual(
+            [
+                entry[0]
+                for entry in self.rating_list.get_players_for_surname(
+                    "Smithson"
+                )
+            ],
+            ["400000D"],
+        )
+
+    def test_06_not_an_index(self):
+        """A file which is not an index is rejected."""
+        path = os.path.join(self.folder.name, "other")
+        with open(path, "wb") as file:
+            file.write(b"not a rating list index\n")
+        with self.assertRaises(ratinglist.RatingListError):
+            ratinglist.RatingList(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
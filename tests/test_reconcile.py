@@ -0,0 +1,112 @@
+# test_reconcile.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for merging the manual work in a saved edition into a new one."""
+
+import unittest
+
+from chesssubmit.core import reconcile
+from chesssubmit.core.records import Player, Person, Team, Game
+from chesssubmit.core.submission import Submission
+
+_SMITH = ("J Smith", "Division 1", "Alpha")
+_BROWN = ("A Brown", "Division 1", "Beta")
+_JONES = ("B Jones", "Division 1", "Beta")
+_SECTION = "MATCH RESULTS=Alpha - Beta"
+
+
+def _make_edition(pins, scores):
+    """Return Submission with players given pins and games with scores.
+
+    The PINs differ between editions so games must be joined on the keys
+    of the players.
+
+    """
+    submission = Submission(None)
+    players = {
+        key: Player(pin, "", key[0]) for key, pin in zip(pins[0], pins[1])
+    }
+    submission.players = players
+    submission.persons = {
+        key: Person(player.pin) for key, player in players.items()
+    }
+    submission.teams = {
+        ("Division 1", "Alpha"): Team(),
+        ("Division 1", "Beta"): Team(),
+    }
+    submission.events = {
+        "League": {
+            "Division 1": {
+                _SECTION: [
+                    Game(
+                        players[_SMITH],
+                        score,
+                        players[opponent],
+                        "01/02/2026",
+                        "WHITE",
+                        board=board,
+                    )
+                    for opponent, board, score in scores
+                ]
+            }
+        }
+    }
+    return submission
+
+
+class MergeSavedEdition(unittest.TestCase):
+    """Test reconcile.merge_saved_edition."""
+
+    def test_01_manual_work_kept(self):
+        """PersonList and TeamList values given in saved are kept."""
+        saved = _make_edition(((_SMITH, _BROWN), ("1", "2")), ())
+        saved.persons[_SMITH].alias = "John Smith"
+        saved.persons[_BROWN].ecf_code = "222222B"
+        saved.prefilled_codes = {_BROWN: "222222B"}
+        saved.teams["Division 1", "Beta"].club_code = "4ABC"
+        new = _make_edition(((_BROWN, _SMITH), ("1", "2")), ())
+        reconcile.merge_saved_edition(new, saved)
+        self.assertEqual(new.persons[_SMITH].alias, "John Smith")
+        self.assertEqual(new.persons[_BROWN].ecf_code, "222222B")
+        self.assertEqual(new.is_code_prefilled(_BROWN), True)
+        self.assertEqual(new.teams["Division 1", "Beta"].club_code, "4ABC")
+
+    def test_02_games_compared(self):
+        """Games are joined on players' keys, not PINs."""
+        saved = _make_edition(
+            ((_SMITH, _BROWN, _JONES), ("1", "2", "3")),
+            ((_BROWN, "1", "10"), (_JONES, "2", "55")),
+        )
+        new = _make_edition(
+            ((_JONES, _SMITH, _BROWN), ("1", "2", "3")),
+            ((_BROWN, "1", "10"), (_JONES, "2", "01"), (_JONES, "3", "10")),
+        )
+        merge = reconcile.merge_saved_edition(new, saved)
+        self.assertEqual(merge.unchanged, 1)
+        self.assertEqual(
+            merge.changed, [(_SECTION, _SMITH, _JONES, "2", None)]
+        )
+        self.assertEqual(merge.added, [(_SECTION, _SMITH, _JONES, "3", None)])
+        self.assertEqual(merge.removed, [])
+        self.assertEqual(merge.repeated, [])
+
+    def test_03_games_by_key(self):
+        """Games with the same key are grouped."""
+        edition = _make_edition(
+            ((_SMITH, _BROWN), ("1", "2")),
+            ((_BROWN, None, "10"), (_BROWN, None, "01")),
+        )
+        self.assertEqual(
+            reconcile.get_games_by_key(edition),
+            {
+                (_SECTION, _SMITH, _BROWN, None, None): [
+                    ("10", "01/02/2026", "WHITE"),
+                    ("01", "01/02/2026", "WHITE"),
+                ]
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
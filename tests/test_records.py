@@ -0,0 +1,145 @@
+# test_records.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the Player, Person, Team, and Game, records of a Submission."""
+
+import unittest
+
+from ecfformat.core import constants as ecf_constants
+
+from chesssubmit.core import constants
+from chesssubmit.core.records import (
+    Player,
+    Person,
+    Team,
+    Game,
+    update_record,
+)
+
+
+def _fields(entry):
+    """Return list of fields in rendered entry without the leading newline."""
+    fields = entry.split(ecf_constants.FIELD_SEPARATOR)
+    assert fields[0] == "\n"
+    return fields[1:]
+
+
+class Records(unittest.TestCase):
+    """Render entries from records and edit records in place."""
+
+    def test_01_player_list_entry(self):
+        """The Player List entry has the PIN, codes, name, and club."""
+        player = Player("7", "111111A", "J Smith", club="Alpha")
+        self.assertEqual(
+            _fields(player.player_list_entry()),
+            [
+                "PIN=7",
+                "ECF CODE=111111A",
+                "NAME=J Smith",
+                "CLUB NAME=Alpha",
+                "CLUB CODE=",
+            ],
+        )
+
+    def test_02_person_list_entry(self):
+        """The PersonList entry repeats PersonCode for each sorted code."""
+        person = Person("3", codes={"b", "a"}, alias="Alan Brown")
+        fields = _fields(
+            person.person_list_entry(("A Brown", "Division 1", "Beta"))
+        )
+        self.assertEqual(
+            fields,
+            [
+                "=".join((constants.PERSON_NUMBER, "3")),
+                "=".join((constants.PERSON_NAME, "A Brown")),
+                "=".join((constants.PERSON_TEAM_SECTION, "Division 1")),
+                "=".join((constants.PERSON_TEAM_NAME, "Beta")),
+                "=".join((constants.PERSON_ALIAS, "Alan Brown")),
+                "=".join((constants.PERSON_ECF_NAME, "")),
+                "=".join((constants.PERSON_ECF_CODE, "")),
+                "=".join((constants.PERSON_CODE, "a")),
+                "=".join((constants.PERSON_CODE, "b")),
+            ],
+        )
+
+    def test_03_person_list_entry_without_codes(self):
+        """An empty PersonCode field is rendered for a person without codes."""
+        fields = _fields(Person("3").person_list_entry(("A", "S", "")))
+        self.assertEqual(fields[-1], "=".join((constants.PERSON_CODE, "")))
+
+    def test_04_team_list_entry(self):
+        """The TeamList entry has the section, team, and club fields."""
+        team = Team(club_name="Beta", club_code="4ABC")
+        self.assertEqual(
+            _fields(team.team_list_entry(("Division 1", "Beta"))),
+            [
+                "=".join((constants.TEAM_SECTION, "Division 1")),
+                "=".join((constants.TEAM_NAME, "Beta")),
+                "=".join((constants.TEAM_CLUB_NAME, "Beta")),
+                "=".join((constants.TEAM_CLUB_CODE, "4ABC")),
+            ],
+        )
+
+    def test_05_game_list_entry_uses_current_pins(self):
+        """The game entry renders the PINs the players have when written."""
+        white = Player("1", "", "J Smith")
+        black = Player("2", "", "A Brown")
+        game = Game(white, "10", black, "01/02/2026", "WHITE", board="3")
+        white.pin = "9"
+        self.assertEqual(
+            _fields(game.game_list_entry()),
+            [
+                "PIN1=9",
+                "SCORE=10",
+                "PIN2=2",
+                "BOARD=3",
+                "GAME DATE=01/02/2026",
+                "COLOUR=WHITE",
+            ],
+        )
+
+    def test_06_game_list_entry_prefers_round(self):
+        """ROUND, not BOARD, is rendered when both are given."""
+        game = Game(
+            Player("1", "", "A"),
+            "55",
+            Player("2", "", "B"),
+            "",
+            "",
+            round_="4",
+            board="3",
+        )
+        fields = _fields(game.game_list_entry())
+        self.assertIn("ROUND=4", fields)
+        self.assertNotIn("BOARD=3", fields)
+
+    def test_07_update_record(self):
+        """Edited values are stripped and put in the record."""
+        person = Person("3", alias="Alan Brown")
+        self.assertEqual(
+            update_record(
+                person, {"alias": "Alan Brown", "ecf_code": " 222222B "}
+            ),
+            True,
+        )
+        self.assertEqual(person.ecf_code, "222222B")
+        self.assertEqual(person.alias, "Alan Brown")
+
+    def test_08_update_record_unchanged(self):
+        """False is returned when no values change."""
+        team = Team(club_name="Beta")
+        self.assertEqual(
+            update_record(team, {"club_name": "Beta", "club_code": ""}),
+            False,
+        )
+
+    def test_09_update_record_ignores_other_attributes(self):
+        """Attributes not in edit_fields are not changed."""
+        player = Player("1", "", "J Smith")
+        self.assertEqual(update_record(player, {"pin": "9"}), False)
+        self.assertEqual(player.pin, "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
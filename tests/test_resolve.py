@@ -0,0 +1,148 @@
+# test_resolve.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for merging persons which are one real player."""
+
+import unittest
+
+from chesssubmit.core import resolve
+from chesssubmit.core.records import Player, Person, Game
+from chesssubmit.core.submission import Submission
+
+
+def _make_entries(*persons):
+    """Return players, persons, and events, for (key, pin, values) items.
+
+    values is a dict of Person attributes.  Each player plays one game
+    against a player not in persons.
+
+    """
+    players = {}
+    person_entries = {}
+    games = []
+    opponent = Player("999", "", "Opponent")
+    for key, pin, values in persons:
+        players[key] = Player(pin, "", key[0], club=key[2])
+        person_entries[key] = Person(pin, **values)
+        games.append(Game(players[key], "10", opponent, "01/01/2026", "W"))
+    events = {"": {"Division 1": {"MATCH RESULTS#A - B": games}}}
+    return players, person_entries, events
+
+
+def _game_pins(events):
+    """Return list of PINs of the first player of each game in events."""
+    return [
+        game.player1.pin
+        for event in events.values()
+        for sections in event.values()
+        for games in sections.values()
+        for game in games
+    ]
+
+
+class DisjointSet(unittest.TestCase):
+    """Test the DisjointSet class."""
+
+    def test_01_chain(self):
+        sets = resolve.DisjointSet(5)
+        sets.union(0, 1)
+        sets.union(3, 4)
+        sets.union(1, 4)
+        self.assertEqual(len({sets.find(item) for item in range(5)}), 2)
+        self.assertEqual(sets.find(0), sets.find(3))
+        self.assertNotEqual(sets.find(2), sets.find(0))
+
+
+class ResolvePlayers(unittest.TestCase):
+    """Test resolve_players function."""
+
+    def test_01_chain_of_links_is_one_player(self):
+        smith = ("J Smith", "Division 1", "Alpha")
+        smyth = ("John Smyth", "Division 1", "Alpha")
+        smithe = ("Jon Smithe", "Division 1", "Alpha")
+        smith2 = ("John Smith", "Division 2", "Beta")
+        players, persons, events = _make_entries(
+            (smith, "4", {"ecf_code": "123456A"}),
+            (smyth, "2", {"ecf_code": "123456A", "alias": "Jon Smithe"}),
+            (smithe, "7", {}),
+            (smith2, "3", {"ecf_code": "123456A"}),
+        )
+        removed = resolve.resolve_players(players, persons, events)
+        self.assertEqual(removed, 3)
+        self.assertEqual(list(players), [smyth])
+        self.assertEqual(
+            {person.pin for person in persons.values()}, {"2"}
+        )
+        self.assertEqual(_game_pins(events), ["2", "2", "2", "2"])
+
+    def test_02_same_alias_in_other_team_is_not_a_link(self):
+        first = ("A Brown", "Division 1", "Alpha")
+        second = ("A Brown", "Division 1", "Beta")
+        players, persons, events = _make_entries(
+            (first, "1", {"alias": "Alan Brown"}),
+            (second, "2", {"alias": "Alan Brown"}),
+        )
+        removed = resolve.resolve_players(players, persons, events)
+        self.assertEqual(removed, 0)
+        self.assertEqual(len(players), 2)
+        self.assertEqual(_game_pins(events), ["1", "2"])
+
+    def test_03_same_alias_in_same_team_is_a_link(self):
+        first = ("A Brown", "Division 1", "Alpha")
+        second = ("Alan Browne", "Division 1", "Alpha")
+        players, persons, events = _make_entries(
+            (first, "5", {"alias": "Alan Brown"}),
+            (second, "2", {"alias": "Alan Brown"}),
+        )
+        removed = resolve.resolve_players(players, persons, events)
+        self.assertEqual(removed, 1)
+        self.assertEqual(list(players), [second])
+        self.assertEqual(_game_pins(events), ["2", "2"])
+
+    def test_04_prefilled_code_is_not_a_link(self):
+        first = ("A Brown", "Division 1", "Alpha")
+        second = ("A Brown", "Division 2", "Beta")
+        players, persons, events = _make_entries(
+            (first, "1", {"ecf_code": "111111A"}),
+            (second, "2", {"ecf_code": "111111A"}),
+        )
+        removed = resolve.resolve_players(
+            players, persons, events, prefilled={second}
+        )
+        self.assertEqual(removed, 0)
+        self.assertEqual(_game_pins(events), ["1", "2"])
+
+    def test_05_no_links(self):
+        players, persons, events = _make_entries(
+            (("A", "S", ""), "1", {"ecf_name": "Same, Name"}),
+            (("B", "S", ""), "2", {"ecf_name": "Same, Name"}),
+        )
+        self.assertEqual(resolve.resolve_players(players, persons, events), 0)
+        self.assertEqual(len(players), 2)
+
+
+class SubmissionResolvePlayers(unittest.TestCase):
+    """Test Submission.resolve_players ignores filled in codes."""
+
+    def test_01_prefilled_codes(self):
+        first = ("A Brown", "Division 1", "Alpha")
+        second = ("A Brown", "Division 2", "Beta")
+        submission = Submission(None)
+        (
+            submission.players,
+            submission.persons,
+            submission.events,
+        ) = _make_entries(
+            (first, "1", {"ecf_code": "111111A"}),
+            (second, "2", {"ecf_code": "111111A"}),
+        )
+        submission.prefilled_codes = {first: "111111A", second: "111111A"}
+        self.assertEqual(submission.resolve_players(), 0)
+        submission.prefilled_codes = {}
+        self.assertEqual(submission.resolve_players(), 1)
+        self.assertEqual(list(submission.players), [first])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# test_sectionindex.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the index of sections of a memory mapped submission file."""
+
+import os
+import json
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core.sectionindex import SubmissionSections
+
+_SUBMISSION = "".join(
+    (
+        "#PLAYER LIST",
+        "\n#PIN=1#NAME=J Smith",
+        "\n#PIN=2#NAME=A Brown",
+        "\n#MATCH RESULTS=Division 1",
+        "\n#PIN1=1#SCORE=10#PIN2=2#BOARD=1",
+        "\n#FINISH",
+        "\n#TeamList",
+        "\n#TeamSection=Division 1#TeamName=Alpha",
+        "#TeamClubName=#TeamClubCode=",
+        "\n#PersonList",
+        "\n#PersonNumber=1#PersonName=J Smith",
+        "#PersonTeamSection=Division 1#PersonTeamName=Alpha",
+        "\n#PersonNumber=2#PersonName=A Brown",
+        "#PersonTeamSection=Division 1#PersonTeamName=Beta",
+        "\n#Final",
+    )
+)
+
+
+class SectionIndex(unittest.TestCase):
+    """Find sections, and TeamList and PersonList entries, by index."""
+
+    def setUp(self):
+        """Write submission file in a temporary folder."""
+        self.folder = tempfile.TemporaryDirectory()
+        with open(
+            os.path.join(self.folder.name, constants.SUBMISSION),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(_SUBMISSION)
+
+    def tearDown(self):
+        """Remove the temporary folder."""
+        self.folder.cleanup()
+
+    def test_01_titles(self):
+        """Entries of TeamList and PersonList are titled by their keys."""
+        sections = SubmissionSections(self.folder.name, encoding="utf-8")
+        try:
+            self.assertEqual(
+                sections.get_section_titles(),
+                [
+                    "PLAYER LIST",
+                    "MATCH RESULTS=Division 1",
+                    "FINISH",
+                    "TeamList",
+                    "    Division 1 / Alpha",
+                    "PersonList",
+                    "    J Smith / Division 1 / Alpha",
+                    "    A Brown / Division 1 / Beta",
+                    "Final",
+                ],
+            )
+        finally:
+            sections.close()
+
+    def test_02_entry_keys_and_text(self):
+        """The key and text of an entry are found from its index."""
+        sections = SubmissionSections(self.folder.name, encoding="utf-8")
+        try:
+            self.assertEqual(sections.get_section_key(3), None)
+            self.assertEqual(
+                sections.get_section_key(4), ("Division 1", "Alpha")
+            )
+            self.assertEqual(
+                sections.get_section_name(7), constants.PERSON_NUMBER
+            )
+            self.assertEqual(
+                sections.get_section_key(7), ("A Brown", "Division 1", "Beta")
+            )
+            self.assertEqual(
+                sections.get_section_text(7),
+                "".join(
+                    (
+                        "#PersonNumber=2#PersonName=A Brown",
+                        "#PersonTeamSection=Division 1#PersonTeamName=Beta\n",
+                    )
+                ),
+            )
+        finally:
+            sections.close()
+
+    def test_03_index_file_used(self):
+        """The saved index is used while the submission file is unchanged."""
+        SubmissionSections(self.folder.name, encoding="utf-8").close()
+        index_path = os.path.join(self.folder.name, constants.SUBMISSION_INDEX)
+        with open(index_path, encoding="utf-8") as file:
+            index = json.load(file)
+        index["sections"][0][0] = "marker"
+        with open(index_path, "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        sections = SubmissionSections(self.folder.name, encoding="utf-8")
+        try:
+            self.assertEqual(sections.get_section_name(0), "marker")
+        finally:
+            sections.close()
+
+    def test_04_empty_file(self):
+        """An empty submission file has no sections."""
+        with open(
+            os.path.join(self.folder.name, constants.SUBMISSION),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write("")
+        sections = SubmissionSections(self.folder.name, encoding="utf-8")
+        try:
+            self.assertEqual(len(sections), 0)
+        finally:
+            sections.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# test_snapshot.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for the snapshot of a Submission saved beside the submission file."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core import snapshot
+from chesssubmit.core.records import Player, Person, Team, Game
+from chesssubmit.core.submission import Submission
+
+
+def _make_submission(folder):
+    """Return Submission for folder with a small match event in it.
+
+    The entries are keyed as convert_document_to_submission_style keys
+    them.
+
+    """
+    submission = Submission(folder)
+    smith_key = ("J Smith", "Division 1", "Alpha")
+    brown_key = ("A Brown", "Division 1", "Beta")
+    jones_key = ("B Jones", "Division 1", "Beta")
+    smith = Player("1", "111111A", "J Smith", club="Alpha")
+    brown = Player("2", "", "A Brown", club="Beta")
+    jones = Player("3", "", "B Jones", club="Beta", club_code="4ABC")
+    submission.players = {smith_key: smith, brown_key: brown, jones_key: jones}
+    submission.persons = {
+        smith_key: Person("1", codes={"111111A"}, ecf_name="Smith, John"),
+        brown_key: Person("2", alias="Alan Brown"),
+        jones_key: Person("3", ecf_code="222222B"),
+    }
+    submission.teams = {
+        ("Division 1", "Alpha"): Team(club_name="Alpha"),
+        ("Division 1", "Beta"): Team(club_name="Beta", club_code="4ABC"),
+    }
+    submission.events = {
+        "League": {
+            "Division 1": {
+                "MATCH RESULTS=Alpha - Beta": [
+                    Game(smith, "10", brown, "10/01/2026", "W", board="1"),
+                    Game(jones, "55", smith, "17/01/2026", "B", board="2"),
+                ]
+            }
+        }
+    }
+    return submission
+
+
+def _get_state(submission):
+    """Return the values held by submission as plain tuples and dicts."""
+    return (
+        {
+            key: (
+                player.pin,
+                player.codes,
+                player.name,
+                player.club,
+                player.club_code,
+            )
+            for key, player in submission.players.items()
+        },
+        {
+            key: (
+                person.pin,
+                sorted(person.codes),
+                person.alias,
+                person.ecf_name,
+                person.ecf_code,
+            )
+            for key, person in submission.persons.items()
+        },
+        {
+            key: (team.club_name, team.club_code)
+            for key, team in submission.teams.items()
+        },
+        {
+            item: {
+                subevent: {
+                    section: [
+                        (
+                            game.player1.pin,
+                            game.score,
+                            game.player2.pin,
+                            game.date,
+                            game.colour,
+                            game.round_,
+                            game.board,
+                        )
+                        for game in games
+                    ]
+                    for section, games in sections.items()
+                }
+                for subevent, sections in event.items()
+            }
+            for item, event in submission.events.items()
+        },
+    )
+
+
+class SnapshotRoundTrip(unittest.TestCase):
+    """Test open_snapshot gives the same Submission as open_documents."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        _make_submission(self.folder.name).write_entries_to_submission_file()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _open_documents(self):
+        """Return Submission read from the submission file's text."""
+        submission = Submission(self.folder.name)
+        self.assertTrue(submission.open_documents(None))
+        return submission
+
+    def test_01_snapshot_equals_open_documents(self):
+        from_text = self._open_documents()
+        self.assertEqual(len(from_text.players), 3)
+        self.assertEqual(len(from_text.persons), 3)
+        from_snapshot = Submission(self.folder.name)
+        self.assertTrue(from_snapshot.open_snapshot())
+        self.assertEqual(_get_state(from_snapshot), _get_state(from_text))
+
+    def test_02_snapshot_of_parsed_file_equals_open_documents(self):
+        from_text = self._open_documents()
+        os.remove(snapshot.snapshot_path(self.folder.name))
+        from_text.save_snapshot()
+        from_snapshot = Submission(self.folder.name)
+        self.assertTrue(from_snapshot.open_snapshot())
+        self.assertEqual(
+            _get_state(from_snapshot), _get_state(self._open_documents())
+        )
+
+    def test_03_snapshot_of_other_file_not_used(self):
+        path = os.path.join(self.folder.name, constants.SUBMISSION)
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("\n")
+        self.assertFalse(Submission(self.folder.name).open_snapshot())
+
+    def test_04_truncated_snapshot_not_used(self):
+        path = snapshot.snapshot_path(self.folder.name)
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-3])
+        self.assertFalse(Submission(self.folder.name).open_snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# test_submission.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for reading a saved submission file into a Submission."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import constants
+from chesssubmit.core.submission import Submission
+from chesssubmit.core.gamedates import GameDateError
+from chesssubmit.core.tokenizer import SubmissionFileError
+
+_SUBMISSION = "".join(
+    (
+        "#PLAYER LIST",
+        "\n#PIN=1#ECF CODE=111111A#NAME=J Smith#CLUB NAME=Alpha#CLUB CODE=",
+        "\n#PIN=2#ECF CODE=#NAME=A Brown#CLUB NAME=Beta#CLUB CODE=4ABC",
+        "\n#MATCH RESULTS=Alpha - Beta",
+        "\n#PIN1=1#SCORE=10#PIN2=2#BOARD=1",
+        "#GAME DATE=01/02/2026#COLOUR=WHITE",
+        "\n#FINISH",
+        "\n#TeamList",
+        "\n#TeamSection=Division 1#TeamName=Alpha",
+        "#TeamClubName=Alpha#TeamClubCode=",
+        "\n#PersonList",
+        "\n#PersonNumber=1#PersonName=J Smith",
+        "#PersonTeamSection=Division 1#PersonTeamName=Alpha",
+        "#PersonAlias=John Smith#PersonECFName=#PersonECFCode=",
+        "#PersonCode=a#PersonCode=b",
+        "\n#PersonNumber=2#PersonName=A Brown",
+        "#PersonTeamSection=Division 1#PersonTeamName=Beta",
+        "#PersonAlias=#PersonECFName=#PersonECFCode=#PersonCode=",
+        "\n#Final",
+    )
+)
+
+_SMITH = ("J Smith", "Division 1", "Alpha")
+_BROWN = ("A Brown", "Division 1", "Beta")
+
+
+def _make_row(**values):
+    """Return game row tuple with values given by REPORT_* name."""
+    row = dict.fromkeys(constants.TABULAR_REPORT_ROW_ORDER, "")
+    row[constants.REPORT_ROUND] = None
+    row[constants.REPORT_BOARD] = None
+    row[constants.REPORT_DATE] = "2026-02-01"
+    row[constants.REPORT_EVENT] = "League"
+    row[constants.REPORT_SECTION] = "Division 1"
+    row.update(
+        (getattr(constants, "_".join(("REPORT", name.upper()))), value)
+        for name, value in values.items()
+    )
+    return tuple(row[name] for name in constants.TABULAR_REPORT_ROW_ORDER)
+
+
+class OpenDocuments(unittest.TestCase):
+    """Test Submission.open_documents fills the Submission from the file."""
+
+    def setUp(self):
+        """Make temporary event folder."""
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove temporary event folder."""
+        self.folder.cleanup()
+
+    def _write_submission(self, text):
+        """Write text to the submission file in the event folder."""
+        with open(
+            os.path.join(self.folder.name, constants.SUBMISSION),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            file.write(text)
+
+    def test_01_populate(self):
+        """Players, persons, teams, and games, are keyed from PersonList."""
+        self._write_submission(_SUBMISSION)
+        submission = Submission(self.folder.name)
+        self.assertEqual(submission.open_documents(None), True)
+        self.assertEqual(sorted(submission.players), [_BROWN, _SMITH])
+        self.assertEqual(submission.players[_SMITH].pin, "1")
+        self.assertEqual(submission.players[_SMITH].codes, "111111A")
+        self.assertEqual(submission.players[_BROWN].club_code, "4ABC")
+        self.assertEqual(sorted(submission.persons), [_BROWN, _SMITH])
+        self.assertEqual(submission.persons[_SMITH].alias, "John Smith")
+        self.assertEqual(submission.persons[_SMITH].codes, {"a", "b"})
+        self.assertEqual(submission.persons[_BROWN].codes, set())
+        self.assertEqual(list(submission.teams), [("Division 1", "Alpha")])
+        self.assertEqual(
+            submission.teams["Division 1", "Alpha"].club_name, "Alpha"
+        )
+        games = submission.events[""]["Division 1"][
+            "MATCH RESULTS=Alpha - Beta"
+        ]
+        self.assertEqual(len(games), 1)
+        self.assertIs(games[0].player1, submission.players[_SMITH])
+        self.assertIs(games[0].player2, submission.players[_BROWN])
+        self.assertEqual(games[0].score, "10")
+        self.assertEqual(games[0].board, "1")
+
+    def test_02_field_order_error(self):
+        """A field out of order is reported with its line."""
+        self._write_submission(
+            _SUBMISSION.replace("#SCORE=10#PIN2=2", "#PIN2=2#SCORE=10")
+        )
+        submission = Submission(self.folder.name)
+        with self.assertRaises(SubmissionFileError) as context:
+            submission.open_documents(None)
+        self.assertEqual(context.exception.line, 5)
+        self.assertIn("'PIN2' not expected", context.exception.message)
+
+    def test_03_missing_final(self):
+        """A file ending before the Final field is reported."""
+        self._write_submission(_SUBMISSION[: _SUBMISSION.index("\n#Final")])
+        submission = Submission(self.folder.name)
+        with self.assertRaises(SubmissionFileError) as context:
+            submission.open_documents(None)
+        self.assertIn(constants.FINAL, context.exception.message)
+
+
+class ConvertRows(unittest.TestCase):
+    """Test Submission.convert_rows_to_submission_style."""
+
+    def setUp(self):
+        """Make temporary event folder."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.submission = Submission(self.folder.name)
+
+    def tearDown(self):
+        """Remove temporary event folder."""
+        self.folder.cleanup()
+
+    def test_01_match_games(self):
+        """Match games share one section, players are keyed with teams."""
+        self.submission.convert_rows_to_submission_style(
+            [
+                _make_row(
+                    home_team=team1,
+                    away_team=team2,
+                    board=board,
+                    home_player=player1,
+                    away_player=player2,
+                    result="1-0",
+                    home_player_colour="WHITE",
+                )
+                for team1, team2, board, player1, player2 in (
+                    ("Alpha", "Beta", "2", "K Green", "L White"),
+                    ("Alpha", "Beta", "1", "J Smith", "A Brown"),
+                )
+            ]
+        )
+        submission = self.submission
+        games = submission.events["League"]["Division 1"][
+            "MATCH RESULTS=Alpha - Beta"
+        ]
+        self.assertEqual([game.board for game in games], ["1", "2"])
+        self.assertIs(games[0].player1, submission.players[_SMITH])
+        self.assertEqual(games[0].score, "10")
+        self.assertEqual(games[0].date, "01/02/2026")
+        self.assertEqual(games[0].colour, "WHITE")
+        self.assertEqual(
+            [submission.players[key].pin for key in (_SMITH, _BROWN)],
+            ["1", "2"],
+        )
+        self.assertEqual(
+            sorted(submission.persons), sorted(submission.players)
+        )
+        self.assertEqual(
+            sorted(submission.teams),
+            [("Division 1", "Alpha"), ("Division 1", "Beta")],
+        )
+
+    def test_02_section_and_other_games(self):
+        """Games with a round, or neither round nor teams, get sections."""
+        self.submission.convert_rows_to_submission_style(
+            [
+                _make_row(
+                    round="3",
+                    home_player="J Smith",
+                    away_player="A Brown",
+                    result="draw",
+                ),
+                _make_row(
+                    section="Friendly",
+                    home_player="J Smith",
+                    away_player="A Brown",
+                    result="0-1",
+                ),
+            ]
+        )
+        event = self.submission.events["League"]
+        (game,) = event["Division 1"]["SECTION RESULTS=Division 1"]
+        self.assertEqual((game.round_, game.score), ("3", "55"))
+        (game,) = event["Friendly"]["OTHER RESULTS=Friendly"]
+        self.assertEqual(game.score, "01")
+        self.assertIn(("J Smith", "Friendly", ""), self.submission.players)
+
+    def test_03_blank_player_ignored(self):
+        """A row with a blank player name gives no game."""
+        self.submission.convert_rows_to_submission_style(
+            [_make_row(round="1", home_player="J Smith", result="1-0")]
+        )
+        self.assertEqual(self.submission.events["League"]["Division 1"], {})
+
+    def test_04_bad_dates_reported(self):
+        """GameDateError lists bad dates after all rows are converted."""
+        with self.assertRaises(GameDateError) as context:
+            self.submission.convert_rows_to_submission_style(
+                [
+                    _make_row(
+                        round="1",
+                        home_player="J Smith",
+                        away_player="A Brown",
+                        result="1-0",
+                        date="2026-02-30",
+                    )
+                ]
+            )
+        self.assertIn("2026-02-30", str(context.exception))
+        self.assertEqual(len(self.submission.players), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
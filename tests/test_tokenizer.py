@@ -0,0 +1,89 @@
+# test_tokenizer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for reading the fields of a submission file in chunks."""
+
+import os
+import tempfile
+import unittest
+
+from chesssubmit.core import tokenizer
+
+_TEXT = "\n".join(
+    (
+        "#PLAYER LIST",
+        "#PIN=1#NAME=Smith, John",
+        "#PIN=2#NAME=Brönté, Ann",
+        "#FINISH#",
+        "",
+    )
+)
+
+
+class Tokenizer(unittest.TestCase):
+    """Test tokenize_file and line_numbers_at functions."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "submission")
+        with open(self.path, "wb") as file:
+            file.write(_TEXT.encode("utf-8"))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _tokens(self, chunk_size=tokenizer.CHUNK_SIZE):
+        """Return list of tokens in file read in chunk_size pieces."""
+        return list(
+            tokenizer.tokenize_file(
+                self.path, chunk_size=chunk_size, encoding="utf-8"
+            )
+        )
+
+    def test_01_fields(self):
+        self.assertEqual(
+            [token[:2] for token in self._tokens()],
+            [
+                ("PLAYER LIST", ""),
+                ("PIN", "1"),
+                ("NAME", "Smith, John"),
+                ("PIN", "2"),
+                ("NAME", "Brönté, Ann"),
+                ("FINISH", ""),
+            ],
+        )
+
+    def test_02_offsets_are_byte_offsets_of_fields(self):
+        data = _TEXT.encode("utf-8")
+        for name, value, offset in self._tokens():
+            del value
+            self.assertTrue(data.startswith(name.encode("utf-8"), offset))
+        self.assertEqual(
+            self._tokens()[-1][2], data.index("FINISH".encode("utf-8"))
+        )
+
+    def test_03_chunk_size_does_not_change_tokens(self):
+        expected = self._tokens()
+        for chunk_size in (1, 2, 3, 7, 64):
+            self.assertEqual(self._tokens(chunk_size=chunk_size), expected)
+
+    def test_04_line_numbers(self):
+        offsets = [token[2] for token in self._tokens()]
+        for chunk_size in (1, 5, tokenizer.CHUNK_SIZE):
+            lines = tokenizer.line_numbers_at(
+                self.path, offsets, chunk_size=chunk_size
+            )
+            self.assertEqual(
+                [lines[offset] for offset in offsets], [1, 2, 2, 3, 3, 4]
+            )
+
+    def test_05_line_number_after_end_of_file(self):
+        self.assertEqual(
+            tokenizer.line_number_at(self.path, len(_TEXT.encode("utf-8"))),
+            5,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
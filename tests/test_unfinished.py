@@ -0,0 +1,68 @@
+# test_unfinished.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Tests for collating unfinished games with their later results."""
+
+import unittest
+
+from chesssubmit.core.unfinished import collate_unfinished_games
+
+
+def _row(board, result, date, home="J Smith", away="A Brown"):
+    """Return game row in TABULAR_REPORT_ROW_ORDER order."""
+    return (
+        "League",
+        "Division 1",
+        "Alpha",
+        "Beta",
+        "",
+        board,
+        home,
+        away,
+        date,
+        "",
+        result,
+        "",
+        "",
+        "",
+    )
+
+
+class CollateUnfinishedGames(unittest.TestCase):
+    """Drop reports of unfinished games which were finished later."""
+
+    def test_01_finished_later(self):
+        """The unfinished report is dropped when the result is reported."""
+        unfinished = _row("1", None, "01/02/2026")
+        finished = _row("1", "1-0", "08/02/2026")
+        self.assertEqual(
+            collate_unfinished_games([unfinished, finished]), [finished]
+        )
+
+    def test_02_not_finished(self):
+        """An unfinished game with no later result is kept."""
+        unfinished = _row("1", None, "01/02/2026")
+        other = _row("2", "draw", "01/02/2026", home="C Jones")
+        self.assertEqual(
+            collate_unfinished_games([unfinished, other]),
+            [unfinished, other],
+        )
+
+    def test_03_other_players(self):
+        """The result of a game between other players is not a later report."""
+        unfinished = _row("1", None, "01/02/2026")
+        finished = _row("1", "0-1", "08/02/2026", away="B White")
+        self.assertEqual(
+            collate_unfinished_games([unfinished, finished]),
+            [unfinished, finished],
+        )
+
+    def test_04_finished_games_kept(self):
+        """Rows with results are never dropped."""
+        rows = [_row("1", "1-0", "01/02/2026"), _row("1", "0-1", "01/02/2026")]
+        self.assertEqual(collate_unfinished_games(rows), rows)
+
+
+if __name__ == "__main__":
+    unittest.main()